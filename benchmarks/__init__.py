@@ -0,0 +1,3 @@
+"""
+Performance benchmarks for LLM Status Monitor
+"""
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Backfill throughput against the local stand-in server.
+
+Usage:
+    python -m benchmarks.backfill_test --feeds 1000 --entries 200
+
+Starts the stand-in in a separate process, backfills every feed into a
+fresh history database and reports wall time and entries per second.
+"""
+
+import argparse
+import logging
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from llm_monitor.backfill import Backfill
+from llm_monitor.config import FeedConfig
+from llm_monitor.history import HistoryStore
+from llm_monitor.parse_pool import ParsePool
+from benchmarks.load_test import start_standin
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Backfill throughput against a stand-in server")
+    parser.add_argument('--feeds', type=int, default=1000)
+    parser.add_argument('--entries', type=int, default=200)
+    parser.add_argument('--latency', type=float, default=0.005)
+    parser.add_argument('--workers', type=int, default=32)
+    parser.add_argument('--parse-workers', type=int, default=0,
+                        help="Parse in this many worker processes")
+    parser.add_argument('--log-level', default='ERROR')
+    args = parser.parse_args()
+    # Options start_standin() passes through to the stand-in
+    args.jitter, args.error_rate, args.churn, args.tick, args.no_etag = 0.0, 0.0, 0.0, 0.0, False
+
+    logging.basicConfig(level=getattr(logging, args.log_level.upper()))
+    process, port = start_standin(args)
+    parse_pool = ParsePool(args.parse_workers) if args.parse_workers > 0 else None
+    store = HistoryStore(Path(tempfile.mkdtemp()) / "history.db")
+    try:
+        feeds = {
+            f"feed{i}": FeedConfig(
+                name=f"Feed {i}",
+                url=f"http://127.0.0.1:{port}/feeds/{i}/history.rss",
+                color=0x5865F2
+            )
+            for i in range(args.feeds)
+        }
+        report = Backfill(store, workers=args.workers, parse_pool=parse_pool).run(feeds)
+    finally:
+        store.close()
+        if parse_pool is not None:
+            parse_pool.shutdown()
+        process.terminate()
+        process.wait()
+
+    print(f"feeds:    {report.feeds} ({len(report.failed)} failed)")
+    print(f"entries:  {report.entries} ({report.stored} stored)")
+    print(f"elapsed:  {report.elapsed:.2f}s ({report.entries / report.elapsed:,.0f} entries/s)")
+    return 1 if report.failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
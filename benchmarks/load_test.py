@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+End-to-end load test: run StatusMonitor against the local stand-in server.
+
+Usage:
+    python -m benchmarks.load_test --feeds 1000 --cycles 5 --churn 0.05
+
+The stand-in server runs in a separate process so the reported CPU and
+RSS figures belong to the monitor alone. Reports cycle time, CPU time,
+peak RSS and detection-to-notification latency, optionally as JSON.
+"""
+
+import argparse
+import json
+import logging
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from llm_monitor.config import Config, FeedConfig
+from llm_monitor.monitor import StatusMonitor
+
+
+def current_rss_bytes() -> int:
+    """Resident set size of this process"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except OSError:
+        # ru_maxrss is KiB on Linux and bytes on macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def start_standin(args: argparse.Namespace) -> Tuple[subprocess.Popen, int]:
+    command = [
+        sys.executable, '-m', 'benchmarks.standin',
+        '--feeds', str(args.feeds),
+        '--entries', str(args.entries),
+        '--latency', str(args.latency),
+        '--jitter', str(args.jitter),
+        '--error-rate', str(args.error_rate),
+        '--churn', str(args.churn),
+        '--tick', str(args.tick),
+    ]
+    if args.no_etag:
+        command.append('--no-etag')
+    process = subprocess.Popen(
+        command,
+        cwd=Path(__file__).resolve().parent.parent,
+        stdout=subprocess.PIPE,
+        text=True
+    )
+    port = int(process.stdout.readline())
+    return process, port
+
+
+def run_load_test(args: argparse.Namespace) -> Dict[str, Any]:
+    process, port = start_standin(args)
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        feeds = {
+            f"feed{i}": FeedConfig(
+                name=f"Feed {i}",
+                url=f"{base_url}/feeds/{i}/history.rss",
+                color=0x5865F2
+            )
+            for i in range(args.feeds)
+        }
+        config = Config(
+            notification_type='discord',
+            discord_webhook=f"{base_url}/webhook",
+            slack_webhook=None,
+            check_interval=args.interval,
+            state_file=Path(tempfile.mkdtemp()) / "state.json",
+            async_concurrency=args.concurrency
+        )
+        if args.async_mode:
+            from llm_monitor.async_monitor import AsyncStatusMonitor
+            monitor = AsyncStatusMonitor(config, feeds=feeds)
+        else:
+            monitor = StatusMonitor(config, feeds=feeds)
+
+        cycles = []
+        rss_start = current_rss_bytes()
+        for cycle in range(args.cycles):
+            wall_start = time.perf_counter()
+            cpu_start = time.process_time()
+            monitor.run_check_cycle()
+            wall = time.perf_counter() - wall_start
+            cpu = time.process_time() - cpu_start
+            cycles.append({'cycle': cycle, 'wall_s': wall, 'cpu_s': cpu,
+                           'rss_bytes': current_rss_bytes()})
+            print(
+                f"cycle {cycle}: wall={wall:.3f}s cpu={cpu:.3f}s "
+                f"rss={cycles[-1]['rss_bytes'] / 2**20:.1f} MiB",
+                file=sys.stderr
+            )
+            if args.interval and cycle < args.cycles - 1:
+                time.sleep(args.interval)
+
+        with urllib.request.urlopen(f"{base_url}/stats", timeout=10) as response:
+            server_stats = json.load(response)
+        monitor.close()
+    finally:
+        process.terminate()
+        process.wait()
+
+    latencies = server_stats.pop('latencies')
+    walls = [c['wall_s'] for c in cycles]
+    return {
+        'params': vars(args),
+        'cycles': cycles,
+        'summary': {
+            'cycle_wall_s': {
+                'first': walls[0],
+                'median': statistics.median(walls),
+                'max': max(walls),
+            },
+            'cpu_s_total': sum(c['cpu_s'] for c in cycles),
+            'rss_start_bytes': rss_start,
+            'rss_peak_bytes': max(c['rss_bytes'] for c in cycles),
+            'detection_latency_s': {
+                'count': len(latencies),
+                'p50': percentile(latencies, 50),
+                'p95': percentile(latencies, 95),
+                'p99': percentile(latencies, 99),
+                'max': max(latencies, default=0.0),
+            },
+            'server': server_stats,
+        },
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="End-to-end load test against a stand-in server")
+    parser.add_argument('--feeds', type=int, default=1000)
+    parser.add_argument('--cycles', type=int, default=5)
+    parser.add_argument('--interval', type=int, default=0,
+                        help="Seconds to wait between cycles")
+    parser.add_argument('--entries', type=int, default=20)
+    parser.add_argument('--latency', type=float, default=0.005)
+    parser.add_argument('--jitter', type=float, default=0.0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--no-etag', action='store_true')
+    parser.add_argument('--churn', type=float, default=0.01)
+    parser.add_argument('--tick', type=float, default=1.0)
+    parser.add_argument('--log-level', default='ERROR')
+    parser.add_argument('--async', dest='async_mode', action='store_true',
+                        help="Use AsyncStatusMonitor instead of StatusMonitor")
+    parser.add_argument('--concurrency', type=int, default=100,
+                        help="Requests in flight with --async")
+    parser.add_argument('--json', type=Path, help="Write the full report to this file")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=getattr(logging, args.log_level.upper()))
+    report = run_load_test(args)
+
+    summary = report['summary']
+    latency = summary['detection_latency_s']
+    print(f"feeds:               {args.feeds}")
+    print(f"cycle wall (median): {summary['cycle_wall_s']['median']:.3f}s "
+          f"(first {summary['cycle_wall_s']['first']:.3f}s, max {summary['cycle_wall_s']['max']:.3f}s)")
+    print(f"cpu total:           {summary['cpu_s_total']:.3f}s")
+    print(f"rss peak:            {summary['rss_peak_bytes'] / 2**20:.1f} MiB")
+    print(f"deliveries:          {summary['server']['deliveries']}")
+    print(f"detection latency:   p50={latency['p50']:.3f}s p95={latency['p95']:.3f}s "
+          f"p99={latency['p99']:.3f}s (n={latency['count']})")
+
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2, default=str))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the hot paths of LLM Status Monitor.
+
+Usage:
+    python -m benchmarks.run_benchmarks
+    python -m benchmarks.run_benchmarks --sizes 10 100 1000 --repeat 3
+    python -m benchmarks.run_benchmarks --compare benchmarks/results/abc1234.json
+
+Results are written as JSON (one file per commit by default) so runs
+from different commits can be compared with --compare.
+"""
+
+import argparse
+import atexit
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from llm_monitor.feed_parser import FeedParser, parse_entries
+from llm_monitor.filters import IncidentFilter
+from llm_monitor.notifiers import DiscordNotifier, SlackNotifier
+from llm_monitor.parse_pool import ParsePool
+from llm_monitor.state import StateManager
+from llm_monitor.stream_parser import extract_entries, iter_entries
+from benchmarks.synthetic import generate_feed
+
+DEFAULT_SIZES = [10, 100, 1000, 10000, 50000]
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+# A benchmark takes the feed size and returns (operation, ops per call)
+Benchmark = Callable[[int], Tuple[Callable[[], Any], int]]
+BENCHMARKS: Dict[str, Benchmark] = {}
+
+
+def benchmark(name: str):
+    """Register a benchmark setup function"""
+    def decorator(func: Benchmark) -> Benchmark:
+        BENCHMARKS[name] = func
+        return func
+    return decorator
+
+
+@lru_cache(maxsize=None)
+def _document(size: int) -> bytes:
+    return generate_feed(size)
+
+
+@lru_cache(maxsize=None)
+def _entries(size: int) -> List[Any]:
+    return FeedParser.parse_content(_document(size)).entries
+
+
+@benchmark("FeedParser.parse_feed")
+def bench_parse_feed(size: int):
+    document = _document(size)
+    return (lambda: FeedParser.parse_feed(document)), 1
+
+
+@benchmark("FeedParser.parse_content")
+def bench_parse_content(size: int):
+    document = _document(size)
+    return (lambda: FeedParser.parse_content(document)), 1
+
+
+@benchmark("FeedParser.extract_latest_entry")
+def bench_extract_latest_entry(size: int):
+    feed = FeedParser.parse_content(_document(size))
+    return (lambda: FeedParser.extract_latest_entry(feed)), 1
+
+
+@benchmark("stream_parser.extract_entries (latest)")
+def bench_stream_latest(size: int):
+    document = _document(size)
+    return (lambda: extract_entries(document, 1)), 1
+
+
+@benchmark("stream_parser.iter_entries (all)")
+def bench_stream_all(size: int):
+    document = _document(size)
+    return (lambda: sum(1 for _ in iter_entries(document))), 1
+
+
+@benchmark("FeedParser._clean_html")
+def bench_clean_html(size: int):
+    descriptions = [e.get('summary', '') for e in _entries(size)]
+
+    def run():
+        for description in descriptions:
+            FeedParser._clean_html(description)
+    return run, len(descriptions)
+
+
+@benchmark("IncidentFilter.is_active_incident")
+def bench_is_active_incident(size: int):
+    pairs = [
+        (e.get('title', ''), FeedParser._clean_html(e.get('summary', '')))
+        for e in _entries(size)
+    ]
+
+    def run():
+        for title, description in pairs:
+            IncidentFilter.is_active_incident(title, description)
+    return run, len(pairs)
+
+
+# Documents parsed per call by the throughput benchmarks
+PARSE_BATCH = 16
+
+
+@lru_cache(maxsize=None)
+def _parse_pool() -> ParsePool:
+    pool = ParsePool(os.cpu_count() or 1)
+    atexit.register(pool.shutdown)
+    return pool
+
+
+@benchmark("parse_entries (in-process batch)")
+def bench_parse_batch_local(size: int):
+    document = _document(size)
+
+    def run():
+        for _ in range(PARSE_BATCH):
+            parse_entries(document)
+    return run, PARSE_BATCH
+
+
+@benchmark("ParsePool (process batch)")
+def bench_parse_batch_pool(size: int):
+    document = _document(size)
+    pool = _parse_pool()
+
+    def run():
+        for future in [pool.submit(document) for _ in range(PARSE_BATCH)]:
+            future.result()
+    return run, PARSE_BATCH
+
+
+def _state_manager(size: int, directory: Path) -> StateManager:
+    manager = StateManager(directory / f"state-{size}.json")
+    for i in range(size):
+        manager.update_service(
+            f"service{i}",
+            f"https://status.example.com/incidents/inc{i:06d}",
+            "Elevated errors on API"
+        )
+    return manager
+
+
+@benchmark("StateManager.save")
+def bench_state_save(size: int):
+    manager = _state_manager(size, Path(tempfile.mkdtemp()))
+    return manager.save, 1
+
+
+@benchmark("StateManager.load")
+def bench_state_load(size: int):
+    manager = _state_manager(size, Path(tempfile.mkdtemp()))
+    manager.save()
+    return manager.load, 1
+
+
+@benchmark("DiscordNotifier.build_payload")
+def bench_discord_payload(size: int):
+    entries = _entries(min(size, 1000))
+    notifier = DiscordNotifier("https://discord.invalid/webhook")
+    args = [
+        ("Example", e.get('title', ''), e.get('summary', ''), e.get('link', ''), 0xD97757)
+        for e in entries
+    ]
+
+    def run():
+        for item in args:
+            notifier.build_payload(*item)
+    return run, len(args)
+
+
+@benchmark("SlackNotifier.build_payload")
+def bench_slack_payload(size: int):
+    entries = _entries(min(size, 1000))
+    notifier = SlackNotifier("https://hooks.slack.invalid/webhook")
+    args = [
+        ("Example", e.get('title', ''), e.get('summary', ''), e.get('link', ''), 0xD97757)
+        for e in entries
+    ]
+
+    def run():
+        for item in args:
+            notifier.build_payload(*item)
+    return run, len(args)
+
+
+def time_operation(operation: Callable[[], Any], repeat: int, min_time: float) -> List[float]:
+    """
+    Time an operation, looping each sample until it takes at least
+    min_time seconds. Returns seconds per call for each sample.
+    """
+    # Warm-up call also sizes the loop
+    started = time.perf_counter()
+    operation()
+    elapsed = time.perf_counter() - started
+    loops = max(1, int(min_time / elapsed)) if elapsed > 0 else 1000
+
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(loops):
+            operation()
+        samples.append((time.perf_counter() - started) / loops)
+    return samples
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=Path(__file__).resolve().parent,
+            stderr=subprocess.DEVNULL,
+            text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(
+    sizes: List[int],
+    repeat: int,
+    min_time: float,
+    selected: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """Run the selected benchmarks over all sizes"""
+    results = []
+    for name, setup in BENCHMARKS.items():
+        if selected and not any(s.lower() in name.lower() for s in selected):
+            continue
+        for size in sizes:
+            operation, ops = setup(size)
+            samples = time_operation(operation, repeat, min_time)
+            result = {
+                "benchmark": name,
+                "size": size,
+                "ops_per_call": ops,
+                "repeat": repeat,
+                "min_s": min(samples),
+                "median_s": statistics.median(samples),
+                "mean_s": statistics.fmean(samples),
+                "per_op_us": min(samples) / ops * 1e6,
+            }
+            results.append(result)
+            print(
+                f"{name:<36} size={size:<6} "
+                f"min={result['min_s'] * 1e3:10.3f} ms  "
+                f"per-op={result['per_op_us']:10.2f} us"
+            )
+
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.now().isoformat(),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+        },
+        "results": results,
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> int:
+    """Print relative change against a baseline. Returns the number of regressions."""
+    base = {(r["benchmark"], r["size"]): r for r in baseline["results"]}
+    regressions = 0
+    print(f"\nComparison against {baseline['meta'].get('commit') or 'baseline'}:")
+    for result in current["results"]:
+        previous = base.get((result["benchmark"], result["size"]))
+        if not previous:
+            continue
+        change = result["min_s"] / previous["min_s"] - 1
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        print(f"{result['benchmark']:<36} size={result['size']:<6} {change:+8.1%}{flag}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help="Number of feed entries to benchmark with")
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="Samples per benchmark and size")
+    parser.add_argument('--min-time', type=float, default=0.2,
+                        help="Minimum seconds per sample")
+    parser.add_argument('--only', nargs='+',
+                        help="Run only benchmarks whose name contains one of these")
+    parser.add_argument('--output', type=Path,
+                        help="Results file (default: benchmarks/results/<commit>.json)")
+    parser.add_argument('--compare', type=Path,
+                        help="Baseline results file to compare against")
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help="Relative slowdown reported as a regression")
+    args = parser.parse_args()
+
+    results = run_suite(args.sizes, args.repeat, args.min_time, args.only)
+
+    output = args.output or RESULTS_DIR / f"{results['meta']['commit'] or 'latest'}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2))
+    print(f"\nResults written to {output}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        if compare(results, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
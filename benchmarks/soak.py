@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Memory soak test: run many check cycles in-process and watch RSS.
+
+Usage:
+    python -m benchmarks.soak --feeds 1000 --cycles 100000
+
+Fetches are served from a small set of pre-rendered documents, so the
+run measures the monitor alone (parse, classify, state, notify) without
+network or server noise. Each feed publishes a new entry every
+--period cycles and answers 304 in between, like a real status page.
+
+RSS is sampled after a full garbage collection. The run fails if RSS
+grows more than --max-growth MiB after warm-up or ever exceeds --limit
+MiB (the container limit in docker-compose.yml).
+"""
+
+import argparse
+import gc
+import json
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from llm_monitor.config import Config, FeedConfig
+from llm_monitor.feed_parser import FetchResult
+from llm_monitor.monitor import StatusMonitor
+from benchmarks.load_test import current_rss_bytes
+from benchmarks.synthetic import generate_feed
+
+
+class _NullNotifier:
+    """Notifier that accepts every message without sending it"""
+
+    def __init__(self):
+        self.sent = 0
+
+    def send(self, **kwargs: Any) -> bool:
+        self.sent += 1
+        return True
+
+
+class _SoakFetcher:
+    """Serve each feed one of a few documents, advancing every `period` cycles"""
+
+    def __init__(self, feeds: int, entries: int, period: int, variants: int):
+        self.documents = [generate_feed(entries, seed=seed) for seed in range(variants)]
+        self.urls = {f"soak://feeds/{i}": i for i in range(feeds)}
+        self.period = period
+        self.cycle = 0
+
+    def __call__(
+        self,
+        url: str,
+        etag: Optional[str] = None,
+        modified: Optional[str] = None,
+        timeout: Optional[float] = None
+    ) -> FetchResult:
+        index = self.urls[url]
+        variant = str((index + self.cycle) // self.period % len(self.documents))
+        if etag == variant:
+            return FetchResult(304, b'', etag=variant)
+        return FetchResult(200, self.documents[int(variant)], etag=variant)
+
+
+def run_soak(
+    feeds: int,
+    cycles: int,
+    entries: int = 20,
+    period: int = 10,
+    variants: int = 32,
+    sample_every: Optional[int] = None,
+    warmup: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Run `cycles` check cycles over `feeds` feeds and sample RSS.
+
+    Returns:
+        Report with the RSS samples and start/baseline/final/peak figures
+    """
+    sample_every = sample_every or max(1, cycles // 100)
+    warmup = min(cycles - 1, warmup if warmup is not None else max(1, cycles // 20))
+    fetcher = _SoakFetcher(feeds, entries, period, variants)
+    config = Config(
+        notification_type='discord',
+        discord_webhook=None,
+        slack_webhook=None,
+        check_interval=60,
+        state_file=Path(tempfile.mkdtemp()) / "state.json"
+    )
+    monitor = StatusMonitor(config, feeds={
+        f"feed{i}": FeedConfig(name=f"Feed {i}", url=url, color=0x5865F2)
+        for url, i in fetcher.urls.items()
+    })
+    monitor.parser.fetch_feed = fetcher
+    monitor.notifier = _NullNotifier()
+
+    gc.collect()
+    rss_start = current_rss_bytes()
+    baseline = rss_start
+    samples: List[Dict[str, float]] = []
+    started = time.perf_counter()
+    try:
+        for cycle in range(cycles):
+            fetcher.cycle = cycle
+            monitor.run_check_cycle()
+            if cycle == warmup or cycle % sample_every == 0 or cycle == cycles - 1:
+                gc.collect()
+                rss = current_rss_bytes()
+                samples.append({'cycle': cycle, 'rss_bytes': rss,
+                                'elapsed_s': time.perf_counter() - started})
+                if cycle == warmup:
+                    baseline = rss
+    finally:
+        monitor.close()
+
+    final = samples[-1]['rss_bytes']
+    return {
+        'params': {'feeds': feeds, 'cycles': cycles, 'entries': entries,
+                   'period': period, 'variants': variants, 'warmup': warmup},
+        'samples': samples,
+        'notifications': monitor.notifier.sent,
+        'summary': {
+            'rss_start_bytes': rss_start,
+            'rss_baseline_bytes': baseline,
+            'rss_final_bytes': final,
+            'rss_peak_bytes': max(s['rss_bytes'] for s in samples),
+            'growth_bytes': final - baseline,
+            'elapsed_s': time.perf_counter() - started,
+        },
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Check that RSS stays flat over many cycles")
+    parser.add_argument('--feeds', type=int, default=1000)
+    parser.add_argument('--cycles', type=int, default=100000)
+    parser.add_argument('--entries', type=int, default=20,
+                        help="Entries per feed document")
+    parser.add_argument('--period', type=int, default=10,
+                        help="Cycles between new entries on each feed")
+    parser.add_argument('--variants', type=int, default=32,
+                        help="Distinct documents to rotate through")
+    parser.add_argument('--sample-every', type=int, help="Cycles between RSS samples")
+    parser.add_argument('--max-growth', type=float, default=8.0,
+                        help="Allowed RSS growth after warm-up, in MiB")
+    parser.add_argument('--limit', type=float, default=256.0,
+                        help="RSS ceiling in MiB")
+    parser.add_argument('--json', type=Path, help="Write the full report to this file")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+    report = run_soak(
+        args.feeds, args.cycles, args.entries, args.period, args.variants, args.sample_every
+    )
+
+    summary = report['summary']
+    mib = 2 ** 20
+    print(f"feeds x cycles:   {args.feeds} x {args.cycles} in {summary['elapsed_s']:.0f}s")
+    print(f"notifications:    {report['notifications']}")
+    print(f"rss start:        {summary['rss_start_bytes'] / mib:.1f} MiB")
+    print(f"rss after warmup: {summary['rss_baseline_bytes'] / mib:.1f} MiB")
+    print(f"rss final:        {summary['rss_final_bytes'] / mib:.1f} MiB "
+          f"(growth {summary['growth_bytes'] / mib:+.2f} MiB)")
+    print(f"rss peak:         {summary['rss_peak_bytes'] / mib:.1f} MiB")
+
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2))
+
+    if summary['growth_bytes'] > args.max_growth * mib:
+        print(f"FAIL: RSS grew more than {args.max_growth} MiB", file=sys.stderr)
+        return 1
+    if summary['rss_peak_bytes'] > args.limit * mib:
+        print(f"FAIL: RSS exceeded {args.limit} MiB", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
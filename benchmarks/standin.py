@@ -0,0 +1,458 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for Statuspage status pages and a fake webhook sink.
+
+Serves N simulated history.rss feeds at /feeds/<n>/history.rss with
+configurable latency, error rate, ETag behaviour and incident churn,
+and records webhook deliveries posted to /webhook. Each feed also has
+a component summary at /feeds/<n>/api/v2/summary.json, changed with
+`set_component()`. `send_push()` posts a feed's latest incident to a
+push receiver as a Statuspage webhook.
+
+Usage:
+    python -m benchmarks.standin --feeds 1000 --latency 0.02 --churn 0.01
+
+The bound port is printed on the first line of stdout.
+"""
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from llm_monitor.config import FeedConfig
+from benchmarks.synthetic import (
+    COMPONENTS, UPDATES, incident_title, incident_description, incident_payload,
+    render_item, render_feed
+)
+
+
+@dataclass
+class StandinOptions:
+    """Behaviour of the simulated status pages"""
+    feeds: int = 10
+    entries: int = 20
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    etag: bool = True
+    churn: float = 0.0
+    # Seconds between background churn ticks; 0 leaves churn to churn_once()
+    tick: float = 1.0
+    seed: int = 0
+
+
+@dataclass
+class Incident:
+    guid: str
+    title: str
+    created: float
+    stages: int
+
+
+@dataclass
+class SimulatedFeed:
+    """One simulated status page"""
+    index: int
+    base_url: str
+    incidents: List[Incident] = field(default_factory=list)
+    # Component name -> Statuspage status, in summary.json order
+    components: Dict[str, str] = field(
+        default_factory=lambda: {name: 'operational' for name in COMPONENTS[:3]}
+    )
+    components_version: int = 0
+    version: int = 0
+    changed_at: float = 0.0
+    _document: Optional[bytes] = None
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.index}-{self.version}"'
+
+    @property
+    def last_modified(self) -> str:
+        return formatdate(self.changed_at, usegmt=True)
+
+    def touch(self, now: float) -> None:
+        self.version += 1
+        self.changed_at = now
+        self._document = None
+
+    def document(self) -> bytes:
+        """Rendered feed, cached until the next change"""
+        if self._document is None:
+            items = [
+                render_item(
+                    self.base_url,
+                    guid=incident.guid,
+                    title=incident.title,
+                    description_html=incident_description(
+                        random.Random(incident.guid),
+                        datetime.fromtimestamp(incident.created, timezone.utc),
+                        incident.stages
+                    ),
+                    published=datetime.fromtimestamp(incident.created, timezone.utc)
+                )
+                for incident in self.incidents
+            ]
+            self._document = render_feed(self.base_url, items, f"Feed {self.index}")
+        return self._document
+
+    def summary(self) -> bytes:
+        """Statuspage summary.json with the feed's components"""
+        return json.dumps({
+            "page": {"id": f"page{self.index}", "name": f"Feed {self.index}"},
+            "components": [
+                {
+                    "id": f"c{self.index}-{position}",
+                    "name": name,
+                    "status": status,
+                    "group": False,
+                    "group_id": None,
+                }
+                for position, (name, status) in enumerate(self.components.items())
+            ],
+        }).encode('utf-8')
+
+
+class StandinServer:
+    """
+    Threaded HTTP server simulating many status pages plus a webhook sink.
+
+    Usable in-process (tests) or as a separate process (load tests), so
+    that its CPU and memory do not pollute the monitor's measurements.
+    """
+
+    def __init__(self, options: StandinOptions, host: str = '127.0.0.1', port: int = 0):
+        self.options = options
+        self.host = host
+        self.port = port
+        self._rng = random.Random(options.seed)
+        self._lock = threading.Lock()
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self.feeds: List[SimulatedFeed] = []
+        # guid -> time of the last change that should trigger an alert
+        self.changes: Dict[str, float] = {}
+        self.deliveries: List[Tuple[float, Optional[str], Optional[float]]] = []
+        self.counters = {'requests': 0, 'not_modified': 0, 'errors_injected': 0}
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def webhook_url(self) -> str:
+        return f"{self.base_url}/webhook"
+
+    def feed_configs(self) -> Dict[str, FeedConfig]:
+        """FeedConfig mapping pointing at the simulated feeds"""
+        return {
+            f"feed{feed.index}": FeedConfig(
+                name=f"Feed {feed.index}",
+                url=f"{self.base_url}/feeds/{feed.index}/history.rss",
+                color=0x5865F2
+            )
+            for feed in self.feeds
+        }
+
+    def _populate(self) -> None:
+        now = time.time()
+        for index in range(self.options.feeds):
+            # Incident links sit next to history.rss, as on a real status page
+            feed = SimulatedFeed(index, f"{self.base_url}/feeds/{index}")
+            # Start with resolved history only, so alerts come from churn
+            for n in range(self.options.entries, 0, -1):
+                feed.incidents.insert(0, Incident(
+                    guid=f"f{index}-i{n}",
+                    title=incident_title(self._rng),
+                    created=now - 3600 * (self.options.entries - n + 1),
+                    stages=len(UPDATES)
+                ))
+            feed.touch(now)
+            self.feeds.append(feed)
+
+    def churn_once(self, now: Optional[float] = None) -> int:
+        """
+        Advance the simulation by one tick: each feed may advance its open
+        incident to the next stage or open a new one. Returns the number
+        of changed feeds.
+        """
+        now = time.time() if now is None else now
+        changed = 0
+        with self._lock:
+            for feed in self.feeds:
+                if self._rng.random() >= self.options.churn:
+                    continue
+                latest = feed.incidents[0]
+                if latest.stages < len(UPDATES):
+                    latest.stages += 1
+                else:
+                    latest = Incident(
+                        guid=f"f{feed.index}-i{feed.version + self.options.entries + 1}",
+                        title=incident_title(self._rng),
+                        created=now,
+                        stages=1
+                    )
+                    feed.incidents.insert(0, latest)
+                    del feed.incidents[self.options.entries:]
+                self.changes[latest.guid] = now
+                feed.touch(now)
+                changed += 1
+        return changed
+
+    def set_component(self, index: int, name: str, status: str) -> None:
+        """Change a component's status on a feed's summary.json"""
+        with self._lock:
+            feed = self.feeds[index]
+            feed.components[name] = status
+            feed.components_version += 1
+
+    def push_payload(self, index: int) -> dict:
+        """Statuspage webhook body for a feed's latest incident, as its feed now shows it"""
+        with self._lock:
+            incident = self.feeds[index].incidents[0]
+            return incident_payload(
+                random.Random(incident.guid),
+                incident.guid,
+                incident.title,
+                datetime.fromtimestamp(incident.created, timezone.utc),
+                incident.stages
+            )
+
+    def send_push(self, index: int, url: str, timeout: float = 5.0) -> int:
+        """POST a feed's latest incident to a push receiver; returns the HTTP status"""
+        request = urllib.request.Request(
+            url,
+            data=json.dumps(self.push_payload(index)).encode('utf-8'),
+            headers={'Content-Type': 'application/json'}
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=timeout) as response:
+                return response.status
+        except urllib.error.HTTPError as e:
+            return e.code
+
+    def _churn_loop(self) -> None:
+        while not self._stop.wait(self.options.tick):
+            self.churn_once()
+
+    def _handle_feed(self, handler: BaseHTTPRequestHandler, index: int) -> None:
+        options = self.options
+        if options.latency or options.jitter:
+            time.sleep(options.latency + self._rng.random() * options.jitter)
+
+        with self._lock:
+            self.counters['requests'] += 1
+            if self._rng.random() < options.error_rate:
+                self.counters['errors_injected'] += 1
+                handler.send_response(503)
+                handler.send_header('Content-Length', '0')
+                handler.end_headers()
+                return
+
+            feed = self.feeds[index]
+            if options.etag and handler.headers.get('If-None-Match') == feed.etag:
+                self.counters['not_modified'] += 1
+                handler.send_response(304)
+                handler.send_header('ETag', feed.etag)
+                handler.end_headers()
+                return
+
+            body = feed.document()
+            etag, last_modified = feed.etag, feed.last_modified
+
+        handler.send_response(200)
+        handler.send_header('Content-Type', 'application/rss+xml; charset=utf-8')
+        handler.send_header('Content-Length', str(len(body)))
+        if options.etag:
+            handler.send_header('ETag', etag)
+            handler.send_header('Last-Modified', last_modified)
+        handler.end_headers()
+        handler.wfile.write(body)
+
+    def _handle_summary(self, handler: BaseHTTPRequestHandler, index: int) -> None:
+        with self._lock:
+            self.counters['requests'] += 1
+            feed = self.feeds[index]
+            etag = f'"{index}-c{feed.components_version}"'
+            if self.options.etag and handler.headers.get('If-None-Match') == etag:
+                self.counters['not_modified'] += 1
+                handler.send_response(304)
+                handler.send_header('ETag', etag)
+                handler.end_headers()
+                return
+            body = feed.summary()
+
+        handler.send_response(200)
+        handler.send_header('Content-Type', 'application/json')
+        handler.send_header('Content-Length', str(len(body)))
+        if self.options.etag:
+            handler.send_header('ETag', etag)
+        handler.end_headers()
+        handler.wfile.write(body)
+
+    def _handle_webhook(self, handler: BaseHTTPRequestHandler) -> None:
+        received = time.time()
+        length = int(handler.headers.get('Content-Length', 0))
+        body = handler.rfile.read(length)
+        guid = None
+        try:
+            guid = _guid_from_payload(json.loads(body))
+        except ValueError:
+            pass
+
+        with self._lock:
+            changed = self.changes.get(guid) if guid else None
+            latency = received - changed if changed is not None else None
+            self.deliveries.append((received, guid, latency))
+
+        handler.send_response(204)
+        handler.end_headers()
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                **self.counters,
+                'feeds': len(self.feeds),
+                'deliveries': len(self.deliveries),
+                'latencies': [d[2] for d in self.deliveries if d[2] is not None],
+            }
+
+    def start(self) -> None:
+        server = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self) -> None:
+                parts = self.path.strip('/').split('/')
+                if len(parts) in (3, 5) and parts[0] == 'feeds' and (
+                    parts[2:] in (['history.rss'], ['api', 'v2', 'summary.json'])
+                ):
+                    try:
+                        index = int(parts[1])
+                        server.feeds[index]
+                    except (ValueError, IndexError):
+                        self._empty(404)
+                        return
+                    if parts[2] == 'history.rss':
+                        server._handle_feed(self, index)
+                    else:
+                        server._handle_summary(self, index)
+                elif self.path == '/stats':
+                    body = json.dumps(server.stats()).encode()
+                    self.send_response(200)
+                    self.send_header('Content-Type', 'application/json')
+                    self.send_header('Content-Length', str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                else:
+                    self._empty(404)
+
+            def do_POST(self) -> None:
+                if self.path == '/webhook':
+                    server._handle_webhook(self)
+                else:
+                    self._empty(404)
+
+            def _empty(self, status: int) -> None:
+                self.send_response(status)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+
+            def log_message(self, format: str, *args) -> None:
+                pass
+
+        self._httpd = ThreadingHTTPServer((self.host, self.port), _Handler)
+        self._httpd.daemon_threads = True
+        self.port = self._httpd.server_address[1]
+        self._populate()
+
+        self._threads = [threading.Thread(target=self._httpd.serve_forever, daemon=True)]
+        if self.options.churn and self.options.tick > 0:
+            self._threads.append(threading.Thread(target=self._churn_loop, daemon=True))
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+
+def _guid_from_payload(payload: dict) -> Optional[str]:
+    """Find the incident guid in a Discord or Slack webhook payload"""
+    url = None
+    if 'embeds' in payload:
+        url = payload['embeds'][0].get('url')
+    elif 'blocks' in payload:
+        for block in payload['blocks']:
+            text = block.get('text', {}).get('text', '')
+            if text.startswith('<http'):
+                url = text[1:].split('|', 1)[0]
+    if not url:
+        return None
+    return url.rstrip('/').rsplit('/', 1)[-1]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Local stand-in status page server")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=0)
+    parser.add_argument('--feeds', type=int, default=10)
+    parser.add_argument('--entries', type=int, default=20, help="Entries per feed")
+    parser.add_argument('--latency', type=float, default=0.0, help="Response delay (s)")
+    parser.add_argument('--jitter', type=float, default=0.0, help="Extra random delay (s)")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Fraction of 503s")
+    parser.add_argument('--no-etag', action='store_true', help="Disable ETag/304 support")
+    parser.add_argument('--churn', type=float, default=0.0,
+                        help="Per-feed probability of an incident change per tick")
+    parser.add_argument('--tick', type=float, default=1.0, help="Churn tick (s)")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    server = StandinServer(
+        StandinOptions(
+            feeds=args.feeds,
+            entries=args.entries,
+            latency=args.latency,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+            etag=not args.no_etag,
+            churn=args.churn,
+            tick=args.tick,
+            seed=args.seed,
+        ),
+        host=args.host,
+        port=args.port
+    )
+    server.start()
+    print(server.port, flush=True)
+
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
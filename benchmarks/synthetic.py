@@ -0,0 +1,155 @@
+"""
+Synthetic Statuspage-style RSS feeds for benchmarks and load tests
+"""
+
+import random
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from html import escape
+from typing import Any, Dict, List, Optional, Tuple
+
+COMPONENTS = (
+    "API", "claude.ai", "Console", "ChatGPT", "Sora", "Files",
+    "Batch API", "Realtime API", "Fine-tuning", "Login",
+)
+
+SYMPTOMS = (
+    "Elevated errors", "Increased latency", "Degraded performance",
+    "Partial outage", "Elevated error rates", "Requests failing",
+)
+
+# (stage, message) pairs in the order Statuspage posts them
+UPDATES: Tuple[Tuple[str, str], ...] = (
+    ("Investigating", "We are currently investigating this issue."),
+    ("Identified", "The issue has been identified and a fix is being implemented."),
+    ("Monitoring", "A fix has been implemented and we are monitoring the results."),
+    ("Resolved", "This incident has been resolved."),
+)
+
+
+def incident_title(rng: random.Random) -> str:
+    """Random but realistic incident title"""
+    return f"{rng.choice(SYMPTOMS)} on {rng.choice(COMPONENTS)}"
+
+
+def incident_updates(
+    rng: random.Random,
+    created: datetime,
+    stages: Optional[int] = None
+) -> List[Tuple[datetime, str, str]]:
+    """(time, stage, message) of an incident's updates, oldest first"""
+    if stages is None:
+        stages = rng.randint(1, len(UPDATES))
+    updates = []
+    when = created
+    for stage, message in UPDATES[:stages]:
+        updates.append((when, stage, message))
+        when += timedelta(minutes=rng.randint(5, 90))
+    return updates
+
+
+def incident_description(
+    rng: random.Random,
+    created: datetime,
+    stages: Optional[int] = None
+) -> str:
+    """
+    Build the HTML description Statuspage uses for an incident: one
+    paragraph per update, newest first, each with a timestamp and stage.
+    """
+    return ''.join(
+        f"<p><small>{when.strftime('%b')} <var>{when.day}</var>, "
+        f"<var>{when.strftime('%H:%M')}</var> UTC</small><br>"
+        f"<strong>{stage}</strong> - {message}</p>"
+        for when, stage, message in reversed(incident_updates(rng, created, stages))
+    )
+
+
+def incident_payload(
+    rng: random.Random,
+    guid: str,
+    title: str,
+    created: datetime,
+    stages: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Statuspage incident webhook body for the same incident (and update
+    times, given an rng in the same state) as incident_description
+    """
+    return {
+        "meta": {"generated_at": datetime.now(timezone.utc).isoformat()},
+        "incident": {
+            "id": guid,
+            "name": title,
+            "created_at": created.isoformat(),
+            "incident_updates": [
+                {
+                    "status": stage.lower(),
+                    "body": message,
+                    "created_at": when.isoformat(),
+                    "display_at": when.isoformat(),
+                }
+                for when, stage, message in incident_updates(rng, created, stages)
+            ],
+        },
+    }
+
+
+def render_item(
+    base_url: str,
+    guid: str,
+    title: str,
+    description_html: str,
+    published: datetime
+) -> str:
+    """Render a single RSS <item>"""
+    link = f"{base_url}/incidents/{guid}"
+    return (
+        "<item>"
+        f"<title>{escape(title)}</title>"
+        f"<description>{escape(description_html)}</description>"
+        f"<pubDate>{format_datetime(published)}</pubDate>"
+        f"<link>{link}</link>"
+        f"<guid>{link}</guid>"
+        "</item>"
+    )
+
+
+def render_feed(base_url: str, items: List[str], title: str = "Example Status") -> bytes:
+    """Wrap rendered items into an RSS document"""
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<rss version="2.0"><channel>'
+        f"<title>{escape(title)} - Incident History</title>"
+        f"<link>{base_url}</link>"
+        f"<description>Statuspage</description>"
+        + ''.join(items)
+        + "</channel></rss>\n"
+    ).encode('utf-8')
+
+
+def generate_feed(
+    entries: int,
+    seed: int = 0,
+    base_url: str = "https://status.example.com"
+) -> bytes:
+    """
+    Generate a history.rss document with the given number of entries.
+
+    The output is deterministic for a given seed, newest entry first.
+    """
+    rng = random.Random(seed)
+    now = datetime(2025, 10, 25, 14, 3, tzinfo=timezone.utc)
+    items = []
+    for i in range(entries):
+        created = now - timedelta(hours=6 * i + rng.randint(0, 5))
+        # The newest incident is still open; older ones are resolved
+        stages = rng.randint(1, 3) if i == 0 else len(UPDATES)
+        items.append(render_item(
+            base_url,
+            guid=f"inc{seed:04d}{entries - i:06d}",
+            title=incident_title(rng),
+            description_html=incident_description(rng, created, stages),
+            published=created
+        ))
+    return render_feed(base_url, items)
@@ -4,7 +4,15 @@ LLM Status Monitor - Monitor status pages for Claude and ChatGPT
 
 __version__ = "0.2.0"
 
-from .monitor import StatusMonitor
-from .config import Config
-
 __all__ = ["StatusMonitor", "Config"]
+
+
+def __getattr__(name: str):
+    # Resolve public names lazily so importing the package stays cheap
+    if name == "StatusMonitor":
+        from .monitor import StatusMonitor
+        return StatusMonitor
+    if name == "Config":
+        from .config import Config
+        return Config
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,278 @@
+"""
+Uptime and MTTR analytics over the entry history (requires numpy)
+"""
+
+import csv
+import io
+import json
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .history import HistoryStore
+
+logger = logging.getLogger(__name__)
+
+# Reporting windows as numpy datetime64 units; weeks are built by hand
+# because numpy aligns them to Thursday, the weekday of the epoch
+WINDOWS = {'day': 'D', 'week': 'W', 'month': 'M', 'year': 'Y'}
+
+PERCENTILES = (50, 90, 99)
+
+WEEKDAYS = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+
+DAY = 86400.0
+
+
+@dataclass
+class IncidentTable:
+    """
+    Incident history in columnar form: one array element per incident.
+
+    Rows are grouped by service; `service` holds the index into
+    `services`. Times are UTC epoch seconds. `resolved` is NaN when the
+    incident is still open or its resolution time could not be read.
+    """
+    services: List[str]
+    service: np.ndarray
+    started: np.ndarray
+    resolved: np.ndarray
+    open: np.ndarray
+
+    @classmethod
+    def load(cls, store: HistoryStore, services: Optional[Sequence[str]] = None) -> "IncidentTable":
+        """Load incident times from the history store"""
+        counts, times = store.incident_times(services)
+        # None becomes NaN in a float array
+        columns = np.array(times, dtype=np.float64).reshape(-1, 3)
+        return cls(
+            services=[service_id for service_id, _ in counts],
+            service=np.repeat(
+                np.arange(len(counts), dtype=np.int64),
+                [count for _, count in counts]
+            ),
+            started=columns[:, 0],
+            resolved=columns[:, 1],
+            open=columns[:, 2] > 0
+        )
+
+    def __len__(self) -> int:
+        return len(self.started)
+
+
+def window_edges(start: float, end: float, window: str) -> np.ndarray:
+    """Boundaries of the calendar windows (UTC) covering [start, end), clipped to it"""
+    unit = WINDOWS[window]
+    if unit == 'W':
+        first_day = int(start // DAY)
+        monday = first_day - (first_day + 3) % 7
+        edges = np.arange(monday, end // DAY + 8, 7, dtype=np.float64) * DAY
+    else:
+        first = np.datetime64(int(start), 's').astype(f'datetime64[{unit}]')
+        last = np.datetime64(int(end), 's').astype(f'datetime64[{unit}]')
+        edges = np.arange(first, last + np.timedelta64(2, unit)).astype('datetime64[s]').astype(np.float64)
+    return np.unique(np.clip(edges, start, end))
+
+
+def _group_percentiles(groups: np.ndarray, values: np.ndarray, size: int, q: float) -> np.ndarray:
+    """
+    Linear-interpolated percentile of `values` per group (NaN for empty groups).
+
+    Same result as np.percentile on each group, for all groups at once.
+    """
+    order = np.lexsort((values, groups))
+    values = values[order]
+    sizes = np.bincount(groups, minlength=size)
+    offsets = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+    result = np.full(size, np.nan)
+    present = sizes > 0
+    position = offsets[present] + q / 100.0 * (sizes[present] - 1)
+    low = np.floor(position).astype(np.int64)
+    high = np.ceil(position).astype(np.int64)
+    result[present] = values[low] + (values[high] - values[low]) * (position - low)
+    return result
+
+
+def _downtime(table: IncidentTable, edges: np.ndarray) -> np.ndarray:
+    """
+    Seconds each service spent with an incident open, per window.
+
+    Overlapping incidents count once; open incidents last until the last
+    edge and resolved ones with no known end are skipped.
+
+    Returns:
+        Array of shape (windows, services)
+    """
+    start, end = edges[0], edges[-1]
+    services = len(table.services)
+    finished = np.where(table.open, end, table.resolved)
+    known = ~np.isnan(finished)
+    begin = np.clip(table.started[known], start, end) - start
+    finish = np.clip(finished[known], start, end) - start
+    codes = table.service[known]
+
+    # Lay services end to end on one axis so a single running maximum
+    # merges overlaps within each service and never across them
+    stride = (end - start) + 1.0
+    order = np.lexsort((begin, codes))
+    offset = codes[order] * stride
+    begin, finish = begin[order] + offset, finish[order] + offset
+    covered_until = np.concatenate(([-np.inf], np.maximum.accumulate(finish)[:-1]))
+    # Uncovered part of each incident: disjoint, sorted pieces of downtime
+    piece_start = np.maximum(begin, covered_until)
+    pieces = finish > piece_start
+    piece_start, piece_length = piece_start[pieces], (finish - piece_start)[pieces]
+    if not len(piece_start):
+        return np.zeros((len(edges) - 1, services))
+
+    # Downtime before each edge of each service, read off the running total
+    points = (edges - start)[None, :] + (np.arange(services) * stride)[:, None]
+    index = np.searchsorted(piece_start, points, side='right') - 1
+    last = np.maximum(index, 0)
+    total_before = np.concatenate(([0.0], np.cumsum(piece_length)))
+    partial = np.clip(points - piece_start[last], 0.0, piece_length[last])
+    covered = np.where(index >= 0, total_before[last] + partial, 0.0)
+    return np.diff(covered, axis=1).T
+
+
+def _minutes(seconds: np.ndarray) -> List[Optional[float]]:
+    """Seconds as minutes rounded to 0.1, with None for NaN"""
+    minutes = np.round(seconds / 60.0, 1).astype(object)
+    minutes[np.isnan(seconds)] = None
+    return minutes.tolist()
+
+
+def _iso(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat()
+
+
+def window_stats(table: IncidentTable, edges: np.ndarray) -> List[Dict[str, Any]]:
+    """
+    Per-service and per-window incident counts, MTTR, duration percentiles
+    and availability. Incidents belong to the window they started in.
+
+    Args:
+        table: Incident history
+        edges: Increasing window boundaries (UTC epoch seconds)
+    """
+    services = len(table.services)
+    windows = len(edges) - 1
+    size = windows * services
+    inside = (table.started >= edges[0]) & (table.started < edges[-1])
+    window = np.searchsorted(edges, table.started[inside], side='right') - 1
+    groups = window * services + table.service[inside]
+    durations = (table.resolved - table.started)[inside]
+    done = ~np.isnan(durations)
+    done_groups, done_durations = groups[done], durations[done]
+
+    incidents = np.bincount(groups, minlength=size)
+    resolved = np.bincount(done_groups, minlength=size)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mttr = np.bincount(done_groups, weights=done_durations, minlength=size) / resolved
+    percentiles = {
+        q: _group_percentiles(done_groups, done_durations, size, q) for q in PERCENTILES
+    }
+    longest = np.full(size, np.nan)
+    np.fmax.at(longest, done_groups, done_durations)
+    downtime = _downtime(table, edges).ravel()
+    spans = np.repeat(np.diff(edges), services)
+    availability = 100.0 * (1.0 - downtime / spans)
+
+    # Built column by column; only the final zip touches every row in Python
+    labels = [_iso(edge) for edge in edges]
+    columns: Dict[str, List[Any]] = {
+        'service': table.services * windows,
+        'start': [label for label in labels[:-1] for _ in range(services)],
+        'end': [label for label in labels[1:] for _ in range(services)],
+        'incidents': incidents.tolist(),
+        'resolved': resolved.tolist(),
+        'mttr_minutes': _minutes(mttr),
+    }
+    for q in PERCENTILES:
+        columns[f'p{q}_minutes'] = _minutes(percentiles[q])
+    columns['max_minutes'] = _minutes(longest)
+    columns['downtime_minutes'] = _minutes(downtime)
+    columns['availability'] = np.round(availability, 4).tolist()
+    names = list(columns)
+    return [dict(zip(names, values)) for values in zip(*columns.values())]
+
+
+def heatmap(table: IncidentTable, start: float, end: float) -> List[Dict[str, Any]]:
+    """Incidents started per UTC weekday and hour, one row per service and weekday"""
+    services = len(table.services)
+    inside = (table.started >= start) & (table.started < end)
+    started = table.started[inside]
+    days = np.floor(started / DAY).astype(np.int64)
+    # 1970-01-01 was a Thursday
+    weekday = (days + 3) % 7
+    hour = ((started - days * DAY) // 3600).astype(np.int64)
+    cells = np.bincount(
+        table.service[inside] * 168 + weekday * 24 + hour,
+        minlength=services * 168
+    ).reshape(services, 7, 24)
+
+    rows = []
+    for index, service_id in enumerate(table.services):
+        for day, name in enumerate(WEEKDAYS):
+            row: Dict[str, Any] = {'service': service_id, 'weekday': name}
+            row.update({f'{hour:02d}': int(cells[index, day, hour]) for hour in range(24)})
+            rows.append(row)
+    return rows
+
+
+def render(rows: List[Dict[str, Any]], output_format: str = 'json') -> str:
+    """Report rows as a JSON array or CSV with a header line"""
+    if output_format == 'json':
+        return json.dumps(rows, indent=2)
+    buffer = io.StringIO()
+    if rows:
+        writer = csv.DictWriter(buffer, fieldnames=list(rows[0]), lineterminator='\n')
+        writer.writeheader()
+        writer.writerows(rows)
+    return buffer.getvalue()
+
+
+def run_report(
+    store: HistoryStore,
+    report: str = 'summary',
+    services: Optional[Sequence[str]] = None,
+    since: Optional[float] = None,
+    until: Optional[float] = None,
+    window: str = 'month'
+) -> List[Dict[str, Any]]:
+    """
+    Load the history and build a report.
+
+    Args:
+        store: History to read
+        report: 'summary' (one row per service), 'windows' (per service
+            and calendar window) or 'heatmap' (starts per weekday and hour)
+        services: Service IDs to include (default: all)
+        since: Period start; defaults to the first recorded incident
+        until: Period end; defaults to now
+        window: 'day', 'week', 'month' or 'year' for the windows report
+    """
+    started = time.perf_counter()
+    table = IncidentTable.load(store, services)
+    if until is None:
+        until = time.time()
+    if since is None:
+        since = float(table.started.min()) if len(table) else until
+    if until <= since:
+        return []
+
+    if report == 'heatmap':
+        rows = heatmap(table, since, until)
+    elif report == 'windows':
+        rows = window_stats(table, window_edges(since, until, window))
+    else:
+        rows = window_stats(table, np.array([since, until]))
+    logger.info(
+        "Analyzed %d incidents across %d service(s) in %.3fs",
+        len(table), len(table.services), time.perf_counter() - started
+    )
+    return rows
@@ -0,0 +1,311 @@
+"""
+asyncio-native monitoring loop for large feed sets
+"""
+
+import asyncio
+import contextvars
+import functools
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
+
+import aiohttp
+
+from .config import Config, FeedConfig
+from .feed_parser import USER_AGENT, FeedEntry, FetchResult
+from .monitor import StatusMonitor
+from .notifiers import NEW, Notifier
+
+logger = logging.getLogger(__name__)
+
+# Sentinel results for feeds that were not checked this cycle
+_DEFERRED = object()
+_SKIPPED = object()
+
+
+class AsyncStatusMonitor(StatusMonitor):
+    """
+    StatusMonitor that checks all feeds concurrently on one event loop.
+
+    Fetches and webhook deliveries use aiohttp with up to
+    `config.async_concurrency` requests in flight; parsing runs on a
+    small thread pool so it never blocks the loop, or on worker
+    processes when `config.parse_workers` is set. Classification, state
+    and scheduling are shared with StatusMonitor, so the two are
+    interchangeable: run(), run_once(), reloads and signals behave the
+    same. The event loop and HTTP connection pool persist across cycles.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        feeds: Optional[Dict[str, FeedConfig]] = None,
+        parse_threads: Optional[int] = None
+    ):
+        super().__init__(config, feeds)
+        self._loop = asyncio.new_event_loop()
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._executor = ThreadPoolExecutor(
+            max_workers=parse_threads or min(4, os.cpu_count() or 1),
+            thread_name_prefix='llm-monitor-parse'
+        )
+
+    def run_check_cycle(self, deadline: Optional[float] = None) -> int:
+        """
+        Run a single check cycle for all feeds concurrently.
+
+        Feeds that have not started when the deadline passes are deferred
+        to the next cycle; in-flight fetches are bounded by the deadline.
+
+        Args:
+            deadline: time.monotonic() value the cycle must finish by
+
+        Returns:
+            Number of feeds that failed
+        """
+        return self._loop.run_until_complete(self.check_cycle_async(deadline))
+
+    async def check_cycle_async(self, deadline: Optional[float] = None) -> int:
+        """Coroutine version of run_check_cycle()"""
+        started = self._start_cycle()
+        order = self._cycle_order()
+        semaphore = asyncio.Semaphore(max(1, self.config.async_concurrency))
+
+        async def check(service_id: str):
+            async with semaphore:
+                if self._stop.is_set():
+                    return _SKIPPED
+                if deadline is not None and time.monotonic() >= deadline:
+                    return _DEFERRED
+                try:
+                    return await self.check_feed_async(
+                        service_id, self.feeds[service_id], deadline
+                    )
+                except Exception as e:
+                    self._unexpected_error(service_id, e)
+                    return False
+
+        results = await asyncio.gather(*(check(service_id) for service_id in order))
+
+        deferred = [s for s, result in zip(order, results) if result is _DEFERRED]
+        if deferred:
+            self._defer(deferred)
+        skipped = sum(1 for result in results if result is _SKIPPED)
+        if skipped:
+            logger.info("Stop requested, skipped %d feed(s)", skipped)
+
+        await self._release_alerts_async()
+        self._finish_cycle(started)
+        return sum(1 for result in results if result is False)
+
+    async def check_feed_async(
+        self,
+        service_id: str,
+        feed_config: FeedConfig,
+        deadline: Optional[float] = None
+    ) -> bool:
+        """Async counterpart of check_feed()"""
+        with self.tracer.span('check_feed', service_id):
+            ok = True
+            if service_id not in self._feed_skipped:
+                ok = await self._check_feed_async(service_id, feed_config, deadline)
+            if self._watches_components(feed_config):
+                ok = await self._check_components_async(service_id, feed_config, deadline) and ok
+            return ok
+
+    async def _check_feed_async(
+        self,
+        service_id: str,
+        feed_config: FeedConfig,
+        deadline: Optional[float]
+    ) -> bool:
+        logger.info("Checking %s...", feed_config.name)
+
+        etag, modified = self.state_manager.get_validators(service_id)
+        started = time.perf_counter()
+        with self.tracer.span('fetch', service_id):
+            result = await self._fetch(
+                feed_config.url, etag, modified, self._fetch_timeout(deadline)
+            )
+        if not self._accept_fetch(service_id, feed_config, result, started):
+            return result is not None
+
+        ok, entry = await self._parse_entry_async(service_id, feed_config, result.content)
+        result.content = b''
+        if entry is None:
+            return ok
+
+        for kind in self._process_entry(service_id, feed_config, entry):
+            await self._send_notification_async(service_id, feed_config, entry, kind)
+        self._finish_feed(service_id, result)
+        return True
+
+    async def _check_components_async(
+        self,
+        service_id: str,
+        feed_config: FeedConfig,
+        deadline: Optional[float]
+    ) -> bool:
+        """Async counterpart of _check_components()"""
+        from .components import VALIDATORS_PREFIX, summary_url
+
+        etag, modified = self.state_manager.get_validators(service_id, VALIDATORS_PREFIX)
+        with self.tracer.span('fetch', service_id, document='components'):
+            result = await self._fetch(
+                summary_url(feed_config), etag, modified, self._fetch_timeout(deadline)
+            )
+        ok, notification = self._diff_components(service_id, feed_config, result)
+        if notification is not None:
+            await self._send_notification_async(service_id, feed_config, *notification)
+        return ok
+
+    async def _parse_entry_async(
+        self,
+        service_id: str,
+        feed_config: FeedConfig,
+        content: bytes
+    ) -> Tuple[bool, Optional[FeedEntry]]:
+        """Parse off the event loop, in worker processes if PARSE_WORKERS is set"""
+        started = time.perf_counter()
+        if self.parse_pool is not None:
+            with self.tracer.span('parse', service_id):
+                fields = await asyncio.wrap_future(
+                    self.parse_pool.submit(content, feed_config.url, self.config.stream_parse)
+                )
+            ok, entry = self.parse_pool.to_result(fields)
+        else:
+            # The context is copied so parse spans stay nested under this feed's span
+            context = contextvars.copy_context()
+            ok, entry = await self._loop.run_in_executor(
+                self._executor,
+                functools.partial(
+                    context.run, self._parse_local, service_id, feed_config, content
+                )
+            )
+        return self._parsed(service_id, feed_config, ok, entry, started)
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Pooled aiohttp session, created on first use inside the loop"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=max(1, self.config.async_concurrency))
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers={'User-Agent': USER_AGENT}
+            )
+        return self._session
+
+    async def _fetch(
+        self,
+        url: str,
+        etag: Optional[str],
+        modified: Optional[str],
+        timeout: float
+    ) -> Optional[FetchResult]:
+        """Fetch a feed with conditional GET; None if the request failed"""
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if modified:
+            headers['If-Modified-Since'] = modified
+
+        try:
+            async with self.session.get(
+                url,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=timeout)
+            ) as response:
+                if response.status != 304:
+                    response.raise_for_status()
+                content = await response.read()
+                return FetchResult(
+                    status=response.status,
+                    content=content,
+                    etag=response.headers.get('ETag'),
+                    last_modified=response.headers.get('Last-Modified')
+                )
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error("Failed to fetch feed %s: %s", url, e or type(e).__name__)
+            return None
+
+    async def _send_notification_async(
+        self,
+        service_id: str,
+        feed_config: FeedConfig,
+        entry: FeedEntry,
+        kind: str = NEW,
+        severity: Optional[str] = None
+    ) -> None:
+        """Deliver a notification to each destination with its notifier's payload over aiohttp"""
+        if kind == NEW and self.dedup is not None:
+            self._hold_alert(service_id, feed_config, entry, severity)
+            return
+        classified = time.perf_counter()
+        destinations = self._destinations(service_id, entry, severity)
+        if destinations:
+            await asyncio.gather(*(
+                self._post_notification(notifier, service_id, feed_config, entry, kind, classified)
+                for notifier in destinations
+            ))
+
+    async def _release_alerts_async(self) -> None:
+        """Async counterpart of _release_alerts()"""
+        deliveries = self._held_deliveries()
+        if not deliveries:
+            return
+        results = await asyncio.gather(*(
+            self._post_notification(
+                notifier, alerts[0].service_id, feed_config, entry, kind, alerts[0].classified
+            )
+            for notifier, alerts, feed_config, entry, kind in deliveries
+        ))
+        for (notifier, alerts, _, _, kind), success in zip(deliveries, results):
+            if success:
+                self._record_held_detection(notifier, alerts, kind)
+
+    async def _post_notification(
+        self,
+        notifier: Notifier,
+        service_id: str,
+        feed_config: FeedConfig,
+        entry: FeedEntry,
+        kind: str,
+        classified: float
+    ) -> bool:
+        payload = notifier.build_payload(
+            feed_config.name, entry.title, entry.description, entry.link, feed_config.color,
+            kind=kind
+        )
+        started = time.perf_counter()
+        with self.tracer.span('notify', service_id):
+            try:
+                async with self.session.post(
+                    notifier.webhook_url,
+                    json=payload,
+                    timeout=aiohttp.ClientTimeout(total=10)
+                ) as response:
+                    response.raise_for_status()
+                success = True
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.error(
+                    "%s notification failed for %s: %s",
+                    notifier.NAME, feed_config.name, e or type(e).__name__
+                )
+                success = False
+        self._record_notification(service_id, feed_config, success, started)
+        if success and kind == NEW:
+            self._record_detection(service_id, entry, notifier, classified)
+        return success
+
+    def close(self) -> None:
+        """Close the HTTP session, parse threads and event loop"""
+        super().close()
+        if self._loop.is_closed():
+            return
+        if self._session is not None and not self._session.closed:
+            self._loop.run_until_complete(self._session.close())
+        self._session = None
+        self._executor.shutdown(wait=True)
+        self._loop.close()
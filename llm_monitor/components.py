@@ -0,0 +1,122 @@
+"""
+Component status tracking from Statuspage summaries
+"""
+
+import json
+import logging
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from .config import FeedConfig
+from .feed_parser import FeedEntry
+from .incidents import CRITICAL, MAINTENANCE, MAJOR, MINOR
+from .notifiers import NEW, RESOLVED, UPDATED
+
+logger = logging.getLogger(__name__)
+
+# Component statuses from best to worst; the state keeps each component's index
+OPERATIONAL = 0
+STATUSES = (
+    'operational', 'under_maintenance', 'degraded_performance', 'partial_outage', 'major_outage'
+)
+_CODES = {status: code for code, status in enumerate(STATUSES)}
+LABELS = (
+    'Operational', 'Under maintenance', 'Degraded performance', 'Partial outage', 'Major outage'
+)
+# Routing severity of a component in each status
+SEVERITIES = (MINOR, MAINTENANCE, MINOR, MAJOR, CRITICAL)
+
+# State keys of the summary's conditional GET validators, next to the feed's own
+VALIDATORS_PREFIX = 'components_'
+
+
+class Component(NamedTuple):
+    id: str
+    name: str
+    group: Optional[str]
+    status: int
+
+
+class Transition(NamedTuple):
+    component: Component
+    before: int
+
+
+def summary_url(feed_config: FeedConfig) -> str:
+    """Statuspage summary endpoint next to a feed's history.rss"""
+    return f"{feed_config.page_url}/api/v2/summary.json"
+
+
+def parse_summary(content: bytes) -> Optional[List[Component]]:
+    """
+    Components (not groups) of a summary.json or components.json document, or None if malformed.
+
+    Components in an unknown status are left out, so they keep their last
+    known status rather than flapping.
+    """
+    try:
+        data = json.loads(content)
+        raw = data['components']
+        groups = {c['id']: c['name'] for c in raw if c.get('group')}
+        components = []
+        for c in raw:
+            if c.get('group'):
+                continue
+            code = _CODES.get(c.get('status'))
+            if code is None:
+                logger.debug("Unknown status %r for component %s", c.get('status'), c.get('name'))
+                continue
+            components.append(
+                Component(str(c['id']), str(c['name']), groups.get(c.get('group_id')), code)
+            )
+        return components
+    except (ValueError, TypeError, KeyError, AttributeError) as e:
+        logger.error("Malformed component summary: %s", e)
+        return None
+
+
+def diff(previous: Dict[str, int], components: Sequence[Component]) -> List[Transition]:
+    """Components whose status differs from `previous`; ones not seen before count as operational"""
+    transitions = []
+    for component in components:
+        before = previous.get(component.id, OPERATIONAL)
+        if before != component.status:
+            transitions.append(Transition(component, before))
+    return transitions
+
+
+def watched(components: Sequence[Component], names: Tuple[str, ...]) -> List[Component]:
+    """Components matching any of `names` by name, group or ID (case-insensitive); all if none"""
+    if not names:
+        return list(components)
+    wanted = {name.lower() for name in names}
+    return [
+        c for c in components
+        if c.name.lower() in wanted or c.id.lower() in wanted
+        or (c.group is not None and c.group.lower() in wanted)
+    ]
+
+
+def alert(feed_config: FeedConfig, transitions: Sequence[Transition]) -> Tuple[FeedEntry, str, str]:
+    """
+    One notification for a poll's transitions: (entry, kind, severity).
+
+    The kind is RESOLVED once every changed component is operational
+    again, NEW if one of them was operational before, else UPDATED. The
+    severity follows the worst status reached.
+    """
+    worst = max(t.component.status for t in transitions)
+    if worst == OPERATIONAL:
+        kind = RESOLVED
+    elif any(t.before == OPERATIONAL for t in transitions):
+        kind = NEW
+    else:
+        kind = UPDATED
+
+    names = ', '.join(t.component.name for t in transitions)
+    description = '\n'.join(
+        f"{t.component.name}: {LABELS[t.before]} → {LABELS[t.component.status]}"
+        for t in transitions
+    )
+    link = feed_config.page_url
+    entry = FeedEntry.compact(f"{link}#components", f"{names}: {LABELS[worst]}", description, link)
+    return entry, kind, SEVERITIES[worst]
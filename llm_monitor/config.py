@@ -2,24 +2,99 @@
 Configuration management for LLM Status Monitor
 """
 
+import json
 import os
+import sys
 import logging
 from dataclasses import dataclass
-from typing import Optional, Literal
+from typing import TYPE_CHECKING, Any, Dict, Optional, Literal, Tuple
 from pathlib import Path
-from dotenv import load_dotenv
+
+if TYPE_CHECKING:
+    from .routing import RoutingTable
 
 logger = logging.getLogger(__name__)
 
 NotificationType = Literal["discord", "slack"]
 
 
+def load_dotenv(override: bool = False) -> Optional[Path]:
+    """
+    Load variables from the nearest .env file, importing python-dotenv on first use.
+
+    Args:
+        override: Let .env values replace variables already in the environment
+
+    Returns:
+        Path of the loaded file, or None if there is none
+    """
+    from dotenv import find_dotenv, load_dotenv as _load_dotenv
+    path = find_dotenv(usecwd=True)
+    if not path:
+        return None
+    _load_dotenv(path, override=override)
+    return Path(path)
+
+
 @dataclass
 class FeedConfig:
     """Configuration for an RSS feed"""
     name: str
     url: str
     color: int
+    # Component status tracking: None is off (unless COMPONENT_STATUS is set),
+    # () watches every component, names or IDs watch only those
+    components: Optional[Tuple[str, ...]] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FeedConfig":
+        """
+        Build a feed from a FEEDS_FILE entry; color may be an int or '#RRGGBB',
+        components true (all) or a list of component names
+        """
+        if not isinstance(data, dict):
+            raise ValueError(f"expected a JSON object, got {type(data).__name__}")
+        color = data.get('color', 0)
+        if isinstance(color, str):
+            color = int(color.lstrip('#'), 16)
+        components = data.get('components')
+        if components is True:
+            components = ()
+        elif components is False:
+            components = None
+        elif components is not None:
+            if not isinstance(components, list) or not all(isinstance(c, str) for c in components):
+                raise ValueError("components must be true or a list of component names")
+            components = tuple(components)
+        return cls(
+            name=str(data['name']), url=str(data['url']), color=int(color), components=components
+        )
+
+    @property
+    def page_url(self) -> str:
+        """Where the status page lives, e.g. https://status.claude.com for its history.rss"""
+        return self.url.rsplit('/', 1)[0]
+
+
+@dataclass
+class ProfileConfig:
+    """Configuration for per-cycle profiling"""
+    output_dir: Path = Path('logs/profiles')
+    every: int = 1
+    threshold_ms: float = 0.0
+    keep: int = 10
+    top: int = 20
+
+    @classmethod
+    def from_env(cls) -> "ProfileConfig":
+        """Load profiling options from PROFILE_* environment variables"""
+        return cls(
+            output_dir=Path(os.getenv('PROFILE_DIR', 'logs/profiles')),
+            every=int(os.getenv('PROFILE_EVERY', '1')),
+            threshold_ms=float(os.getenv('PROFILE_THRESHOLD_MS', '0')),
+            keep=int(os.getenv('PROFILE_KEEP', '10')),
+            top=int(os.getenv('PROFILE_TOP', '20'))
+        )
 
 
 @dataclass
@@ -30,11 +105,38 @@ class Config:
     slack_webhook: Optional[str]
     check_interval: int
     state_file: Path
+    http_host: str = '0.0.0.0'
+    http_port: int = 0
+    trace_file: Optional[Path] = None
+    profile: Optional[ProfileConfig] = None
+    cycle_budget: float = 0.0
+    shutdown_timeout: float = 8.0
+    feeds_file: Optional[Path] = None
+    env_file: Optional[Path] = None
+    reload_poll_interval: float = 5.0
+    async_mode: bool = False
+    async_concurrency: int = 100
+    parse_workers: int = 0
+    stream_parse: bool = True
+    history_file: Optional[Path] = None
+    record_file: Optional[Path] = None
+    routes_file: Optional[Path] = None
+    slo_file: Optional[Path] = None
+    push_token: Optional[str] = None
+    reconcile_interval: int = 3600
+    component_status: bool = False
+    dedup_window: int = 0
+    dedup_threshold: float = 0.5
 
     @classmethod
-    def from_env(cls) -> "Config":
-        """Load configuration from environment variables"""
-        load_dotenv()
+    def from_env(cls, override: bool = False) -> "Config":
+        """
+        Load configuration from environment variables.
+
+        Args:
+            override: Let .env values replace the current environment (used on reload)
+        """
+        env_file = load_dotenv(override=override)
 
         notification_type = os.getenv('NOTIFICATION_TYPE', 'discord').lower()
 
@@ -49,6 +151,31 @@ class Config:
         slack_webhook = os.getenv('SLACK_WEBHOOK_URL')
         check_interval = int(os.getenv('CHECK_INTERVAL', '300'))
         state_file = Path(os.getenv('STATE_FILE', 'data/state.json'))
+        http_host = os.getenv('HTTP_HOST', '0.0.0.0')
+        http_port = int(os.getenv('HTTP_PORT', '0'))
+        trace_file = os.getenv('TRACE_FILE')
+        cycle_budget = float(os.getenv('CYCLE_BUDGET', '0'))
+        shutdown_timeout = float(os.getenv('SHUTDOWN_TIMEOUT', '8'))
+        feeds_file = os.getenv('FEEDS_FILE')
+        reload_poll_interval = float(os.getenv('CONFIG_POLL_INTERVAL', '5'))
+        async_mode = os.getenv('ASYNC_MODE', '').lower() in ('1', 'true', 'yes')
+        async_concurrency = int(os.getenv('ASYNC_CONCURRENCY', '100'))
+        parse_workers = os.getenv('PARSE_WORKERS', '0').lower()
+        if parse_workers == 'auto':
+            parse_workers = str(os.cpu_count() or 1)
+        stream_parse = os.getenv('STREAM_PARSE', '1').lower() not in ('0', 'false', 'no')
+        history_file = os.getenv('HISTORY_FILE')
+        record_file = os.getenv('RECORD_FILE')
+        routes_file = os.getenv('ROUTES_FILE')
+        slo_file = os.getenv('SLO_FILE')
+        push_token = os.getenv('PUSH_TOKEN') or None
+        reconcile_interval = int(os.getenv('RECONCILE_INTERVAL', '3600'))
+        component_status = os.getenv('COMPONENT_STATUS', '').lower() in ('1', 'true', 'yes')
+        dedup_window = int(os.getenv('DEDUP_WINDOW', '0'))
+        dedup_threshold = float(os.getenv('DEDUP_THRESHOLD', '0.5'))
+        profile = None
+        if os.getenv('PROFILE', '').lower() in ('1', 'true', 'yes'):
+            profile = ProfileConfig.from_env()
 
         # Validate webhook configuration
         if notification_type == 'discord' and not discord_webhook:
@@ -60,11 +187,15 @@ class Config:
                 "NOTIFICATION_TYPE is 'slack' but SLACK_WEBHOOK_URL is not set"
             )
 
+        if push_token and not http_port:
+            logger.warning("PUSH_TOKEN is set but HTTP_PORT is 0; pushes cannot be received")
+
         # Validate check interval
         if check_interval < 10:
             logger.warning(
-                f"CHECK_INTERVAL ({check_interval}s) is very low. "
-                f"Consider using at least 60 seconds."
+                "CHECK_INTERVAL (%ss) is very low. "
+                "Consider using at least 60 seconds.",
+                check_interval
             )
 
         return cls(
@@ -72,9 +203,90 @@ class Config:
             discord_webhook=discord_webhook,
             slack_webhook=slack_webhook,
             check_interval=check_interval,
-            state_file=state_file
+            state_file=state_file,
+            http_host=http_host,
+            http_port=http_port,
+            trace_file=Path(trace_file) if trace_file else None,
+            profile=profile,
+            cycle_budget=cycle_budget,
+            shutdown_timeout=shutdown_timeout,
+            feeds_file=Path(feeds_file) if feeds_file else None,
+            env_file=env_file,
+            reload_poll_interval=reload_poll_interval,
+            async_mode=async_mode,
+            async_concurrency=async_concurrency,
+            parse_workers=int(parse_workers),
+            stream_parse=stream_parse,
+            history_file=Path(history_file) if history_file else None,
+            record_file=Path(record_file) if record_file else None,
+            routes_file=Path(routes_file) if routes_file else None,
+            slo_file=Path(slo_file) if slo_file else None,
+            push_token=push_token,
+            reconcile_interval=reconcile_interval,
+            component_status=component_status,
+            dedup_window=dedup_window,
+            dedup_threshold=dedup_threshold
         )
 
+    def load_feeds(self) -> Dict[str, FeedConfig]:
+        """
+        Get the feeds to monitor: FEEDS_FILE if set, else the built-in FEEDS.
+
+        Raises:
+            ValueError: If the feeds file cannot be read or is malformed
+        """
+        if self.feeds_file is None:
+            return dict(FEEDS)
+
+        try:
+            with open(self.feeds_file, 'r', encoding='utf-8') as f:
+                raw = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            raise ValueError(f"Cannot read FEEDS_FILE {self.feeds_file}: {e}")
+
+        if not isinstance(raw, dict):
+            raise ValueError(f"FEEDS_FILE {self.feeds_file} must contain a JSON object")
+
+        feeds = {}
+        for service_id, data in raw.items():
+            try:
+                # Service IDs key the state, metrics and status views; share one copy
+                feeds[sys.intern(service_id)] = FeedConfig.from_dict(data)
+            except (KeyError, TypeError, ValueError) as e:
+                raise ValueError(f"Invalid feed '{service_id}' in {self.feeds_file}: {e}")
+        return feeds
+
+    def load_routes(self) -> Optional["RoutingTable"]:
+        """
+        Compile the notification routing table from ROUTES_FILE, if set.
+
+        Raises:
+            ValueError: If the routes file cannot be read or is malformed
+        """
+        if self.routes_file is None:
+            return None
+        from .routing import RoutingTable
+        return RoutingTable.load(self.routes_file)
+
+    def watched_files(self) -> Dict[Path, int]:
+        """Modification times of the files a reload reads from"""
+        mtimes = {}
+        for path in (self.env_file, self.feeds_file, self.routes_file):
+            if path is None:
+                continue
+            try:
+                mtimes[path] = path.stat().st_mtime_ns
+            except OSError:
+                mtimes[path] = 0
+        return mtimes
+
+    @property
+    def effective_cycle_budget(self) -> float:
+        """Seconds a cycle may run; defaults to the check interval"""
+        if self.cycle_budget > 0:
+            return self.cycle_budget
+        return float(self.check_interval)
+
     def is_configured(self) -> bool:
         """Check if notifications are properly configured"""
         if self.notification_type == 'discord':
@@ -0,0 +1,245 @@
+"""
+Cross-service duplicate incident detection with MinHash signatures
+"""
+
+import random
+import re
+import time
+from collections import OrderedDict
+from dataclasses import replace
+from hashlib import blake2b
+from typing import Callable, Dict, List, NamedTuple, Optional, Set, Tuple
+
+from .config import FeedConfig
+from .feed_parser import MAX_DESCRIPTION_LENGTH, FeedEntry
+
+# MinHash permutations are (a * x + b) mod a Mersenne prime
+_PRIME = (1 << 61) - 1
+PERMUTATIONS = 128
+# 32 bands of 4 rows: pairs from about 0.4 Jaccard similarity are likely to share a bucket
+BANDS = 32
+MAX_ENTRIES = 1024
+
+# Statuspage update stamps ("oct 25, 14:31 utc") differ between pages for the same outage
+_STAMP = re.compile(r'\b[a-z]{3} \d{1,2}, \d{1,2}:\d{2} utc')
+_WORD = re.compile(r'[a-z0-9]+')
+# Function words and Statuspage boilerplate ("We are currently investigating this
+# issue."), which every incident shares and would otherwise make unrelated ones similar
+_STOPWORDS = frozenset('''
+    a all an and any are as at be been being but by for from has have in incident is
+    issue it its of on or our some that the their this to we were will with
+    currently investigating identified monitoring resolved postmortem scheduled verifying
+    completed progress update updates fix implemented results looking working
+'''.split())
+
+Signature = Tuple[int, ...]
+# (service ID, entry ID) of an indexed incident
+Key = Tuple[str, str]
+
+
+class HeldAlert(NamedTuple):
+    """A new-incident alert held until the end of the cycle"""
+    service_id: str
+    feed_config: FeedConfig
+    entry: FeedEntry
+    # Routing severity, or None to guess it from the entry's text
+    severity: Optional[str]
+    signature: Signature
+    classified: float
+
+
+def words(title: str, description: str) -> List[str]:
+    """Lowercase words of an incident, without update timestamps, punctuation or boilerplate"""
+    text = _STAMP.sub(' ', f"{title} {description}".lower())
+    return [word for word in _WORD.findall(text) if word not in _STOPWORDS]
+
+
+def shingles(tokens: List[str]) -> Set[str]:
+    """Words and pairs of adjacent words of a text"""
+    features = set(tokens)
+    features.update(f"{a} {b}" for a, b in zip(tokens, tokens[1:]))
+    return features
+
+
+class _Indexed:
+    __slots__ = ('signature', 'bands', 'at', 'services')
+
+    def __init__(
+        self,
+        signature: Signature,
+        bands: List[Tuple[int, Signature]],
+        at: float,
+        service_id: str
+    ):
+        self.signature = signature
+        self.bands = bands
+        self.at = at
+        self.services = {service_id}
+
+
+class DuplicateIndex:
+    """
+    Incidents alerted on in the last `window` seconds, for finding the
+    same outage reported by several status pages.
+
+    Each incident is reduced to a MinHash signature of its normalized
+    title and description; locality-sensitive hashing over bands of the
+    signature gives the few candidates worth comparing, so a lookup does
+    not scan the index. Entries expire after `window` seconds and the
+    oldest are evicted beyond `max_entries`, keeping memory bounded.
+    `clock` gives the monitor's current time (replay swaps in its
+    virtual clock).
+    """
+
+    def __init__(
+        self,
+        window: float,
+        threshold: float = 0.5,
+        max_entries: int = MAX_ENTRIES,
+        permutations: int = PERMUTATIONS,
+        bands: int = BANDS,
+        seed: int = 1,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        if permutations % bands:
+            raise ValueError("permutations must be a multiple of bands")
+        self.window = window
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.clock = clock
+        self._rows = permutations // bands
+        rng = random.Random(seed)
+        self._params = [
+            (rng.randrange(1, _PRIME), rng.randrange(0, _PRIME)) for _ in range(permutations)
+        ]
+        # Oldest first, so expiry and eviction pop from the front
+        self._entries: "OrderedDict[Key, _Indexed]" = OrderedDict()
+        self._buckets: Dict[Tuple[int, Signature], Set[Key]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def signature(self, title: str, description: str) -> Signature:
+        """MinHash signature of an incident's normalized text"""
+        hashes = [
+            int.from_bytes(blake2b(s.encode('utf-8'), digest_size=8).digest(), 'little') & _PRIME
+            for s in shingles(words(title, description))
+        ] or [0]
+        return tuple(min((a * h + b) % _PRIME for h in hashes) for a, b in self._params)
+
+    @staticmethod
+    def similarity(a: Signature, b: Signature) -> float:
+        """Estimated Jaccard similarity of the texts behind two signatures"""
+        return sum(x == y for x, y in zip(a, b)) / len(a)
+
+    def _bands(self, signature: Signature) -> List[Tuple[int, Signature]]:
+        rows = self._rows
+        return [
+            (band, signature[band * rows:(band + 1) * rows])
+            for band in range(len(signature) // rows)
+        ]
+
+    def match(self, service_id: str, signature: Signature, now: float) -> Optional[Key]:
+        """The most similar live incident from another service, if similar enough"""
+        self._expire(now)
+        candidates: Set[Key] = set()
+        for band in self._bands(signature):
+            candidates |= self._buckets.get(band, set())
+
+        best, best_similarity = None, self.threshold
+        for key in candidates:
+            indexed = self._entries[key]
+            if service_id in indexed.services:
+                continue
+            similarity = self.similarity(signature, indexed.signature)
+            if similarity >= best_similarity:
+                best, best_similarity = key, similarity
+        return best
+
+    def add(self, service_id: str, entry_id: str, signature: Signature, now: float) -> Key:
+        """Index an alerted incident"""
+        self._expire(now)
+        key = (service_id, entry_id)
+        self._remove(key)
+        while len(self._entries) >= self.max_entries:
+            self._remove(next(iter(self._entries)))
+        bands = self._bands(signature)
+        self._entries[key] = _Indexed(signature, bands, now, service_id)
+        for band in bands:
+            self._buckets.setdefault(band, set()).add(key)
+        return key
+
+    def merge(self, key: Key, service_id: str) -> None:
+        """Record that another service reported an indexed incident"""
+        self._entries[key].services.add(service_id)
+
+    def group(
+        self,
+        alerts: List[HeldAlert],
+        now: float
+    ) -> Tuple[List[List[HeldAlert]], List[Tuple[HeldAlert, Key]]]:
+        """
+        Sort a cycle's alerts into groups of duplicates, and the alerts
+        that duplicate an incident already alerted on in an earlier cycle
+        (with the key of that incident).
+        """
+        groups: Dict[Key, List[HeldAlert]] = {}
+        duplicates: List[Tuple[HeldAlert, Key]] = []
+        for alert in alerts:
+            key = self.match(alert.service_id, alert.signature, now)
+            if key is None:
+                groups[self.add(alert.service_id, alert.entry.entry_id, alert.signature, now)] = [alert]
+                continue
+            self.merge(key, alert.service_id)
+            if key in groups:
+                groups[key].append(alert)
+            else:
+                duplicates.append((alert, key))
+        return list(groups.values()), duplicates
+
+    def _expire(self, now: float) -> None:
+        cutoff = now - self.window
+        while self._entries:
+            key, indexed = next(iter(self._entries.items()))
+            if indexed.at > cutoff:
+                break
+            self._remove(key)
+
+    def _remove(self, key: Key) -> None:
+        indexed = self._entries.pop(key, None)
+        if indexed is None:
+            return
+        for band in indexed.bands:
+            bucket = self._buckets.get(band)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._buckets[band]
+
+
+def merge_alerts(alerts: List[HeldAlert]) -> Tuple[FeedConfig, FeedEntry]:
+    """
+    One alert for the same incident on several services: the first
+    alert, sent as "A, B, C" with each service's link listed.
+    """
+    first = alerts[0]
+    if len(alerts) == 1:
+        return first.feed_config, first.entry
+    names = ', '.join(alert.feed_config.name for alert in alerts)
+    links = '\n'.join(f"{alert.feed_config.name}: {alert.entry.link}" for alert in alerts)
+    description = f"Affects {names}\n{links}\n\n{first.entry.description}"
+    entry = first.entry._replace(description=description[:MAX_DESCRIPTION_LENGTH])
+    return replace(first.feed_config, name=names), entry
+
+
+def follow_up(alert: HeldAlert, first_reported_by: str) -> FeedEntry:
+    """
+    The alert for a service that reports an incident another service was
+    already alerted on: sent as an update, so it reads as news about the
+    same outage and this service's later updates follow on from it.
+    """
+    description = (
+        f"Also affects {alert.feed_config.name} "
+        f"(same incident as {first_reported_by})\n\n{alert.entry.description}"
+    )
+    return alert.entry._replace(description=description[:MAX_DESCRIPTION_LENGTH])
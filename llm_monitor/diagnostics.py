@@ -0,0 +1,330 @@
+"""
+Feed diagnostics: probe feeds concurrently and break each request down by phase
+"""
+
+import gzip
+import http.client
+import json
+import logging
+import socket
+import ssl
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
+
+from .config import FeedConfig
+from .feed_parser import USER_AGENT, parse_entries
+
+logger = logging.getLogger(__name__)
+
+PHASES = ('dns', 'connect', 'tls', 'ttfb', 'transfer', 'parse', 'total')
+
+PERCENTILES = (50, 95, 99)
+
+MAX_REDIRECTS = 3
+
+
+class ProbeError(Exception):
+    """A probe request failed"""
+    pass
+
+
+@dataclass
+class Probe:
+    """
+    One request to a feed, timed per phase in seconds.
+
+    `tls` is None over plain HTTP. `ttfb` runs from sending the request to
+    receiving the response headers; `total` also includes redirects.
+    """
+    status: int = 0
+    timings: Dict[str, Optional[float]] = field(default_factory=dict)
+    size: int = 0
+    wire_size: int = 0
+    encoding: Optional[str] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    redirects: int = 0
+    error: Optional[str] = None
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """Linear-interpolated percentile, or None without values"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    position = pct / 100 * (len(ordered) - 1)
+    low = int(position)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+
+def decode_body(body: bytes, encoding: Optional[str]) -> Optional[bytes]:
+    """
+    Undo Content-Encoding; None if the encoding is not supported.
+
+    Raises EOFError, OSError or zlib.error for a truncated or corrupt body.
+    """
+    if not encoding or encoding == 'identity':
+        return body
+    if encoding in ('gzip', 'x-gzip'):
+        return gzip.decompress(body)
+    if encoding == 'deflate':
+        try:
+            return zlib.decompress(body)
+        except zlib.error:
+            # Some servers send raw deflate without the zlib header
+            return zlib.decompress(body, -zlib.MAX_WBITS)
+    return None
+
+
+def _request(
+    url: str,
+    timeout: float,
+    headers: Dict[str, str]
+) -> Tuple[Dict[str, Optional[float]], http.client.HTTPResponse, bytes]:
+    """Make one GET request on a fresh connection, timing each phase"""
+    parts = urlsplit(url)
+    https = parts.scheme == 'https'
+    if parts.scheme not in ('http', 'https') or not parts.hostname:
+        raise ProbeError(f"unsupported URL: {url}")
+    port = parts.port or (443 if https else 80)
+    timings: Dict[str, Optional[float]] = {'tls': None}
+
+    started = time.perf_counter()
+    try:
+        family, kind, proto, _, address = socket.getaddrinfo(
+            parts.hostname, port, type=socket.SOCK_STREAM
+        )[0]
+    except socket.gaierror as e:
+        raise ProbeError(f"DNS lookup failed: {e}")
+    resolved = time.perf_counter()
+    timings['dns'] = resolved - started
+
+    sock = socket.socket(family, kind, proto)
+    sock.settimeout(timeout)
+    connection: Optional[http.client.HTTPConnection] = None
+    try:
+        sock.connect(address)
+        connected = time.perf_counter()
+        timings['connect'] = connected - resolved
+        if https:
+            sock = ssl.create_default_context().wrap_socket(sock, server_hostname=parts.hostname)
+            timings['tls'] = time.perf_counter() - connected
+
+        # A preset socket makes http.client skip its own connect()
+        connection_class = http.client.HTTPSConnection if https else http.client.HTTPConnection
+        connection = connection_class(parts.hostname, port, timeout=timeout)
+        connection.sock = sock
+        path = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+        sent = time.perf_counter()
+        connection.request('GET', path, headers=headers)
+        response = connection.getresponse()
+        first_byte = time.perf_counter()
+        timings['ttfb'] = first_byte - sent
+        body = response.read()
+        timings['transfer'] = time.perf_counter() - first_byte
+        return timings, response, body
+    except (OSError, http.client.HTTPException) as e:
+        raise ProbeError(f"{type(e).__name__}: {e}")
+    finally:
+        if connection is not None:
+            connection.close()
+        else:
+            sock.close()
+
+
+def probe(
+    url: str,
+    timeout: float = 10.0,
+    etag: Optional[str] = None,
+    modified: Optional[str] = None,
+    stream: bool = True
+) -> Probe:
+    """
+    Fetch a feed once on a new connection and time every phase.
+
+    Redirects are followed (phases are those of the last hop). 200
+    responses are decoded and parsed the way the monitor parses them.
+    """
+    headers = {'User-Agent': USER_AGENT, 'Accept-Encoding': 'gzip, deflate'}
+    if etag:
+        headers['If-None-Match'] = etag
+    if modified:
+        headers['If-Modified-Since'] = modified
+
+    result = Probe()
+    started = time.perf_counter()
+    try:
+        for _ in range(MAX_REDIRECTS + 1):
+            timings, response, body = _request(url, timeout, headers)
+            location = response.getheader('Location')
+            if response.status in (301, 302, 303, 307, 308) and location:
+                result.redirects += 1
+                url = urljoin(url, location)
+                continue
+            break
+        else:
+            raise ProbeError(f"more than {MAX_REDIRECTS} redirects")
+    except ProbeError as e:
+        result.error = str(e)
+        return result
+
+    result.status = response.status
+    result.timings = timings
+    result.etag = response.getheader('ETag')
+    result.last_modified = response.getheader('Last-Modified')
+    result.encoding = response.getheader('Content-Encoding')
+    result.wire_size = len(body)
+    if response.status != 200:
+        if response.status != 304:
+            result.error = f"HTTP {response.status}"
+        result.timings['total'] = time.perf_counter() - started
+        return result
+
+    try:
+        content = decode_body(body, result.encoding)
+    except (EOFError, OSError, zlib.error) as e:
+        # Truncated or corrupt body; gzip.BadGzipFile is an OSError
+        result.error = f"bad Content-Encoding body: {e}"
+        result.timings['total'] = time.perf_counter() - started
+        return result
+    if content is None:
+        result.error = f"unsupported Content-Encoding: {result.encoding}"
+        result.timings['total'] = time.perf_counter() - started
+        return result
+    result.size = len(content)
+    parse_started = time.perf_counter()
+    if parse_entries(content, url, 1, stream) is None:
+        result.error = "unparseable feed"
+    result.timings['parse'] = time.perf_counter() - parse_started
+    result.timings['total'] = time.perf_counter() - started
+    return result
+
+
+def diagnose_feed(
+    service_id: str,
+    feed_config: FeedConfig,
+    probes: int = 10,
+    timeout: float = 10.0,
+    stream: bool = True
+) -> Dict[str, Any]:
+    """
+    Probe one feed `probes` times in a row, then once conditionally.
+
+    Returns:
+        Report with response details, validator support and
+        p50/p95/p99/max per phase in milliseconds
+    """
+    results = [probe(feed_config.url, timeout, stream=stream) for _ in range(probes)]
+    ok = [r for r in results if r.error is None]
+    last = ok[-1] if ok else None
+
+    # Validators only help if the server answers them with 304
+    conditional = None
+    if last is not None and (last.etag or last.last_modified):
+        conditional = probe(
+            feed_config.url, timeout, last.etag, last.last_modified, stream
+        ).status or None
+
+    timings: Dict[str, Dict[str, Optional[float]]] = {}
+    for phase in PHASES:
+        values = [r.timings[phase] for r in ok if r.timings.get(phase) is not None]
+        if not values:
+            continue
+        timings[phase] = {
+            f'p{pct}': round(percentile(values, pct) * 1000, 2) for pct in PERCENTILES
+        }
+        timings[phase]['max'] = round(max(values) * 1000, 2)
+
+    errors: Dict[str, int] = {}
+    for r in results:
+        if r.error is not None:
+            errors[r.error] = errors.get(r.error, 0) + 1
+
+    return {
+        'service': service_id,
+        'name': feed_config.name,
+        'url': feed_config.url,
+        'probes': probes,
+        'ok': len(ok),
+        'errors': errors,
+        'status': last.status if last else None,
+        'redirects': last.redirects if last else None,
+        'size': last.size if last else None,
+        'wire_size': last.wire_size if last else None,
+        'encoding': last.encoding if last else None,
+        'etag': bool(last and last.etag),
+        'last_modified': bool(last and last.last_modified),
+        'conditional_status': conditional,
+        'timings_ms': timings,
+    }
+
+
+def diagnose(
+    feeds: Dict[str, FeedConfig],
+    probes: int = 10,
+    concurrency: int = 16,
+    timeout: float = 10.0,
+    stream: bool = True
+) -> List[Dict[str, Any]]:
+    """
+    Diagnose all feeds concurrently; each feed's probes run one after another.
+
+    Returns:
+        One diagnose_feed() report per feed, in the order given
+    """
+    if not feeds:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(feeds)))) as executor:
+        futures = [
+            executor.submit(diagnose_feed, service_id, feed_config, probes, timeout, stream)
+            for service_id, feed_config in feeds.items()
+        ]
+        return [future.result() for future in futures]
+
+
+def _kib(size: Optional[int]) -> str:
+    return '-' if size is None else f"{size / 1024:.1f} KiB"
+
+
+def render_table(reports: List[Dict[str, Any]]) -> str:
+    """Human-readable report: a header line per feed and a row per phase"""
+    lines = []
+    for report in reports:
+        compression = f", {report['encoding']} {_kib(report['wire_size'])} on the wire" \
+            if report['encoding'] else ""
+        validators = ', '.join(
+            name for name, present in (('ETag', report['etag']), ('Last-Modified', report['last_modified']))
+            if present
+        ) or 'none'
+        lines.append(f"{report['name']} ({report['service']}) {report['url']}")
+        lines.append(
+            f"  {report['ok']}/{report['probes']} ok, status {report['status']}, "
+            f"{_kib(report['size'])}{compression}"
+        )
+        lines.append(
+            f"  validators: {validators}; conditional request -> {report['conditional_status'] or '-'}"
+        )
+        for error, count in report['errors'].items():
+            lines.append(f"  error x{count}: {error}")
+        if report['timings_ms']:
+            lines.append(f"  {'phase':<10}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}  (ms)")
+            for phase, stats in report['timings_ms'].items():
+                lines.append(
+                    f"  {phase:<10}" + ''.join(f"{stats[key]:>10.1f}" for key in ('p50', 'p95', 'p99', 'max'))
+                )
+        lines.append('')
+    return '\n'.join(lines)
+
+
+def render(reports: List[Dict[str, Any]], output_format: str = 'table') -> str:
+    """Reports as a table or JSON"""
+    if output_format == 'json':
+        return json.dumps(reports, indent=2)
+    return render_table(reports)
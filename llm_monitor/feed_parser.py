@@ -3,29 +3,196 @@ RSS feed parsing for status pages
 """
 
 import re
+import sys
 import logging
-import feedparser
-from typing import Optional, Dict, Any
+from hashlib import blake2b
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, NamedTuple, Tuple
 from dataclasses import dataclass
 
+from .timeutil import parse_timestamp
+
+# feedparser and requests are imported on first use to keep startup fast
+if TYPE_CHECKING:
+    import feedparser
+    import requests
+
 logger = logging.getLogger(__name__)
 
+USER_AGENT = "llm-status-monitor (+https://github.com/renancavalcantercb/llm-status-monitor)"
 
-@dataclass
-class FeedEntry:
-    """Represents a parsed RSS feed entry"""
+# Same matches as '<[^<]+?>' without the lazy quantifier's backtracking
+_HTML_TAG = re.compile('<[^<][^<>]*>')
+
+# Longest description any notifier sends (Slack section text); the rest is dropped
+MAX_DESCRIPTION_LENGTH = 2000
+
+
+class FeedEntry(NamedTuple):
+    """Represents a parsed RSS feed entry (immutable, no per-instance __dict__)"""
     entry_id: str
     title: str
     description: str
     link: str
     published: Optional[str] = None
+    # `published` as UTC epoch seconds, parsed once when the entry is built
+    published_at: Optional[int] = None
+
+    @classmethod
+    def compact(
+        cls,
+        entry_id: str,
+        title: str,
+        description: str,
+        link: str,
+        published: Optional[str] = None
+    ) -> "FeedEntry":
+        """
+        Build an entry with an interned ID, the description capped to
+        MAX_DESCRIPTION_LENGTH and the publish date parsed
+        """
+        return cls(
+            sys.intern(entry_id),
+            title,
+            description[:MAX_DESCRIPTION_LENGTH],
+            link,
+            published,
+            parse_timestamp(published)
+        )
+
+    def fingerprint(self) -> str:
+        """
+        Short hash of the normalized title and description.
+
+        Statuspage edits incidents in place under the same ID, so this is
+        what tells a new update apart from the entry already processed.
+        Whitespace and case are ignored.
+        """
+        normalized = '\0'.join(
+            ' '.join(text.split()).lower() for text in (self.title, self.description)
+        )
+        return blake2b(normalized.encode('utf-8'), digest_size=8).hexdigest()
+
+
+# FeedEntry fields as a plain tuple, cheap to pickle between processes
+EntryFields = Tuple[str, str, str, str, Optional[str]]
+
+
+@dataclass
+class FetchResult:
+    """Raw HTTP response for a feed"""
+    status: int
+    content: bytes
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @property
+    def not_modified(self) -> bool:
+        """True if the server answered a conditional request with 304"""
+        return self.status == 304
 
 
 class FeedParser:
     """Parser for RSS status feeds"""
 
+    def __init__(self, timeout: float = 30.0):
+        self.timeout = timeout
+        self._session: Optional["requests.Session"] = None
+
+    @property
+    def session(self) -> "requests.Session":
+        """Pooled HTTP session, created on first use"""
+        if self._session is None:
+            import requests
+            self._session = requests.Session()
+            self._session.headers['User-Agent'] = USER_AGENT
+        return self._session
+
+    def close(self) -> None:
+        """Close pooled connections"""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def fetch_feed(
+        self,
+        url: str,
+        etag: Optional[str] = None,
+        modified: Optional[str] = None,
+        timeout: Optional[float] = None
+    ) -> Optional[FetchResult]:
+        """
+        Fetch the raw feed document, using conditional GET when possible.
+
+        Args:
+            url: The RSS feed URL to fetch
+            etag: ETag from the previous response, if any
+            modified: Last-Modified from the previous response, if any
+            timeout: Request timeout in seconds, defaults to self.timeout
+
+        Returns:
+            FetchResult (status 304 with empty content when unchanged),
+            or None if the request failed
+        """
+        import requests
+
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if modified:
+            headers['If-Modified-Since'] = modified
+
+        try:
+            response = self.session.get(
+                url,
+                headers=headers,
+                timeout=self.timeout if timeout is None else timeout
+            )
+            if response.status_code != 304:
+                response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            logger.error("Failed to fetch feed %s: %s", url, e)
+            return None
+
+        return FetchResult(
+            status=response.status_code,
+            content=response.content,
+            etag=response.headers.get('ETag'),
+            last_modified=response.headers.get('Last-Modified')
+        )
+
     @staticmethod
-    def parse_feed(url: str) -> Optional[feedparser.FeedParserDict]:
+    def parse_content(content: bytes, url: str = '') -> Optional["feedparser.FeedParserDict"]:
+        """
+        Parse an already fetched RSS document.
+
+        Args:
+            content: Raw feed document
+            url: Feed URL, used for log messages only
+
+        Returns:
+            Parsed feed object, or None if parsing failed
+        """
+        import feedparser
+
+        try:
+            feed = feedparser.parse(content)
+        except Exception as e:
+            logger.error("Failed to parse feed %s: %s", url, e)
+            return None
+
+        if feed.bozo:
+            logger.warning("Feed parsing warning for %s", url)
+            if hasattr(feed, 'bozo_exception'):
+                logger.warning("Parse exception: %s", feed.bozo_exception)
+
+        if not feed.entries:
+            logger.warning("No entries found in feed: %s", url)
+            return None
+
+        return feed
+
+    @staticmethod
+    def parse_feed(url: str) -> Optional["feedparser.FeedParserDict"]:
         """
         Parse an RSS feed from a URL.
 
@@ -35,26 +202,28 @@ class FeedParser:
         Returns:
             Parsed feed object, or None if parsing failed
         """
+        import feedparser
+
         try:
             feed = feedparser.parse(url)
 
             if feed.bozo:
-                logger.warning(f"Feed parsing warning for {url}")
+                logger.warning("Feed parsing warning for %s", url)
                 if hasattr(feed, 'bozo_exception'):
-                    logger.warning(f"Parse exception: {feed.bozo_exception}")
+                    logger.warning("Parse exception: %s", feed.bozo_exception)
 
             if not feed.entries:
-                logger.warning(f"No entries found in feed: {url}")
+                logger.warning("No entries found in feed: %s", url)
                 return None
 
             return feed
 
         except Exception as e:
-            logger.error(f"Failed to parse feed {url}: {e}")
+            logger.error("Failed to parse feed %s: %s", url, e)
             return None
 
     @staticmethod
-    def extract_latest_entry(feed: feedparser.FeedParserDict) -> Optional[FeedEntry]:
+    def extract_latest_entry(feed: "feedparser.FeedParserDict") -> Optional[FeedEntry]:
         """
         Extract the latest entry from a parsed feed.
 
@@ -66,9 +235,21 @@ class FeedParser:
         """
         if not feed.entries:
             return None
+        return FeedParser._to_entry(feed.entries[0])
+
+    @staticmethod
+    def extract_entries(feed: "feedparser.FeedParserDict", limit: int) -> List[FeedEntry]:
+        """
+        Extract up to `limit` entries from a parsed feed, newest first.
 
-        latest = feed.entries[0]
+        Entries without an ID or link are skipped.
+        """
+        entries = (FeedParser._to_entry(raw) for raw in feed.entries[:limit])
+        return [entry for entry in entries if entry is not None]
 
+    @staticmethod
+    def _to_entry(latest: Dict[str, Any]) -> Optional[FeedEntry]:
+        """Convert a feedparser entry into a FeedEntry"""
         # Get entry ID (prefer id, fallback to link)
         entry_id = latest.get('id', latest.get('link', ''))
         if not entry_id:
@@ -91,7 +272,7 @@ class FeedParser:
         # Get published date
         published = latest.get('published', latest.get('updated'))
 
-        return FeedEntry(
+        return FeedEntry.compact(
             entry_id=entry_id,
             title=title,
             description=description,
@@ -110,4 +291,42 @@ class FeedParser:
         Returns:
             Cleaned text without HTML tags
         """
-        return re.sub('<[^<]+?>', '', text).strip()
+        return _HTML_TAG.sub('', text).strip()
+
+
+def parse_entries(
+    content: bytes,
+    url: str = '',
+    limit: int = 1,
+    stream: bool = True
+) -> Optional[List[EntryFields]]:
+    """
+    Parse a feed document and extract its newest entries as plain tuples.
+
+    Meant to run in a worker process: it takes and returns only builtins,
+    so only the raw bytes and a few short strings cross the process
+    boundary instead of a whole FeedParserDict tree.
+
+    Args:
+        content: Raw feed document
+        url: Feed URL, used for log messages only
+        limit: Maximum number of entries to extract
+        stream: Try the streaming extractor before falling back to feedparser
+
+    Returns:
+        List of (entry_id, title, description, link, published) tuples,
+        or None if the document could not be parsed
+    """
+    entries = None
+    if stream:
+        from .stream_parser import extract_entries
+        entries = extract_entries(content, limit, url=url)
+    if entries is None:
+        feed = FeedParser.parse_content(content, url)
+        if not feed:
+            return None
+        entries = FeedParser.extract_entries(feed, limit)
+    return [
+        (entry.entry_id, entry.title, entry.description, entry.link, entry.published)
+        for entry in entries
+    ]
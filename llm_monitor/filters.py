@@ -69,7 +69,7 @@ class IncidentFilter:
         for keyword in cls.RESOLVED_KEYWORDS:
             if keyword in text:
                 logger.debug(
-                    f"Status update marked as resolved (keyword: '{keyword}')"
+                    "Status update marked as resolved (keyword: '%s')", keyword
                 )
                 return False
 
@@ -77,7 +77,7 @@ class IncidentFilter:
         for keyword in cls.INCIDENT_KEYWORDS:
             if keyword in text:
                 logger.debug(
-                    f"Active incident detected (keyword: '{keyword}')"
+                    "Active incident detected (keyword: '%s')", keyword
                 )
                 return True
 
@@ -0,0 +1,222 @@
+"""
+SQLite history of every feed entry seen, for analytics and deduplication
+"""
+
+import logging
+import re
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .feed_parser import FeedEntry
+from .incidents import RESOLVED, classify_stage
+
+logger = logging.getLogger(__name__)
+
+# (service_id, entry_id, title, description, link, published, content_hash,
+#  active, stage, started_at, resolved_at); times are UTC epoch seconds
+HistoryRow = Tuple[
+    str, str, str, str, str, Optional[str], str, bool, str, Optional[float], Optional[float]
+]
+
+# Timestamp Statuspage puts before each update ("Oct 25, 14:31 UTC"); with
+# updates newest first, the first one marked resolved is when it closed
+_RESOLVED_UPDATE = re.compile(
+    r'([A-Z][a-z]{2}) (\d{1,2}), (\d{1,2}):(\d{2}) UTC\s*(?:Resolved|Completed) - '
+)
+
+_MONTHS = {
+    name: number for number, name in enumerate(
+        ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+         'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'), start=1
+    )
+}
+
+
+def resolved_at(description: str, started_at: float) -> Optional[float]:
+    """
+    When the incident was resolved, from its update timestamps.
+
+    The timestamps carry no year; it is taken from the start and moved
+    forward when the incident crosses New Year.
+    """
+    match = _RESOLVED_UPDATE.search(description)
+    if match is None or match.group(1) not in _MONTHS:
+        return None
+    month, day, hour, minute = (
+        _MONTHS[match.group(1)], int(match.group(2)), int(match.group(3)), int(match.group(4))
+    )
+    year = datetime.fromtimestamp(started_at, timezone.utc).year
+    try:
+        when = datetime(year, month, day, hour, minute, tzinfo=timezone.utc).timestamp()
+        if when < started_at - 86400:
+            when = datetime(year + 1, month, day, hour, minute, tzinfo=timezone.utc).timestamp()
+    except ValueError:
+        return None
+    return max(when, started_at)
+
+
+def entry_row(service_id: str, entry: FeedEntry, active: bool) -> HistoryRow:
+    """History row for a classified entry"""
+    stage = classify_stage(entry.title, entry.description)
+    started = entry.published_at
+    resolved = None
+    if stage == RESOLVED and started is not None:
+        resolved = resolved_at(entry.description, started)
+    return (
+        service_id,
+        entry.entry_id,
+        entry.title,
+        entry.description,
+        entry.link,
+        entry.published,
+        entry.fingerprint(),
+        active,
+        stage,
+        started,
+        resolved
+    )
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    service_id   TEXT NOT NULL,
+    entry_id     TEXT NOT NULL,
+    title        TEXT NOT NULL,
+    description  TEXT NOT NULL,
+    link         TEXT NOT NULL,
+    published    TEXT,
+    content_hash TEXT NOT NULL,
+    active       INTEGER NOT NULL,
+    stage        TEXT NOT NULL,
+    started_at   REAL,
+    resolved_at  REAL,
+    ingested_at  TEXT NOT NULL,
+    PRIMARY KEY (service_id, entry_id)
+) WITHOUT ROWID
+"""
+
+# Re-ingesting an entry keeps one row, updated only if its content changed
+_UPSERT = """
+INSERT INTO entries (
+    service_id, entry_id, title, description, link, published,
+    content_hash, active, stage, started_at, resolved_at, ingested_at
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (service_id, entry_id) DO UPDATE SET
+    title = excluded.title,
+    description = excluded.description,
+    link = excluded.link,
+    published = excluded.published,
+    content_hash = excluded.content_hash,
+    active = excluded.active,
+    stage = excluded.stage,
+    started_at = excluded.started_at,
+    resolved_at = excluded.resolved_at,
+    ingested_at = excluded.ingested_at
+WHERE entries.content_hash != excluded.content_hash
+"""
+
+
+class HistoryStore:
+    """Entry history in a single SQLite file, written in large transactions"""
+
+    # Rows per transaction for insert_many()
+    BATCH_SIZE = 10000
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Written from the monitor thread, read from the status server
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+
+    def insert_many(self, rows: Iterable[HistoryRow]) -> int:
+        """
+        Upsert entries, committing once per BATCH_SIZE rows.
+
+        Returns:
+            Number of rows inserted or changed
+        """
+        ingested_at = datetime.now().isoformat()
+        changed = 0
+        batch: List[Tuple[Any, ...]] = []
+        with self._lock:
+            for row in rows:
+                batch.append((*row, ingested_at))
+                if len(batch) >= self.BATCH_SIZE:
+                    changed += self._write(batch)
+                    batch = []
+            if batch:
+                changed += self._write(batch)
+        return changed
+
+    def _write(self, batch: List[Tuple[Any, ...]]) -> int:
+        with self._conn:
+            before = self._conn.total_changes
+            self._conn.executemany(_UPSERT, batch)
+            return self._conn.total_changes - before
+
+    def count(self, service_id: Optional[str] = None) -> int:
+        """Number of stored entries, optionally for one service"""
+        with self._lock:
+            if service_id is None:
+                row = self._conn.execute('SELECT COUNT(*) FROM entries').fetchone()
+            else:
+                row = self._conn.execute(
+                    'SELECT COUNT(*) FROM entries WHERE service_id = ?', (service_id,)
+                ).fetchone()
+        return row[0]
+
+    def entries(self, service_id: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Stored entries as dicts, optionally for one service"""
+        query = 'SELECT * FROM entries'
+        params: Tuple[str, ...] = ()
+        if service_id is not None:
+            query += ' WHERE service_id = ?'
+            params = (service_id,)
+        with self._lock:
+            cursor = self._conn.execute(query, params)
+            columns = [column[0] for column in cursor.description]
+            rows = cursor.fetchall()
+        for row in rows:
+            yield dict(zip(columns, row))
+
+    def incident_times(
+        self,
+        services: Optional[Sequence[str]] = None
+    ) -> Tuple[List[Tuple[str, int]], List[Tuple[float, Optional[float], bool]]]:
+        """
+        Start and resolution times of every dated incident, for analytics.
+
+        Scheduled maintenance is left out.
+
+        Returns:
+            (service_id, count) pairs in service order, and the
+            (started_at, resolved_at, still open) rows grouped in the same order
+        """
+        where = "started_at IS NOT NULL AND title NOT LIKE '%maintenance%'"
+        params: Tuple[str, ...] = ()
+        if services:
+            where += f" AND service_id IN ({', '.join('?' * len(services))})"
+            params = tuple(services)
+        with self._lock:
+            counts = self._conn.execute(
+                f'SELECT service_id, COUNT(*) FROM entries WHERE {where} '
+                'GROUP BY service_id ORDER BY service_id', params
+            ).fetchall()
+            times = self._conn.execute(
+                f"SELECT started_at, resolved_at, stage != '{RESOLVED}' FROM entries "
+                f'WHERE {where} ORDER BY service_id', params
+            ).fetchall()
+        return counts, times
+
+    def close(self) -> None:
+        """Close the database"""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,140 @@
+"""
+Embedded HTTP server for monitoring endpoints
+"""
+
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, NamedTuple, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+logger = logging.getLogger(__name__)
+
+# A route handler returns (status code, content type, body)
+Response = Tuple[int, str, bytes]
+RouteHandler = Callable[[], Response]
+
+# Largest POST body accepted; Statuspage webhook payloads are a few KiB
+MAX_BODY = 256 * 1024
+
+TEXT = 'text/plain; charset=utf-8'
+
+
+class Request(NamedTuple):
+    """A POST request: path without the query, first value of each query parameter, headers, body"""
+    path: str
+    query: Dict[str, str]
+    headers: Dict[str, str]
+    body: bytes
+
+
+PostHandler = Callable[[Request], Response]
+
+
+class EmbeddedServer:
+    """
+    Minimal threaded HTTP server running in a daemon thread.
+
+    Each request is served on its own thread, so slow or frequent
+    scrapes never block the monitoring loop.
+    """
+
+    def __init__(self, host: str = '0.0.0.0', port: int = 0):
+        self.host = host
+        self.port = port
+        self._routes: Dict[str, RouteHandler] = {}
+        self._post_routes: Dict[str, PostHandler] = {}
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def add_route(self, path: str, handler: RouteHandler) -> None:
+        """Register a GET handler for an exact path"""
+        self._routes[path] = handler
+
+    def add_post_route(self, prefix: str, handler: PostHandler) -> None:
+        """Register a POST handler for every path under `prefix` (e.g. '/push/')"""
+        self._post_routes[prefix] = handler
+
+    def start(self) -> None:
+        """Bind the socket and start serving in a background thread"""
+        routes = self._routes
+        post_routes = self._post_routes
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                handler = routes.get(self.path.split('?', 1)[0])
+                if handler is None:
+                    self._reply(404, TEXT, b'Not Found\n')
+                    return
+                try:
+                    status, content_type, body = handler()
+                except Exception as e:
+                    logger.error("HTTP handler for %s failed: %s", self.path, e)
+                    status, content_type, body = 500, TEXT, b'Internal Server Error\n'
+                self._reply(status, content_type, body)
+
+            def do_POST(self) -> None:
+                parts = urlsplit(self.path)
+                handler = next(
+                    (h for prefix, h in post_routes.items() if parts.path.startswith(prefix)), None
+                )
+                if handler is None:
+                    self._reply(404, TEXT, b'Not Found\n')
+                    return
+                try:
+                    length = int(self.headers.get('Content-Length', ''))
+                except ValueError:
+                    self._reply(411, TEXT, b'Length Required\n')
+                    return
+                if length < 0:
+                    # rfile.read(-1) would wait for the client to close the connection
+                    self.close_connection = True
+                    self._reply(400, TEXT, b'Bad Request\n')
+                    return
+                if length > MAX_BODY:
+                    self.close_connection = True
+                    self._reply(413, TEXT, b'Payload Too Large\n')
+                    return
+                request = Request(
+                    parts.path,
+                    {name: values[0] for name, values in parse_qs(parts.query).items()},
+                    {name.lower(): value for name, value in self.headers.items()},
+                    self.rfile.read(length)
+                )
+                try:
+                    status, content_type, body = handler(request)
+                except Exception as e:
+                    logger.error("HTTP handler for POST %s failed: %s", parts.path, e)
+                    status, content_type, body = 500, TEXT, b'Internal Server Error\n'
+                self._reply(status, content_type, body)
+
+            def _reply(self, status: int, content_type: str, body: bytes) -> None:
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args) -> None:
+                logger.debug("HTTP %s " + format, self.address_string(), *args)
+
+        self._httpd = ThreadingHTTPServer((self.host, self.port), _Handler)
+        self._httpd.daemon_threads = True
+        self.port = self._httpd.server_address[1]
+
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever,
+            name='llm-monitor-httpd',
+            daemon=True
+        )
+        self._thread.start()
+        logger.info("HTTP server listening on %s:%s", self.host, self.port)
+
+    def stop(self) -> None:
+        """Stop serving and close the socket"""
+        if self._httpd is None:
+            return
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        self._httpd = None
+        self._thread = None
@@ -0,0 +1,170 @@
+"""
+Incident lifecycle tracking
+"""
+
+import logging
+import re
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from .feed_parser import FeedEntry
+from .filters import IncidentFilter
+from .state import StateManager
+
+logger = logging.getLogger(__name__)
+
+# Incident stages, in the order Statuspage moves through them
+INVESTIGATING = 'investigating'
+IDENTIFIED = 'identified'
+MONITORING = 'monitoring'
+RESOLVED = 'resolved'
+
+# Severities used for notification routing, most severe first
+CRITICAL = 'critical'
+MAJOR = 'major'
+MINOR = 'minor'
+MAINTENANCE = 'maintenance'
+SEVERITIES = (CRITICAL, MAJOR, MINOR, MAINTENANCE)
+
+# Transitions reported by IncidentTracker.observe()
+OPENED = 'opened'
+UPDATED = 'updated'
+
+# Only the newest entry of a feed is observed, so an incident that stops
+# being the newest before it resolves is never closed; beyond this many
+# per service the least recently updated one is dropped
+MAX_OPEN_INCIDENTS = 10
+
+# Statuspage prefixes every update with its stage ("<strong>Identified</strong> - ...");
+# after HTML is stripped the newest one is the first match in the description
+_STAGE_MARKER = re.compile(
+    r'(Investigating|Identified|Monitoring|Update|Resolved|Completed|Postmortem) - '
+)
+
+# Statuspage impact wording and common phrasings, checked in order; maintenance
+# first so "scheduled maintenance: API unavailable" is not paged as an outage
+_SEVERITY_MARKERS = (
+    (MAINTENANCE, re.compile(r'maintenance')),
+    (CRITICAL, re.compile(r'major outage|full outage|\bdown\b|unavailable|not loading|inaccessible')),
+    (MAJOR, re.compile(r'partial outage|outage|error|failing|failure|disruption')),
+)
+
+_STAGES = {
+    'Investigating': INVESTIGATING,
+    'Identified': IDENTIFIED,
+    'Monitoring': MONITORING,
+    'Resolved': RESOLVED,
+    'Completed': RESOLVED,
+    'Postmortem': RESOLVED,
+}
+
+
+def classify_stage(title: str, description: str, previous: Optional[str] = None) -> str:
+    """
+    Work out an incident's current stage from its latest entry.
+
+    Uses the stage marker of the newest update when there is one; plain
+    "Update" posts keep the previous stage. Without markers, the filter's
+    resolution keywords decide between RESOLVED and the previous stage.
+
+    Args:
+        title: Entry title
+        description: Entry description with HTML removed
+        previous: Stage recorded for the incident so far, if any
+    """
+    match = _STAGE_MARKER.search(description)
+    if match and match.group(1) in _STAGES:
+        return _STAGES[match.group(1)]
+    if not match:
+        text = f"{title} {description}".lower()
+        if any(keyword in text for keyword in IncidentFilter.RESOLVED_KEYWORDS):
+            return RESOLVED
+    return previous or INVESTIGATING
+
+
+def classify_severity(title: str, description: str) -> str:
+    """
+    Rough severity of an incident from its wording.
+
+    The title decides when it matches, since descriptions accumulate
+    every earlier update; anything unmatched is MINOR (degraded
+    performance, elevated latency and the like).
+    """
+    for text in (title.lower(), description.lower()):
+        for severity, marker in _SEVERITY_MARKERS:
+            if marker.search(text):
+                return severity
+    return MINOR
+
+
+class IncidentTracker:
+    """
+    Open incidents per service, kept in StateManager so they survive restarts.
+
+    The table is a dict of dicts keyed by service and incident ID inside
+    each service's state, so lookups never scan feed history and every
+    change is saved with the rest of the state.
+    """
+
+    def __init__(self, state_manager: StateManager):
+        self.state_manager = state_manager
+
+    def observe(self, service_id: str, entry: FeedEntry, is_active: bool) -> Optional[str]:
+        """
+        Update the table from a newly classified entry.
+
+        Only active entries open incidents; once open, an incident follows
+        its stage until it resolves and is removed.
+
+        Returns:
+            OPENED, UPDATED (stage or title changed), RESOLVED, or None
+        """
+        record = self.state_manager.get_incidents(service_id).get(entry.entry_id)
+        previous = record['stage'] if record else None
+        stage = classify_stage(entry.title, entry.description, previous)
+
+        if stage == RESOLVED:
+            if record is None:
+                return None
+            self.state_manager.remove_incident(service_id, entry.entry_id)
+            logger.info("Incident resolved for %s: %s", service_id, entry.title)
+            return RESOLVED
+
+        now = datetime.now().isoformat()
+        if record is None:
+            if not is_active:
+                return None
+            self.state_manager.set_incident(service_id, entry.entry_id, {
+                'title': entry.title,
+                'link': entry.link,
+                'stage': stage,
+                'opened_at': now,
+                'updated_at': now,
+            })
+            logger.info("Incident opened for %s (%s): %s", service_id, stage, entry.title)
+            self._evict_stale(service_id)
+            return OPENED
+
+        if stage == previous and entry.title == record['title']:
+            return None
+        self.state_manager.set_incident(service_id, entry.entry_id, {
+            **record, 'title': entry.title, 'stage': stage, 'updated_at': now
+        })
+        logger.info("Incident for %s moved to %s: %s", service_id, stage, entry.title)
+        return UPDATED
+
+    def _evict_stale(self, service_id: str) -> None:
+        """Keep at most MAX_OPEN_INCIDENTS open incidents for a service"""
+        incidents = self.state_manager.get_incidents(service_id)
+        while len(incidents) > MAX_OPEN_INCIDENTS:
+            stale = min(incidents, key=lambda incident_id: incidents[incident_id]['updated_at'])
+            logger.warning("Dropping stale open incident for %s: %s", service_id, stale)
+            self.state_manager.remove_incident(service_id, stale)
+
+    def is_degraded(self, service_id: str) -> bool:
+        """True if the service has at least one open incident"""
+        return bool(self.state_manager.get_incidents(service_id))
+
+    def open_incidents(self, service_id: str) -> Dict[str, Dict[str, Any]]:
+        """Open incidents for a service, keyed by incident ID"""
+        return self.state_manager.get_incidents(service_id)
@@ -0,0 +1,204 @@
+"""
+Queue-based logging pipeline with structured JSON output
+"""
+
+import atexit
+import json
+import logging
+import queue
+import sys
+import time
+from datetime import date, datetime, timedelta
+from enum import Enum
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Attributes every LogRecord has; anything else was passed via extra=
+_RECORD_ATTRS = frozenset(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {
+    'message', 'asctime', 'taskName'
+}
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as one JSON object per line"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            'ts': self.formatTime(record, DATE_FORMAT),
+            'epoch': record.created,
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+            'thread': record.threadName,
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and not key.startswith('_'):
+                entry[key] = value
+        if record.exc_info:
+            entry['exc_info'] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Sample high-volume messages below a given level.
+
+    Records are grouped by logger and unformatted message template. In
+    each window the first `burst` records of a template pass, then only
+    one in every `rate`. Counters are not locked, so under heavy
+    concurrency the sampling is approximate.
+    """
+
+    def __init__(
+        self,
+        burst: int = 100,
+        rate: int = 100,
+        window: float = 60.0,
+        max_level: int = logging.WARNING
+    ):
+        super().__init__()
+        self.burst = burst
+        self.rate = max(1, rate)
+        self.window = window
+        self.max_level = max_level
+        self._counts: Dict[Tuple[str, Any], int] = {}
+        self._window_start = time.monotonic()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= self.max_level:
+            return True
+
+        now = time.monotonic()
+        if now - self._window_start >= self.window:
+            self._counts = {}
+            self._window_start = now
+
+        key = (record.name, record.msg)
+        count = self._counts.get(key, 0) + 1
+        self._counts[key] = count
+        if count <= self.burst:
+            return True
+        return (count - self.burst) % self.rate == 0
+
+
+# Argument types that cannot change between logging and formatting
+_IMMUTABLE = (str, bytes, int, float, complex, type(None), Enum, Path, date, datetime, timedelta)
+
+
+def _frozen(value: Any) -> bool:
+    if isinstance(value, (tuple, frozenset)):
+        return all(_frozen(item) for item in value)
+    return isinstance(value, _IMMUTABLE)
+
+
+class LazyQueueHandler(QueueHandler):
+    """
+    QueueHandler that enqueues records untouched when that is safe.
+
+    The stock handler formats the message on the calling thread before
+    enqueueing; since the queue never leaves the process, formatting can
+    wait for the listener thread. Records whose arguments could change
+    in the meantime (dicts, lists, exceptions, state objects) are
+    formatted right away, so they show the values at logging time.
+    Tracebacks are still formatted on the listener thread: they hold
+    file names and line numbers, not variable values.
+    """
+
+    # Set by setup_logging(); stopped by stop_logging()
+    listener: Optional[QueueListener] = None
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if record.args and not _frozen(record.args):
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+
+def setup_logging(
+    log_level: str = "INFO",
+    log_file: Optional[Path] = Path("logs/monitor.log"),
+    json_format: bool = False,
+    max_bytes: int = 10 * 1024 * 1024,
+    backup_count: int = 5,
+    sample_burst: int = 0,
+    sample_rate: int = 100
+) -> QueueListener:
+    """
+    Route all logging through a queue drained by a background thread.
+
+    The calling thread only pays for the level check, optional sampling
+    and a queue put; formatting and disk/console I/O happen on the
+    listener thread.
+
+    Args:
+        log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        log_file: Rotating log file, or None for console only
+        json_format: Emit one JSON object per line instead of plain text
+        max_bytes: Rotate the log file once it reaches this size
+        backup_count: Number of rotated files to keep
+        sample_burst: Records per template and minute logged before
+            sampling starts; 0 disables sampling
+        sample_rate: Keep one in this many records once sampling starts
+
+    Returns:
+        The running QueueListener (stopped by stop_logging(), which runs at exit)
+    """
+    formatter: logging.Formatter
+    if json_format:
+        formatter = JsonFormatter()
+    else:
+        formatter = logging.Formatter(LOG_FORMAT, DATE_FORMAT)
+
+    handlers = [logging.StreamHandler(sys.stdout)]
+    if log_file is not None:
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+        handlers.append(RotatingFileHandler(
+            log_file,
+            maxBytes=max_bytes,
+            backupCount=backup_count,
+            encoding="utf-8"
+        ))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    queue_handler = LazyQueueHandler(log_queue)
+    if sample_burst > 0:
+        queue_handler.addFilter(SamplingFilter(burst=sample_burst, rate=sample_rate))
+
+    stop_logging()
+    root = logging.getLogger()
+    for existing in list(root.handlers):
+        root.removeHandler(existing)
+
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    queue_handler.listener = listener
+    listener.start()
+    root.addHandler(queue_handler)
+    root.setLevel(getattr(logging, log_level.upper()))
+    atexit.register(stop_logging)
+
+    # Set third-party loggers to WARNING to reduce noise
+    logging.getLogger("urllib3").setLevel(logging.WARNING)
+    logging.getLogger("requests").setLevel(logging.WARNING)
+
+    return listener
+
+
+def stop_logging() -> None:
+    """
+    Write out every queued record and stop the listener thread.
+
+    Runs at exit; call it directly before os._exit(), which skips atexit
+    handlers and logging.shutdown() alone does not drain the queue. Safe
+    to call more than once.
+    """
+    for handler in logging.getLogger().handlers:
+        listener = getattr(handler, 'listener', None)
+        if isinstance(handler, LazyQueueHandler) and listener is not None:
+            handler.listener = None
+            listener.stop()
@@ -0,0 +1,385 @@
+"""
+Prometheus-compatible metrics for LLM Status Monitor
+"""
+
+import math
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Latency buckets in seconds, covering fast parses up to slow fetches
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0
+)
+
+# Detection buckets in seconds, from one poll interval or less up to six hours
+DETECTION_BUCKETS: Tuple[float, ...] = (
+    15.0, 30.0, 60.0, 120.0, 300.0, 600.0, 900.0, 1800.0, 3600.0, 7200.0, 21600.0
+)
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value the way the Prometheus text format expects"""
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    if value == int(value):
+        return str(int(value))
+    return repr(value)
+
+
+def _format_labels(names: Tuple[str, ...], values: Tuple[str, ...]) -> str:
+    """Render a label set as {name="value",...}"""
+    if not names:
+        return ''
+    pairs = ','.join(
+        f'{name}="{_escape(value)}"' for name, value in zip(names, values)
+    )
+    return '{' + pairs + '}'
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+class _Metric:
+    """Base class for labelled metric families"""
+
+    TYPE = ''
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames: Tuple[str, ...] = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        if not self.labelnames:
+            self._children[()] = self._new_child()
+
+    def labels(self, *values: str):
+        """
+        Get (or create) the child for a label set.
+
+        Children are meant to be bound once, outside the hot path, and
+        then updated directly.
+        """
+        if len(values) != len(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {self.labelnames}, got {values}"
+            )
+        child = self._children.get(values)
+        if child is None:
+            child = self._children.setdefault(values, self._new_child())
+        return child
+
+    def remove_matching(self, label: str, value: str) -> None:
+        """Drop every child whose `label` equals `value`"""
+        if label not in self.labelnames:
+            return
+        index = self.labelnames.index(label)
+        for values in [v for v in self._children if v[index] == value]:
+            del self._children[values]
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.TYPE}",
+        ]
+        lines.extend(self._samples())
+        return '\n'.join(lines)
+
+
+class _CounterChild:
+    __slots__ = ('value',)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+
+class Counter(_Metric):
+    """Monotonically increasing counter"""
+
+    TYPE = 'counter'
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increment the unlabelled counter"""
+        self._children[()].inc(amount)
+
+    def _samples(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, values)} "
+            f"{_format_value(child.value)}"
+            for values, child in list(self._children.items())
+        ]
+
+
+class _GaugeChild:
+    __slots__ = ('value',)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+
+class Gauge(_Metric):
+    """Value that can go up and down"""
+
+    TYPE = 'gauge'
+
+    def _new_child(self) -> _GaugeChild:
+        return _GaugeChild()
+
+    def set(self, value: float) -> None:
+        """Set the unlabelled gauge"""
+        self._children[()].set(value)
+
+    def _samples(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, values)} "
+            f"{_format_value(child.value)}"
+            for values, child in list(self._children.items())
+        ]
+
+
+class _HistogramChild:
+    __slots__ = ('upper_bounds', 'counts', 'sum', 'count')
+
+    def __init__(self, upper_bounds: Tuple[float, ...]):
+        self.upper_bounds = upper_bounds
+        # One slot per bucket plus the implicit +Inf bucket, allocated once
+        self.counts = [0] * (len(upper_bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.upper_bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class Histogram(_Metric):
+    """Distribution of observations over fixed buckets"""
+
+    TYPE = 'histogram'
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS
+    ):
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames)
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        """Record an observation on the unlabelled histogram"""
+        self._children[()].observe(value)
+
+    def _samples(self) -> List[str]:
+        samples = []
+        bucket_labels = self.labelnames + ('le',)
+        for values, child in list(self._children.items()):
+            counts = list(child.counts)
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (math.inf,), counts):
+                cumulative += bucket_count
+                labels = _format_labels(bucket_labels, values + (_format_value(bound),))
+                samples.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, values)
+            samples.append(f"{self.name}_sum{labels} {_format_value(child.sum)}")
+            samples.append(f"{self.name}_count{labels} {cumulative}")
+        return samples
+
+
+class MetricsRegistry:
+    """Collection of metric families rendered together"""
+
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def metrics(self) -> List[_Metric]:
+        return list(self._metrics)
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format"""
+        return '\n'.join(metric.render() for metric in list(self._metrics)) + '\n'
+
+
+class ServiceMetrics:
+    """Metric children pre-bound to a single service"""
+
+    __slots__ = (
+        'fetch_latency', 'parse_latency', 'filter_latency', 'notify_latency',
+        'errors', 'not_modified', 'unchanged', 'deferred', 'push_fed',
+        'notifications_sent', 'notifications_failed', 'last_success', 'open_incidents',
+        'publish_to_fetch', 'fetch_to_classify', 'classify_to_ack', 'detection',
+        'component_transitions', 'components_degraded',
+        'duplicates_merged', 'duplicates_followed_up',
+    )
+
+
+class MonitorMetrics:
+    """Metrics exposed by the status monitor"""
+
+    CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None):
+        self.registry = registry or MetricsRegistry()
+        r = self.registry
+
+        self.fetch_latency = r.histogram(
+            'llm_monitor_fetch_duration_seconds',
+            'Time spent fetching a feed over HTTP', ('service',)
+        )
+        self.parse_latency = r.histogram(
+            'llm_monitor_parse_duration_seconds',
+            'Time spent parsing a feed and extracting its latest entry', ('service',)
+        )
+        self.filter_latency = r.histogram(
+            'llm_monitor_filter_duration_seconds',
+            'Time spent classifying an entry', ('service',)
+        )
+        self.notify_latency = r.histogram(
+            'llm_monitor_notify_duration_seconds',
+            'Time spent delivering a notification', ('service',)
+        )
+        self.publish_to_fetch = r.histogram(
+            'llm_monitor_alert_publish_to_fetch_seconds',
+            'Time from an incident\'s publish date to the fetch that found it',
+            ('service',), DETECTION_BUCKETS
+        )
+        self.fetch_to_classify = r.histogram(
+            'llm_monitor_alert_fetch_to_classify_seconds',
+            'Time from fetching an alerted entry to classifying it', ('service',)
+        )
+        self.classify_to_ack = r.histogram(
+            'llm_monitor_alert_classify_to_ack_seconds',
+            'Time from classifying an alerted entry to the webhook accepting it', ('service',)
+        )
+        self.detection = r.histogram(
+            'llm_monitor_alert_detection_seconds',
+            'Time from an incident\'s publish date to the webhook accepting its alert',
+            ('service',), DETECTION_BUCKETS
+        )
+        self.cycle_duration = r.histogram(
+            'llm_monitor_cycle_duration_seconds',
+            'Duration of a full check cycle'
+        )
+        self.cycles = r.counter(
+            'llm_monitor_cycles_total',
+            'Number of completed check cycles'
+        )
+        self.errors = r.counter(
+            'llm_monitor_errors_total',
+            'Number of failed feed checks', ('service',)
+        )
+        self.skips = r.counter(
+            'llm_monitor_feed_skips_total',
+            'Number of feed checks with nothing new to process', ('service', 'reason')
+        )
+        self.pushes = r.counter(
+            'llm_monitor_pushes_total',
+            'Number of webhook pushes received', ('result',)
+        )
+        self.notifications = r.counter(
+            'llm_monitor_notifications_total',
+            'Number of notification attempts', ('service', 'result')
+        )
+        self.last_success = r.gauge(
+            'llm_monitor_last_success_timestamp_seconds',
+            'Unix time of the last successful check', ('service',)
+        )
+        self.open_incidents = r.gauge(
+            'llm_monitor_open_incidents',
+            'Number of incidents currently open', ('service',)
+        )
+
+        self.component_transitions = r.counter(
+            'llm_monitor_component_transitions_total',
+            'Number of watched component status changes', ('service',)
+        )
+        self.components_degraded = r.gauge(
+            'llm_monitor_components_degraded',
+            'Number of watched components not operational', ('service',)
+        )
+
+        self.duplicates = r.counter(
+            'llm_monitor_duplicate_alerts_total',
+            'Number of new-incident alerts folded into another service\'s alert',
+            ('service', 'result')
+        )
+
+        self._services: Dict[str, ServiceMetrics] = {}
+
+    def service(self, service_id: str) -> ServiceMetrics:
+        """Get the metric children bound to a service"""
+        bound = self._services.get(service_id)
+        if bound is None:
+            bound = ServiceMetrics()
+            bound.fetch_latency = self.fetch_latency.labels(service_id)
+            bound.parse_latency = self.parse_latency.labels(service_id)
+            bound.filter_latency = self.filter_latency.labels(service_id)
+            bound.notify_latency = self.notify_latency.labels(service_id)
+            bound.errors = self.errors.labels(service_id)
+            bound.not_modified = self.skips.labels(service_id, 'not_modified')
+            bound.unchanged = self.skips.labels(service_id, 'unchanged')
+            bound.deferred = self.skips.labels(service_id, 'deferred')
+            bound.push_fed = self.skips.labels(service_id, 'push_fed')
+            bound.notifications_sent = self.notifications.labels(service_id, 'sent')
+            bound.notifications_failed = self.notifications.labels(service_id, 'failed')
+            bound.last_success = self.last_success.labels(service_id)
+            bound.open_incidents = self.open_incidents.labels(service_id)
+            bound.publish_to_fetch = self.publish_to_fetch.labels(service_id)
+            bound.fetch_to_classify = self.fetch_to_classify.labels(service_id)
+            bound.classify_to_ack = self.classify_to_ack.labels(service_id)
+            bound.detection = self.detection.labels(service_id)
+            bound.component_transitions = self.component_transitions.labels(service_id)
+            bound.components_degraded = self.components_degraded.labels(service_id)
+            bound.duplicates_merged = self.duplicates.labels(service_id, 'merged')
+            bound.duplicates_followed_up = self.duplicates.labels(service_id, 'follow_up')
+            self._services[service_id] = bound
+        return bound
+
+    def remove_service(self, service_id: str) -> None:
+        """Stop exporting series for a service that is no longer monitored"""
+        self._services.pop(service_id, None)
+        for metric in self.registry.metrics():
+            metric.remove_matching('service', service_id)
+
+    def http_handler(self):
+        """Route handler for the embedded HTTP server"""
+        return 200, self.CONTENT_TYPE, self.registry.render().encode('utf-8')
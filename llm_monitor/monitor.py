@@ -2,166 +2,1128 @@
 Main monitoring logic for LLM Status Monitor
 """
 
+import os
+import signal
+import threading
 import time
 import logging
+from collections import deque
 from datetime import datetime
-from typing import Optional
+from typing import TYPE_CHECKING, Dict, FrozenSet, List, Optional, Sequence, Tuple
 
-from .config import Config, FEEDS, FeedConfig
-from .notifiers import create_notifier, Notifier
+from .config import Config, FeedConfig
+from .notifiers import NEW, RESOLVED, UPDATED, create_notifier, Notifier
 from .filters import IncidentFilter
-from .feed_parser import FeedParser
+from .incidents import RESOLVED as INCIDENT_RESOLVED, IncidentTracker, classify_severity
+from .logging_setup import stop_logging
+from .feed_parser import FeedEntry, FeedParser, FetchResult
 from .state import StateManager
+from .metrics import MonitorMetrics
+from .tracing import Tracer, FileSpanExporter
+
+# Only needed when the HTTP server, profiling, the parse pool, history, recording,
+# routing, the SLO log, component tracking or duplicate merging is enabled
+if TYPE_CHECKING:
+    from .components import Component
+    from .dedup import DuplicateIndex, HeldAlert
+    from .httpd import EmbeddedServer
+    from .history import HistoryRow, HistoryStore
+    from .parse_pool import ParsePool
+    from .profiling import CycleProfiler
+    from .replay import FeedRecorder
+    from .routing import RoutingTable
+    from .slo import SloLog
 
 logger = logging.getLogger(__name__)
 
+# Exit codes for run_once()
+EXIT_OK = 0
+EXIT_ERROR = 1
+EXIT_FEED_ERRORS = 2
+
 
 class StatusMonitor:
     """Main status monitoring orchestrator"""
 
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, feeds: Optional[Dict[str, FeedConfig]] = None):
         self.config = config
+        self.feeds = feeds if feeds is not None else config.load_feeds()
         self.state_manager = StateManager(config.state_file)
+        self.incidents = IncidentTracker(self.state_manager)
         self.notifier: Optional[Notifier] = None
+        # Per-destination notifiers from ROUTES_FILE; unrouted incidents use self.notifier
+        self.routes: Optional["RoutingTable"] = config.load_routes()
         self.filter = IncidentFilter()
         self.parser = FeedParser()
+        self.metrics = MonitorMetrics()
+        self.http_server: Optional["EmbeddedServer"] = None
+
+        # Set by request_stop() or SIGTERM/SIGINT
+        self._stop = threading.Event()
+        # Interrupts the sleep between cycles on stop or reload requests
+        self._wakeup = threading.Event()
+        self._reload_requested = False
+        self._watched_files = config.watched_files()
+        self._shutdown_timer: Optional[threading.Timer] = None
+        # Feeds that ran out of cycle budget, checked first next cycle
+        self._deferred: List[str] = []
+        # Unix time the last check cycle completed, 0 before the first one
+        self.last_cycle_at = 0.0
+
+        # Tracing is a no-op unless a hook is registered
+        self.tracer = Tracer()
+        if config.trace_file:
+            self.tracer.add_hook(FileSpanExporter(config.trace_file))
+
+        # Profiling wraps sampled cycles only when enabled
+        self.profiler: Optional["CycleProfiler"] = None
+        if config.profile:
+            from .profiling import CycleProfiler
+            self.profiler = CycleProfiler(
+                output_dir=config.profile.output_dir,
+                every=config.profile.every,
+                threshold_ms=config.profile.threshold_ms,
+                keep=config.profile.keep,
+                top=config.profile.top
+            )
+
+        # Worker processes for parsing, started on the first document
+        self.parse_pool: Optional["ParsePool"] = None
+        if config.parse_workers > 0:
+            from .parse_pool import ParsePool
+            self.parse_pool = ParsePool(config.parse_workers)
+
+        # New entries are buffered and written to the history once per cycle
+        self.history: Optional["HistoryStore"] = None
+        self._history_rows: List["HistoryRow"] = []
+        if config.history_file is not None:
+            from .history import HistoryStore
+            self.history = HistoryStore(config.history_file)
+
+        # Raw responses are archived for offline replay when RECORD_FILE is set
+        self.recorder: Optional["FeedRecorder"] = None
+        if config.record_file is not None:
+            from .replay import FeedRecorder
+            self.recorder = FeedRecorder(config.record_file)
+
+        # Delivered alerts' detection latency is logged for the slo command when SLO_FILE is set
+        self.slo_log: Optional["SloLog"] = None
+        if config.slo_file is not None:
+            from .slo import SloLog
+            self.slo_log = SloLog(config.slo_file)
+        # Wall and perf_counter time each service's last fetch completed
+        self._fetched: Dict[str, Tuple[float, float]] = {}
+
+        # With DEDUP_WINDOW set, new-incident alerts are held until the end of the
+        # cycle, so the same outage on several services goes out as one alert
+        self.dedup: Optional["DuplicateIndex"] = None
+        self._held_alerts: List["HeldAlert"] = []
+        if config.dedup_window > 0:
+            from .dedup import DuplicateIndex
+            self.dedup = DuplicateIndex(config.dedup_window, config.dedup_threshold)
+
+        # Webhook pushes waiting for the loop: (service, entry, wall time, perf_counter)
+        self._pushes: deque = deque()
+        # Services that receive pushes, with the monotonic time they were last polled;
+        # they are only polled every RECONCILE_INTERVAL to catch missed pushes
+        self._push_fed: Dict[str, float] = {}
+        # Push-fed services whose feed is not due this cycle; pushes carry
+        # no component statuses, so their summary is still polled
+        self._feed_skipped: FrozenSet[str] = frozenset()
+
+        # Bind per-service metrics up front, keeping the hot path allocation-free
+        for service_id in self.feeds:
+            self.metrics.service(service_id)
+
+        self._create_notifier()
 
-        # Initialize notifier if configured
-        webhook_url = config.get_webhook_url()
-        if webhook_url and config.is_configured():
+    def _create_notifier(self) -> None:
+        """(Re)create the notifier from the current config"""
+        if isinstance(self.notifier, Notifier):
+            self.notifier.close()
+        webhook_url = self.config.get_webhook_url()
+        if webhook_url and self.config.is_configured():
             self.notifier = create_notifier(
-                config.notification_type,
+                self.config.notification_type,
                 webhook_url
             )
+        else:
+            self.notifier = None
 
-    def check_feed(self, service_id: str, feed_config: FeedConfig) -> None:
+    def check_feed(
+        self,
+        service_id: str,
+        feed_config: FeedConfig,
+        deadline: Optional[float] = None
+    ) -> bool:
         """
         Check a single RSS feed for updates.
 
         Args:
             service_id: Unique identifier for the service
             feed_config: Configuration for the RSS feed
+            deadline: time.monotonic() value the fetch must finish by
+
+        Returns:
+            True if the feed was checked, False if it could not be fetched or parsed
         """
-        logger.info(f"Checking {feed_config.name}...")
+        with self.tracer.span('check_feed', service_id):
+            ok = True
+            if service_id not in self._feed_skipped:
+                ok = self._check_feed(service_id, feed_config, deadline)
+            if self._watches_components(feed_config):
+                ok = self._check_components(service_id, feed_config, deadline) and ok
+            return ok
 
-        # Parse the feed
-        feed = self.parser.parse_feed(feed_config.url)
-        if not feed:
-            logger.error(f"Failed to parse feed for {feed_config.name}")
-            return
+    def _check_feed(
+        self,
+        service_id: str,
+        feed_config: FeedConfig,
+        deadline: Optional[float] = None
+    ) -> bool:
+        """Run the fetch, parse, extract, classify, state and notify stages"""
+        logger.info("Checking %s...", feed_config.name)
 
-        # Extract latest entry
-        entry = self.parser.extract_latest_entry(feed)
-        if not entry:
-            logger.warning(f"No entries found for {feed_config.name}")
-            return
+        # Fetch the feed, skipping the download if it has not changed
+        etag, modified = self.state_manager.get_validators(service_id)
+        started = time.perf_counter()
+        with self.tracer.span('fetch', service_id):
+            result = self.parser.fetch_feed(
+                feed_config.url, etag, modified, timeout=self._fetch_timeout(deadline)
+            )
+        if not self._accept_fetch(service_id, feed_config, result, started):
+            return result is not None
 
-        # Check if this is a new entry
-        last_seen_id = self.state_manager.get_last_id(service_id)
+        # Parse the feed and extract latest entry
+        ok, entry = self._parse_entry(service_id, feed_config, result.content)
+        # Only the validators are needed from here on; don't hold the
+        # document through the classify and notify stages
+        result.content = b''
+        if entry is None:
+            return ok
 
-        if last_seen_id != entry.entry_id:
-            logger.info(f"New status update for {feed_config.name}")
+        for kind in self._process_entry(service_id, feed_config, entry):
+            self._send_notification(service_id, feed_config, entry, kind)
+        self._finish_feed(service_id, result)
+        return True
 
-            # Check if this is an active incident
-            if self.filter.is_active_incident(entry.title, entry.description):
-                logger.warning(f"Active incident detected for {feed_config.name}")
-                self._send_notification(feed_config, entry)
-            else:
-                logger.info(
-                    f"Status update is a resolution/normal status - "
-                    f"skipping notification"
+    def _process_entry(self, service_id: str, feed_config: FeedConfig, entry: FeedEntry) -> List[str]:
+        """
+        Run the classify and state stages for a polled or pushed entry.
+
+        Sends nothing, so the sync and async monitors share every decision
+        and only deliver differently.
+
+        Returns:
+            Notification kinds to send for the entry, in order
+        """
+        kinds = []
+        is_new, is_revision, is_active = self._classify(service_id, feed_config, entry)
+        if is_active:
+            kinds.append(UPDATED if is_revision else NEW)
+        if is_new:
+            if self._track_incident(service_id, entry, is_active):
+                kinds.append(RESOLVED)
+            self._record_entry(service_id, entry, is_active)
+        return kinds
+
+    def _check_components(
+        self,
+        service_id: str,
+        feed_config: FeedConfig,
+        deadline: Optional[float] = None
+    ) -> bool:
+        """Fetch the page's component summary and notify on component status changes"""
+        from .components import VALIDATORS_PREFIX, summary_url
+
+        etag, modified = self.state_manager.get_validators(service_id, VALIDATORS_PREFIX)
+        with self.tracer.span('fetch', service_id, document='components'):
+            result = self.parser.fetch_feed(
+                summary_url(feed_config), etag, modified, timeout=self._fetch_timeout(deadline)
+            )
+        ok, notification = self._diff_components(service_id, feed_config, result)
+        if notification is not None:
+            self._send_notification(service_id, feed_config, *notification)
+        return ok
+
+    def _watches_components(self, feed_config: FeedConfig) -> bool:
+        return feed_config.components is not None or self.config.component_status
+
+    def _diff_components(
+        self,
+        service_id: str,
+        feed_config: FeedConfig,
+        result: Optional[FetchResult]
+    ) -> Tuple[bool, Optional[Tuple[FeedEntry, str, str]]]:
+        """
+        Update the component status vector from a summary response.
+
+        Returns:
+            (ok, notification): ok is False if the summary could not be
+            fetched or parsed; notification is the (entry, kind, severity)
+            to send for watched components that changed status, if any
+        """
+        from .components import OPERATIONAL, VALIDATORS_PREFIX, alert, diff, parse_summary, watched
+
+        metrics = self.metrics.service(service_id)
+        if result is None:
+            metrics.errors.inc()
+            logger.error("Failed to fetch component summary for %s", feed_config.name)
+            return False, None
+        if result.not_modified:
+            return True, None
+        components: Optional[List["Component"]] = parse_summary(result.content)
+        if components is None:
+            metrics.errors.inc()
+            logger.error("Failed to parse component summary for %s", feed_config.name)
+            return False, None
+
+        previous = self.state_manager.get_components(service_id)
+        statuses = {component.id: component.status for component in components}
+        if statuses != previous:
+            self.state_manager.set_components(service_id, statuses)
+        self.state_manager.set_validators(
+            service_id, result.etag, result.last_modified, VALIDATORS_PREFIX
+        )
+
+        relevant = watched(components, feed_config.components or ())
+        metrics.components_degraded.set(sum(c.status != OPERATIONAL for c in relevant))
+        if previous is None:
+            # First summary: a baseline, like the history already in the feed
+            logger.info("Tracking %d component(s) for %s", len(relevant), feed_config.name)
+            return True, None
+
+        transitions = diff(previous, relevant)
+        if not transitions:
+            return True, None
+        metrics.component_transitions.inc(len(transitions))
+        logger.warning(
+            "Component status changed for %s: %s", feed_config.name,
+            ', '.join(t.component.name for t in transitions)
+        )
+        return True, alert(feed_config, transitions)
+
+    def _fetch_timeout(self, deadline: Optional[float]) -> float:
+        """Request timeout, capped to the time left before the deadline"""
+        timeout = self.parser.timeout
+        if deadline is not None:
+            timeout = max(0.1, min(timeout, deadline - time.monotonic()))
+        return timeout
+
+    def _accept_fetch(
+        self,
+        service_id: str,
+        feed_config: FeedConfig,
+        result: Optional[FetchResult],
+        started: float
+    ) -> bool:
+        """Record fetch metrics; True if the response has content to process"""
+        if self.recorder is not None:
+            self.recorder.record(service_id, feed_config, result)
+        fetched = time.perf_counter()
+        self._fetched[service_id] = (time.time(), fetched)
+        metrics = self.metrics.service(service_id)
+        metrics.fetch_latency.observe(fetched - started)
+
+        if result is None:
+            metrics.errors.inc()
+            logger.error("Failed to fetch feed for %s", feed_config.name)
+            return False
+
+        if result.not_modified:
+            metrics.not_modified.inc()
+            metrics.last_success.set(time.time())
+            logger.debug("Feed not modified for %s", feed_config.name)
+            return False
+        return True
+
+    def _parse_entry(
+        self,
+        service_id: str,
+        feed_config: FeedConfig,
+        content: bytes
+    ) -> Tuple[bool, Optional[FeedEntry]]:
+        """
+        Parse a feed document and extract its latest entry.
+
+        Returns:
+            (ok, entry): ok is False if the document could not be parsed,
+            entry is None if there was nothing to process
+        """
+        started = time.perf_counter()
+        if self.parse_pool is not None:
+            with self.tracer.span('parse', service_id):
+                ok, entry = self.parse_pool.parse(
+                    content, feed_config.url, self.config.stream_parse
                 )
+        else:
+            ok, entry = self._parse_local(service_id, feed_config, content)
+        return self._parsed(service_id, feed_config, ok, entry, started)
+
+    def _parse_local(
+        self,
+        service_id: str,
+        feed_config: FeedConfig,
+        content: bytes
+    ) -> Tuple[bool, Optional[FeedEntry]]:
+        """Parse and extract in this process"""
+        if self.config.stream_parse:
+            from .stream_parser import extract_entries
+
+            # Stops right after the newest entry instead of building the whole tree
+            with self.tracer.span('parse', service_id, parser='stream'):
+                entries = extract_entries(content, 1, url=feed_config.url)
+            if entries is not None:
+                return True, entries[0] if entries else None
+
+        with self.tracer.span('parse', service_id):
+            feed = self.parser.parse_content(content, feed_config.url)
+        if not feed:
+            return False, None
+        with self.tracer.span('extract', service_id):
+            return True, self.parser.extract_latest_entry(feed)
+
+    def _parsed(
+        self,
+        service_id: str,
+        feed_config: FeedConfig,
+        ok: bool,
+        entry: Optional[FeedEntry],
+        started: float
+    ) -> Tuple[bool, Optional[FeedEntry]]:
+        """Record parse metrics and log parse failures or empty feeds"""
+        metrics = self.metrics.service(service_id)
+        metrics.parse_latency.observe(time.perf_counter() - started)
+        if not ok:
+            metrics.errors.inc()
+            logger.error("Failed to parse feed for %s", feed_config.name)
+        elif not entry:
+            logger.warning("No entries found for %s", feed_config.name)
+        return ok, entry
+
+    def _classify(
+        self,
+        service_id: str,
+        feed_config: FeedConfig,
+        entry: FeedEntry
+    ) -> Tuple[bool, bool, bool]:
+        """
+        Decide what to do with the latest entry.
+
+        Returns:
+            (is_new, is_revision, is_active): whether the entry or its
+            content has not been seen yet, whether it is an in-place edit
+            of the last processed entry, and whether it is an active
+            incident to notify about
+        """
+        metrics = self.metrics.service(service_id)
+        content_hash = entry.fingerprint()
+        last_id, last_hash = self.state_manager.get_last_entry(service_id)
+        is_revision = last_id == entry.entry_id
+        if is_revision and last_hash is None:
+            # State saved before fingerprints were kept: adopt this one silently
+            self.state_manager.set_content_hash(service_id, content_hash)
+            last_hash = content_hash
+        if is_revision and last_hash == content_hash:
+            metrics.unchanged.inc()
+            logger.debug("No new updates for %s", feed_config.name)
+            return False, False, False
+
+        if is_revision:
+            logger.info("Status update revised for %s", feed_config.name)
+        else:
+            logger.info("New status update for %s", feed_config.name)
+
+        # Check if this is an active incident
+        started = time.perf_counter()
+        with self.tracer.span('classify', service_id):
+            is_active = self.filter.is_active_incident(entry.title, entry.description)
+        metrics.filter_latency.observe(time.perf_counter() - started)
+
+        if is_active:
+            logger.warning("Active incident detected for %s", feed_config.name)
+        else:
+            logger.info(
+                "Status update is a resolution/normal status - "
+                "skipping notification"
+            )
+        return True, is_revision, is_active
+
+    def _track_incident(self, service_id: str, entry: FeedEntry, is_active: bool) -> bool:
+        """Update the open-incident table; True if this entry closed a tracked incident"""
+        transition = self.incidents.observe(service_id, entry, is_active)
+        self.metrics.service(service_id).open_incidents.set(
+            len(self.incidents.open_incidents(service_id))
+        )
+        return transition == INCIDENT_RESOLVED
 
-            # Update state regardless of notification (avoid reprocessing)
+    def _record_entry(self, service_id: str, entry: FeedEntry, is_active: bool) -> None:
+        """Update state regardless of notification (avoid reprocessing)"""
+        with self.tracer.span('state', service_id):
             self.state_manager.update_service(
                 service_id,
                 entry.entry_id,
-                entry.title
+                entry.title,
+                active=is_active,
+                link=entry.link,
+                content_hash=entry.fingerprint()
             )
-        else:
-            logger.debug(f"No new updates for {feed_config.name}")
+        if self.history is not None:
+            from .history import entry_row
+            self._history_rows.append(entry_row(service_id, entry, is_active))
+
+    def _finish_feed(self, service_id: str, result: FetchResult) -> None:
+        """Only remember validators once the response has been processed"""
+        self.state_manager.set_validators(service_id, result.etag, result.last_modified)
+        self.metrics.service(service_id).last_success.set(time.time())
 
     def _send_notification(
         self,
+        service_id: str,
         feed_config: FeedConfig,
-        entry
+        entry: FeedEntry,
+        kind: str = NEW,
+        severity: Optional[str] = None
     ) -> None:
         """
         Send notification for an incident.
 
         Args:
+            service_id: Unique identifier for the service
             feed_config: Configuration for the feed
             entry: The feed entry to notify about
+            kind: NEW, UPDATED for a revision already reported, or RESOLVED
+            severity: Routing severity, guessed from the entry's text if None
+        """
+        if kind == NEW and self.dedup is not None:
+            self._hold_alert(service_id, feed_config, entry, severity)
+            return
+        classified = time.perf_counter()
+        for notifier in self._destinations(service_id, entry, severity):
+            self._deliver(notifier, service_id, feed_config, entry, kind, classified)
+
+    def _deliver(
+        self,
+        notifier: Notifier,
+        service_id: str,
+        feed_config: FeedConfig,
+        entry: FeedEntry,
+        kind: str,
+        classified: float
+    ) -> bool:
+        """Send a notification to one destination and record it; True if it was accepted"""
+        started = time.perf_counter()
+        with self.tracer.span('notify', service_id):
+            success = notifier.send(
+                service_name=feed_config.name,
+                title=entry.title,
+                description=entry.description,
+                link=entry.link,
+                color=feed_config.color,
+                kind=kind
+            )
+        self._record_notification(service_id, feed_config, success, started)
+        if success and kind == NEW:
+            self._record_detection(service_id, entry, notifier, classified)
+        return success
+
+    def _hold_alert(
+        self,
+        service_id: str,
+        feed_config: FeedConfig,
+        entry: FeedEntry,
+        severity: Optional[str]
+    ) -> None:
+        """Keep a new-incident alert for _release_alerts(), with its similarity signature"""
+        from .dedup import HeldAlert
+
+        classified = time.perf_counter()
+        self._held_alerts.append(HeldAlert(
+            service_id, feed_config, entry, severity,
+            self.dedup.signature(entry.title, entry.description), classified
+        ))
+
+    def _held_deliveries(
+        self
+    ) -> List[Tuple[Notifier, List["HeldAlert"], FeedConfig, FeedEntry, str]]:
+        """
+        Turn the alerts held this cycle into one delivery per incident and destination.
+
+        Alerts similar to another service's alert from this cycle are
+        merged into it. An alert similar to one sent in an earlier cycle,
+        within DEDUP_WINDOW, goes out as an UPDATED "also affects" follow-up
+        instead of a second NEW alert, so the service is still reported and
+        its later updates follow on from a notice the channel has seen.
+
+        Returns:
+            (notifier, alerts, feed_config, entry, kind) tuples: the alerts
+            merged into the delivery, and the feed, entry and kind to send
+        """
+        from .dedup import follow_up, merge_alerts
+
+        held, self._held_alerts = self._held_alerts, []
+        if not held:
+            return []
+        groups, duplicates = self.dedup.group(held, self.dedup.clock())
+
+        deliveries = []
+        for alert, (first_id, _) in duplicates:
+            first = self.feeds.get(first_id)
+            first_name = first.name if first is not None else first_id
+            self.metrics.service(alert.service_id).duplicates_followed_up.inc()
+            logger.info(
+                "%s reports %s, already alerted on for %s; sending a follow-up",
+                alert.feed_config.name, alert.entry.title, first_name
+            )
+            entry = follow_up(alert, first_name)
+            for notifier in self._destinations(alert.service_id, alert.entry, alert.severity):
+                deliveries.append((notifier, [alert], alert.feed_config, entry, UPDATED))
+
+        for group in groups:
+            if len(group) > 1:
+                for alert in group[1:]:
+                    self.metrics.service(alert.service_id).duplicates_merged.inc()
+                logger.info(
+                    "Merging alerts for %s into one",
+                    ', '.join(alert.feed_config.name for alert in group)
+                )
+            by_notifier: Dict[Notifier, List["HeldAlert"]] = {}
+            for alert in group:
+                for notifier in self._destinations(alert.service_id, alert.entry, alert.severity):
+                    by_notifier.setdefault(notifier, []).append(alert)
+            for notifier, alerts in by_notifier.items():
+                feed_config, entry = merge_alerts(alerts)
+                deliveries.append((notifier, alerts, feed_config, entry, NEW))
+        return deliveries
+
+    def _release_alerts(self) -> None:
+        """Send the new-incident alerts held this cycle, merging duplicates across services"""
+        for notifier, alerts, feed_config, entry, kind in self._held_deliveries():
+            first = alerts[0]
+            if self._deliver(notifier, first.service_id, feed_config, entry, kind, first.classified):
+                self._record_held_detection(notifier, alerts, kind)
+
+    def _record_held_detection(self, notifier: Notifier, alerts: List["HeldAlert"], kind: str) -> None:
+        """
+        Detection latency of the held alerts a delivery covered, beyond the
+        one _deliver() records for a NEW alert
+        """
+        for alert in (alerts[1:] if kind == NEW else alerts):
+            self._record_detection(alert.service_id, alert.entry, notifier, alert.classified)
+
+    def _record_detection(
+        self,
+        service_id: str,
+        entry: FeedEntry,
+        notifier: Notifier,
+        classified: float
+    ) -> None:
+        """
+        Record how long a new incident took to reach a destination: publish
+        to fetch, fetch to classify and classify to the webhook's ack.
         """
+        acked = time.perf_counter()
+        fetched_at, fetched = self._fetched.get(service_id, (time.time(), classified))
+        publish_to_fetch = None
+        if entry.published_at is not None:
+            # The publish date comes from the status page's clock
+            publish_to_fetch = max(0.0, fetched_at - entry.published_at)
+        fetch_to_classify = classified - fetched
+        classify_to_ack = acked - classified
+
+        metrics = self.metrics.service(service_id)
+        metrics.fetch_to_classify.observe(fetch_to_classify)
+        metrics.classify_to_ack.observe(classify_to_ack)
+        if publish_to_fetch is not None:
+            metrics.publish_to_fetch.observe(publish_to_fetch)
+            metrics.detection.observe(publish_to_fetch + fetch_to_classify + classify_to_ack)
+
+        if self.slo_log is not None:
+            from .slo import AlertLatency
+            self.slo_log.write(AlertLatency(
+                time.time(), service_id, entry.entry_id, notifier.NAME,
+                publish_to_fetch, fetch_to_classify, classify_to_ack
+            ))
+
+    def _destinations(
+        self,
+        service_id: str,
+        entry: FeedEntry,
+        severity: Optional[str] = None
+    ) -> Sequence[Notifier]:
+        """Notifiers an incident goes to: its routes, else the configured webhook"""
+        if self.routes is not None:
+            destinations = self.routes.route(
+                service_id,
+                severity or classify_severity(entry.title, entry.description),
+                f"{entry.title} {entry.description}"
+            )
+            if destinations:
+                return destinations
         if not self.notifier:
             logger.warning("Notifier not configured, skipping notification")
-            return
+            return ()
+        return (self.notifier,)
 
-        success = self.notifier.send(
-            service_name=feed_config.name,
-            title=entry.title,
-            description=entry.description,
-            link=entry.link,
-            color=feed_config.color
-        )
+    def _record_notification(
+        self,
+        service_id: str,
+        feed_config: FeedConfig,
+        success: bool,
+        started: float
+    ) -> None:
+        metrics = self.metrics.service(service_id)
+        metrics.notify_latency.observe(time.perf_counter() - started)
 
         if success:
-            logger.info(f"Notification sent for {feed_config.name}")
+            metrics.notifications_sent.inc()
+            logger.info("Notification sent for %s", feed_config.name)
         else:
-            logger.error(f"Failed to send notification for {feed_config.name}")
+            metrics.notifications_failed.inc()
+            logger.error("Failed to send notification for %s", feed_config.name)
 
-    def run_check_cycle(self) -> None:
-        """Run a single check cycle for all feeds"""
-        logger.info(
-            f"Check started at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-        )
+    def run_check_cycle(self, deadline: Optional[float] = None) -> int:
+        """
+        Run a single check cycle for all feeds.
 
-        for service_id, feed_config in FEEDS.items():
+        Feeds left over when the deadline passes are deferred to the front
+        of the next cycle. Once a stop is requested the feed in flight is
+        finished and the rest are skipped.
+
+        Args:
+            deadline: time.monotonic() value the cycle must finish by
+
+        Returns:
+            Number of feeds that failed
+        """
+        started = self._start_cycle()
+        order = self._cycle_order()
+        failed = 0
+
+        for index, service_id in enumerate(order):
+            if self._stop.is_set():
+                logger.info("Stop requested, skipping %d remaining feed(s)", len(order) - index)
+                break
+            if deadline is not None and time.monotonic() >= deadline:
+                self._defer(order[index:])
+                break
+
+            feed_config = self.feeds[service_id]
             try:
-                self.check_feed(service_id, feed_config)
+                if not self.check_feed(service_id, feed_config, deadline):
+                    failed += 1
             except Exception as e:
-                logger.error(
-                    f"Unexpected error checking {feed_config.name}: {e}",
-                    exc_info=True
-                )
+                failed += 1
+                self._unexpected_error(service_id, e)
 
-        # Save state after all checks
-        self.state_manager.save()
+        self._release_alerts()
+        self._finish_cycle(started)
+        return failed
+
+    def _start_cycle(self) -> float:
+        logger.info("Check started at %s", datetime.now().replace(microsecond=0))
+        return time.perf_counter()
+
+    def _cycle_order(self) -> List[str]:
+        """
+        Feeds to check this cycle, previously deferred ones first.
+
+        Feeds that receive pushes are not fetched until RECONCILE_INTERVAL
+        has passed since they were last polled; those that watch components
+        stay in the order for their summary alone (see _feed_skipped).
+        """
+        deferred = [s for s in self._deferred if s in self.feeds]
+        self._deferred = []
+        order = deferred + [s for s in self.feeds if s not in deferred]
+        self._feed_skipped = frozenset()
+        if not self._push_fed:
+            return order
+
+        now = time.monotonic()
+        polled = []
+        skipped = set()
+        for service_id in order:
+            last_polled = self._push_fed.get(service_id)
+            if last_polled is not None and now - last_polled < self.config.reconcile_interval:
+                self.metrics.service(service_id).push_fed.inc()
+                if self._watches_components(self.feeds[service_id]):
+                    skipped.add(service_id)
+                    polled.append(service_id)
+                continue
+            if last_polled is not None:
+                self._push_fed[service_id] = now
+            polled.append(service_id)
+        self._feed_skipped = frozenset(skipped)
+        return polled
+
+    def _defer(self, service_ids: List[str]) -> None:
+        """Push feeds that did not fit in the cycle budget to the next cycle"""
+        self._deferred = list(service_ids)
+        for service_id in self._deferred:
+            self.metrics.service(service_id).deferred.inc()
+        logger.warning(
+            "Cycle budget exhausted, deferring %d feed(s) to the next cycle: %s",
+            len(self._deferred), ', '.join(self._deferred)
+        )
+
+    def _unexpected_error(self, service_id: str, error: Exception) -> None:
+        self.metrics.service(service_id).errors.inc()
+        logger.error(
+            "Unexpected error checking %s: %s", self.feeds[service_id].name, error,
+            exc_info=error
+        )
+
+    def _finish_cycle(self, started: float) -> None:
+        """Save state after all checks and record the cycle"""
+        self._flush()
+        self.metrics.cycles.inc()
+        self.metrics.cycle_duration.observe(time.perf_counter() - started)
+        self.last_cycle_at = time.time()
         logger.info(
-            f"Check cycle completed. Next check in {self.config.check_interval}s"
+            "Check cycle completed in %.1fs", time.perf_counter() - started
         )
 
+    def _flush(self) -> None:
+        """Save state and write out buffered history rows, recordings and SLO log lines"""
+        self.state_manager.save()
+        if self._history_rows:
+            rows, self._history_rows = self._history_rows, []
+            self.history.insert_many(rows)
+        if self.recorder is not None:
+            self.recorder.flush()
+        if self.slo_log is not None:
+            self.slo_log.flush()
+
+    def receive_push(self, service_id: str, entry: FeedEntry) -> None:
+        """
+        Queue a pushed entry for the loop to process (safe to call from the HTTP thread).
+
+        The feed then counts as push-fed: polls of it drop to one every
+        RECONCILE_INTERVAL, which catches pushes that never arrived.
+        """
+        self._pushes.append((service_id, entry, time.time(), time.perf_counter()))
+        self._push_fed.setdefault(service_id, time.monotonic())
+        self._wakeup.set()
+
+    def _process_pushes(self) -> None:
+        """Run queued pushes through the classify, notify and state stages"""
+        processed = 0
+        while self._pushes:
+            service_id, entry, received_at, received = self._pushes.popleft()
+            feed_config = self.feeds.get(service_id)
+            if feed_config is None:
+                continue
+            logger.info("Push received for %s", feed_config.name)
+            # Detection latency counts the push's arrival as the fetch
+            self._fetched[service_id] = (received_at, received)
+            try:
+                with self.tracer.span('push', service_id):
+                    for kind in self._process_entry(service_id, feed_config, entry):
+                        self._send_notification(service_id, feed_config, entry, kind)
+            except Exception as e:
+                self._unexpected_error(service_id, e)
+            processed += 1
+        if processed:
+            self._release_alerts()
+            self._flush()
+
+    def run_once(self) -> int:
+        """
+        Run a single check cycle and flush state, for cron-style runs.
+
+        Returns:
+            Process exit code: EXIT_OK, EXIT_FEED_ERRORS if any feed
+            failed, or EXIT_ERROR if state could not be saved
+        """
+        self.state_manager.load()
+        try:
+            failed = self.run_check_cycle(
+                time.monotonic() + self.config.effective_cycle_budget
+            )
+        finally:
+            saved = self.state_manager.save()
+            self.tracer.shutdown()
+            self.close()
+
+        if not saved:
+            return EXIT_ERROR
+        if failed:
+            logger.warning("%d of %d feeds failed", failed, len(self.feeds))
+            return EXIT_FEED_ERRORS
+        return EXIT_OK
+
     def run(self) -> None:
         """Main monitoring loop"""
         logger.info("🚀 LLM Status Monitor Started")
-        logger.info(f"⏱️  Check interval: {self.config.check_interval} seconds")
+        logger.info("⏱️  Check interval: %s seconds", self.config.check_interval)
         logger.info(
-            f"📊 Monitoring: {', '.join([f.name for f in FEEDS.values()])}"
+            "📊 Monitoring: %s", ', '.join([f.name for f in self.feeds.values()])
         )
-        logger.info(f"📢 Notification type: {self.config.notification_type}")
+        logger.info("📢 Notification type: %s", self.config.notification_type)
+        if self.profiler:
+            logger.info(
+                "🔬 Profiling every %d cycle(s) slower than %.0f ms into %s",
+                self.profiler.every,
+                self.profiler.threshold_ms,
+                self.profiler.output_dir
+            )
 
         # Check if notifications are configured
-        if not self.config.is_configured():
+        if not self.config.is_configured() and self.routes is None:
             logger.warning(
-                f"{self.config.notification_type.upper()} webhook not configured. "
-                f"Notifications disabled."
+                "%s webhook not configured. Notifications disabled.",
+                self.config.notification_type.upper()
             )
             logger.warning(
-                f"Set {self.config.notification_type.upper()}_WEBHOOK_URL in .env"
+                "Set %s_WEBHOOK_URL in .env", self.config.notification_type.upper()
             )
 
         # Load initial state
         self.state_manager.load()
+        self.start_http_server()
+        previous_handlers = self._install_signal_handlers()
+
+        next_run = time.monotonic()
 
         try:
-            while True:
-                self.run_check_cycle()
-                time.sleep(self.config.check_interval)
+            while not self._stop.is_set():
+                deadline = time.monotonic() + self.config.effective_cycle_budget
+                if self.profiler:
+                    self.profiler.run(lambda: self.run_check_cycle(deadline))
+                else:
+                    self.run_check_cycle(deadline)
 
+                next_run = self._next_run(
+                    next_run, time.monotonic(), float(self.config.check_interval)
+                )
+                next_run = self._sleep_until(next_run)
+
+            logger.info("Monitor stopped")
         except KeyboardInterrupt:
             logger.info("Monitor stopped by user")
-            self.state_manager.save()
         except Exception as e:
-            logger.error(f"Unexpected error in monitoring loop: {e}", exc_info=True)
-            self.state_manager.save()
+            logger.error("Unexpected error in monitoring loop: %s", e, exc_info=True)
             raise
+        finally:
+            self.state_manager.save()
+            self.stop_http_server()
+            self.tracer.shutdown()
+            self.close()
+            self._restore_signal_handlers(previous_handlers)
+            if self._shutdown_timer is not None:
+                self._shutdown_timer.cancel()
+
+    def _sleep_until(self, next_run: float) -> float:
+        """
+        Wait for the next cycle, applying config reloads and pushes in the meantime.
+
+        Returns:
+            The (possibly rescheduled) start of the next cycle
+        """
+        while not self._stop.is_set():
+            if self._pushes:
+                self._process_pushes()
+            remaining = next_run - time.monotonic()
+            if remaining <= 0:
+                break
+            poll = self.config.reload_poll_interval
+            self._wakeup.wait(min(remaining, poll) if poll > 0 else remaining)
+            self._wakeup.clear()
+
+            if self._reload_requested or self._config_files_changed():
+                old_interval = self.config.check_interval
+                self.reload_config()
+                # Keep the grid anchored to the last cycle, with the new spacing
+                next_run += self.config.check_interval - old_interval
+        return next_run
+
+    def _config_files_changed(self) -> bool:
+        if self.config.reload_poll_interval <= 0:
+            return False
+        return self.config.watched_files() != self._watched_files
+
+    def reload_config(self) -> bool:
+        """
+        Re-read the configuration and apply it without restarting.
+
+        Only feeds that were added, removed or changed are touched; the
+        HTTP session, metrics, validators and deferral queue of the other
+        feeds are kept. The HTTP server, tracing, profiling and state file
+        settings only take effect on restart.
+
+        Returns:
+            True if the new configuration was applied
+        """
+        self._reload_requested = False
+        try:
+            config = Config.from_env(override=True)
+            feeds = config.load_feeds()
+            routes = config.load_routes()
+        except Exception as e:
+            # A bad file must never take the running monitor down
+            logger.error("Config reload failed, keeping current config: %s", e)
+            self._watched_files = self.config.watched_files()
+            return False
+
+        old = self.config
+        for name in (
+            'http_host', 'http_port', 'trace_file', 'state_file', 'dedup_window', 'dedup_threshold'
+        ):
+            if getattr(config, name) != getattr(old, name):
+                logger.warning("%s changed; restart to apply it", name.upper())
+        if config.profile is None:
+            # Profiling may have been enabled with --profile
+            config.profile = old.profile
+
+        added = [s for s in feeds if s not in self.feeds]
+        removed = [s for s in self.feeds if s not in feeds]
+        changed = [s for s in feeds if s in self.feeds and feeds[s] != self.feeds[s]]
+
+        for service_id in removed:
+            self.metrics.remove_service(service_id)
+        for service_id in added:
+            self.metrics.service(service_id)
+        for service_id in changed:
+            if feeds[service_id].url != self.feeds[service_id].url:
+                # Validators belong to the old URL
+                self.state_manager.set_validators(service_id, None, None)
+        self._deferred = [s for s in self._deferred if s in feeds]
+        # receive_push() adds to _push_fed from the HTTP thread: prune a copy of
+        # its keys in place, so neither iteration nor a concurrent push is lost
+        for service_id in list(self._push_fed):
+            if service_id not in feeds:
+                self._push_fed.pop(service_id, None)
+
+        self.config = config
+        self.feeds = feeds
+        self._watched_files = config.watched_files()
+        if self.routes is not None:
+            self.routes.close()
+        self.routes = routes
+        if (config.notification_type, config.get_webhook_url()) != \
+                (old.notification_type, old.get_webhook_url()):
+            self._create_notifier()
+
+        logger.info(
+            "Config reloaded: interval %ss, %d feeds (added: %s; removed: %s; changed: %s)",
+            config.check_interval, len(feeds),
+            ', '.join(added) or '-', ', '.join(removed) or '-', ', '.join(changed) or '-'
+        )
+        return True
+
+    def request_reload(self) -> None:
+        """Ask the loop to reload the configuration before the next cycle"""
+        self._reload_requested = True
+        self._wakeup.set()
+
+    @staticmethod
+    def _next_run(scheduled: float, now: float, interval: float) -> float:
+        """
+        Compute the next cycle start on a fixed grid anchored at the first run.
+
+        Ticks that were missed because a cycle overran are skipped rather
+        than run back to back.
+        """
+        next_run = scheduled + interval
+        if next_run <= now:
+            missed = int((now - next_run) // interval) + 1
+            logger.warning("Check cycle overran the interval, skipping %d tick(s)", missed)
+            next_run += missed * interval
+        return next_run
+
+    @property
+    def stopping(self) -> bool:
+        """True once a stop has been requested"""
+        return self._stop.is_set()
+
+    def request_stop(self) -> None:
+        """Ask the loop to finish the feed in flight, flush state and return"""
+        self._stop.set()
+        self._wakeup.set()
+
+    def _install_signal_handlers(self) -> Dict[int, object]:
+        """Route SIGTERM/SIGINT to a graceful stop and SIGHUP to a reload (main thread only)"""
+        if threading.current_thread() is not threading.main_thread():
+            return {}
+        previous = {}
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            previous[signum] = signal.signal(signum, self._handle_signal)
+        if hasattr(signal, 'SIGHUP'):
+            previous[signal.SIGHUP] = signal.signal(
+                signal.SIGHUP, lambda signum, frame: self.request_reload()
+            )
+        return previous
+
+    @staticmethod
+    def _restore_signal_handlers(previous: Dict[int, object]) -> None:
+        for signum, handler in previous.items():
+            signal.signal(signum, handler)
+
+    def _handle_signal(self, signum: int, frame) -> None:
+        """Stop gracefully; a second signal or the shutdown timeout forces exit"""
+        name = signal.Signals(signum).name
+        if self._stop.is_set():
+            self._force_exit(f"Received {name} again")
+            return
+
+        logger.info(
+            "Received %s, shutting down (up to %.0fs)", name, self.config.shutdown_timeout
+        )
+        self.request_stop()
+        self._shutdown_timer = threading.Timer(
+            self.config.shutdown_timeout, self._force_exit, args=("Shutdown did not finish in time",)
+        )
+        self._shutdown_timer.daemon = True
+        self._shutdown_timer.start()
+
+    def _force_exit(self, reason: str) -> None:
+        """Flush state and terminate without waiting for the feed in flight"""
+        logger.error("%s, saving state and exiting now", reason)
+        self.state_manager.save()
+        stop_logging()
+        logging.shutdown()
+        os._exit(EXIT_ERROR)
+
+    def close(self) -> None:
+        """Release pooled connections, parse workers, the history database and the recording"""
+        self.parser.close()
+        if isinstance(self.notifier, Notifier):
+            self.notifier.close()
+        if self.routes is not None:
+            self.routes.close()
+        if self.parse_pool is not None:
+            self.parse_pool.shutdown()
+            self.parse_pool = None
+        if self.history is not None:
+            self.history.close()
+            self.history = None
+        if self.recorder is not None:
+            self.recorder.close()
+            self.recorder = None
+        if self.slo_log is not None:
+            self.slo_log.close()
+            self.slo_log = None
+
+    def start_http_server(self) -> None:
+        """Start the embedded HTTP server (metrics, status API, push receiver) if HTTP_PORT is set"""
+        if not self.config.http_port or self.http_server is not None:
+            return
+
+        from .httpd import EmbeddedServer
+        from .status_api import StatusAPI
+
+        self.http_server = EmbeddedServer(self.config.http_host, self.config.http_port)
+        self.http_server.add_route('/metrics', self.metrics.http_handler)
+        for path, handler in StatusAPI(self).routes().items():
+            self.http_server.add_route(path, handler)
+        if self.config.push_token:
+            from .push import PushReceiver
+            for prefix, post_handler in PushReceiver(self, self.config.push_token).routes().items():
+                self.http_server.add_post_route(prefix, post_handler)
+        self.http_server.start()
+
+    def stop_http_server(self) -> None:
+        """Stop the embedded HTTP server if it is running"""
+        if self.http_server is not None:
+            self.http_server.stop()
+            self.http_server = None
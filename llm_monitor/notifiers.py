@@ -3,13 +3,27 @@ Notification handlers for Discord and Slack
 """
 
 import logging
-import requests
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+if TYPE_CHECKING:
+    import requests
 
 logger = logging.getLogger(__name__)
 
+# Notification kinds: a new incident, a revision of one already reported,
+# and the single notice sent when a tracked incident closes
+NEW = 'new'
+UPDATED = 'updated'
+RESOLVED = 'resolved'
+
+HEADINGS = {
+    NEW: "🚨 {service_name} Status Update",
+    UPDATED: "🔄 {service_name} Incident Updated",
+    RESOLVED: "✅ {service_name} Incident Resolved",
+}
+
 
 class NotificationError(Exception):
     """Base exception for notification errors"""
@@ -19,36 +33,94 @@ class NotificationError(Exception):
 class Notifier(ABC):
     """Abstract base class for notification services"""
 
+    # Human-readable service name used in log messages
+    NAME = "Webhook"
+
     def __init__(self, webhook_url: str):
         self.webhook_url = webhook_url
+        self._session: Optional["requests.Session"] = None
+
+    @property
+    def session(self) -> "requests.Session":
+        """Pooled HTTP session for this webhook, created on first use"""
+        if self._session is None:
+            import requests
+            self._session = requests.Session()
+        return self._session
+
+    def close(self) -> None:
+        """Close the pooled connections"""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    @staticmethod
+    def heading(service_name: str, kind: str = NEW) -> str:
+        """Notification heading for a new, updated or resolved incident"""
+        return HEADINGS[kind].format(service_name=service_name)
 
     @abstractmethod
+    def build_payload(
+        self,
+        service_name: str,
+        title: str,
+        description: str,
+        link: str,
+        color: int,
+        kind: str = NEW
+    ) -> Dict[str, Any]:
+        """Build the JSON payload for a notification"""
+        pass
+
     def send(
         self,
         service_name: str,
         title: str,
         description: str,
         link: str,
-        color: int
+        color: int,
+        kind: str = NEW
     ) -> bool:
-        """Send a notification. Returns True on success, False on failure."""
-        pass
+        """
+        Send a notification. Returns True on success, False on failure.
+
+        `kind` is NEW, UPDATED or RESOLVED and only changes the heading.
+        """
+        # Imported on first use to keep startup fast
+        import requests
+
+        payload = self.build_payload(service_name, title, description, link, color, kind)
+
+        try:
+            response = self.session.post(self.webhook_url, json=payload, timeout=10)
+            response.raise_for_status()
+            logger.info("%s notification sent for %s", self.NAME, service_name)
+            return True
+        except requests.exceptions.Timeout:
+            logger.error("%s notification timeout for %s", self.NAME, service_name)
+            return False
+        except requests.exceptions.RequestException as e:
+            logger.error("%s notification failed for %s: %s", self.NAME, service_name, e)
+            return False
 
 
 class DiscordNotifier(Notifier):
     """Discord webhook notifier"""
 
-    def send(
+    NAME = "Discord"
+
+    def build_payload(
         self,
         service_name: str,
         title: str,
         description: str,
         link: str,
-        color: int
-    ) -> bool:
-        """Send notification to Discord webhook"""
+        color: int,
+        kind: str = NEW
+    ) -> Dict[str, Any]:
+        """Build a Discord embed payload"""
         embed = {
-            "title": f"🚨 {service_name} Status Update",
+            "title": self.heading(service_name, kind),
             "description": title,
             "url": link,
             "color": color,
@@ -64,39 +136,30 @@ class DiscordNotifier(Notifier):
             }
         }
 
-        payload = {"embeds": [embed]}
-
-        try:
-            response = requests.post(self.webhook_url, json=payload, timeout=10)
-            response.raise_for_status()
-            logger.info(f"Discord notification sent for {service_name}")
-            return True
-        except requests.exceptions.Timeout:
-            logger.error(f"Discord notification timeout for {service_name}")
-            return False
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Discord notification failed for {service_name}: {e}")
-            return False
+        return {"embeds": [embed]}
 
 
 class SlackNotifier(Notifier):
     """Slack webhook notifier"""
 
+    NAME = "Slack"
+
     # Color mapping for Slack
     COLOR_MAP = {
         0xD97757: '#D97757',  # Claude orange/brown
         0x10A37F: '#10A37F',  # OpenAI green
     }
 
-    def send(
+    def build_payload(
         self,
         service_name: str,
         title: str,
         description: str,
         link: str,
-        color: int
-    ) -> bool:
-        """Send notification to Slack webhook"""
+        color: int,
+        kind: str = NEW
+    ) -> Dict[str, Any]:
+        """Build a Slack Block Kit payload"""
         slack_color = self.COLOR_MAP.get(color, '#FF0000')  # Default to red
 
         blocks = [
@@ -104,7 +167,7 @@ class SlackNotifier(Notifier):
                 "type": "header",
                 "text": {
                     "type": "plain_text",
-                    "text": f"🚨 {service_name} Status Update",
+                    "text": self.heading(service_name, kind),
                     "emoji": True
                 }
             },
@@ -133,7 +196,7 @@ class SlackNotifier(Notifier):
             }
         ]
 
-        payload = {
+        return {
             "blocks": blocks,
             "attachments": [
                 {
@@ -143,18 +206,6 @@ class SlackNotifier(Notifier):
             ]
         }
 
-        try:
-            response = requests.post(self.webhook_url, json=payload, timeout=10)
-            response.raise_for_status()
-            logger.info(f"Slack notification sent for {service_name}")
-            return True
-        except requests.exceptions.Timeout:
-            logger.error(f"Slack notification timeout for {service_name}")
-            return False
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Slack notification failed for {service_name}: {e}")
-            return False
-
 
 def create_notifier(notification_type: str, webhook_url: str) -> Optional[Notifier]:
     """
@@ -172,5 +223,5 @@ def create_notifier(notification_type: str, webhook_url: str) -> Optional[Notifi
     elif notification_type == 'slack':
         return SlackNotifier(webhook_url)
     else:
-        logger.error(f"Unknown notification type: {notification_type}")
+        logger.error("Unknown notification type: %s", notification_type)
         return None
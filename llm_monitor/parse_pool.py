@@ -0,0 +1,80 @@
+"""
+Process pool for parsing feed documents off the main interpreter
+"""
+
+import logging
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, List, Optional, Tuple, TypeVar
+
+from .feed_parser import EntryFields, FeedEntry, parse_entries
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+def _warm_up() -> None:
+    """Import feedparser once per worker instead of on its first task"""
+    import feedparser  # noqa: F401
+
+
+class ParsePool:
+    """
+    Parse feed documents in worker processes.
+
+    feedparser is pure Python, so in one process all parsing is
+    serialized by the GIL no matter how many fetches run concurrently.
+    Workers receive the raw bytes and send back only the extracted entry
+    fields, keeping pickling cheap. Workers are started with 'spawn' so
+    they don't inherit the monitor's threads and sockets, and only when
+    the first document is submitted.
+    """
+
+    def __init__(self, workers: int):
+        self.workers = workers
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_warm_up
+        )
+
+    def submit(
+        self,
+        content: bytes,
+        url: str = '',
+        stream: bool = True,
+        limit: int = 1
+    ) -> "Future[Optional[List[EntryFields]]]":
+        """Queue a document for parsing; the future resolves to parse_entries() output"""
+        return self._executor.submit(parse_entries, content, url, limit, stream)
+
+    def call(self, fn: Callable[..., T], *args: Any) -> "Future[T]":
+        """Run another module-level function in a worker, e.g. to parse and classify in one go"""
+        return self._executor.submit(fn, *args)
+
+    def parse(
+        self,
+        content: bytes,
+        url: str = '',
+        stream: bool = True
+    ) -> Tuple[bool, Optional[FeedEntry]]:
+        """Parse a document in a worker and wait for its latest entry"""
+        return self.to_result(self.submit(content, url, stream).result())
+
+    @staticmethod
+    def to_result(fields: Optional[List[EntryFields]]) -> Tuple[bool, Optional[FeedEntry]]:
+        """
+        Convert parse_entries() output into (ok, latest entry).
+
+        ok is False if the document could not be parsed.
+        """
+        if fields is None:
+            return False, None
+        if not fields:
+            return True, None
+        return True, FeedEntry.compact(*fields[0])
+
+    def shutdown(self) -> None:
+        """Stop the worker processes"""
+        self._executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,93 @@
+"""
+Per-cycle profiling for LLM Status Monitor
+"""
+
+import cProfile
+import io
+import logging
+import pstats
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+class CycleProfiler:
+    """
+    Profile every Nth check cycle with cProfile.
+
+    Profiled cycles slower than the threshold are dumped as rotating
+    .pstats files, and a top-N summary is written to the log. Cycles
+    that are not sampled run without any profiler attached.
+    """
+
+    FILE_PREFIX = 'cycle-'
+
+    def __init__(
+        self,
+        output_dir: Path,
+        every: int = 1,
+        threshold_ms: float = 0.0,
+        keep: int = 10,
+        top: int = 20
+    ):
+        self.output_dir = output_dir
+        self.every = max(1, every)
+        self.threshold_ms = threshold_ms
+        self.keep = keep
+        self.top = top
+        self._cycle = 0
+
+    def run(self, func: Callable[[], T]) -> T:
+        """Run a cycle, profiling it if it is sampled"""
+        self._cycle += 1
+        if self._cycle % self.every:
+            return func()
+
+        profiler = cProfile.Profile()
+        started = time.perf_counter()
+        profiler.enable()
+        try:
+            return func()
+        finally:
+            profiler.disable()
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            if elapsed_ms >= self.threshold_ms:
+                self._dump(profiler, elapsed_ms)
+            else:
+                logger.debug(
+                    "Cycle %d took %.1f ms, below profiling threshold of %.0f ms",
+                    self._cycle, elapsed_ms, self.threshold_ms
+                )
+
+    def _dump(self, profiler: cProfile.Profile, elapsed_ms: float) -> None:
+        try:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            stamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+            path = self.output_dir / f"{self.FILE_PREFIX}{stamp}-{self._cycle:06d}.pstats"
+            profiler.dump_stats(str(path))
+            self._rotate()
+        except OSError as e:
+            logger.error("Failed to write cycle profile: %s", e)
+            path = None
+
+        stream = io.StringIO()
+        stats = pstats.Stats(profiler, stream=stream)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.top)
+        logger.info(
+            "Cycle %d took %.1f ms%s\n%s",
+            self._cycle,
+            elapsed_ms,
+            f" (profile: {path})" if path else '',
+            stream.getvalue()
+        )
+
+    def _rotate(self) -> None:
+        """Delete the oldest profiles beyond the retention limit"""
+        profiles = sorted(self.output_dir.glob(f"{self.FILE_PREFIX}*.pstats"))
+        for old in profiles[:-self.keep] if self.keep > 0 else []:
+            old.unlink(missing_ok=True)
@@ -0,0 +1,159 @@
+"""
+Receive Statuspage webhook pushes and feed them into the monitor's pipeline
+"""
+
+import hmac
+import json
+import logging
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from .config import FeedConfig
+from .feed_parser import FeedEntry
+from .httpd import TEXT, PostHandler, Request, Response
+
+if TYPE_CHECKING:
+    from .monitor import StatusMonitor
+
+logger = logging.getLogger(__name__)
+
+PREFIX = '/push/'
+
+# Statuspage update statuses as the stage markers its RSS feeds show
+_STAGES = {
+    'investigating': 'Investigating',
+    'identified': 'Identified',
+    'monitoring': 'Monitoring',
+    'resolved': 'Resolved',
+    'postmortem': 'Postmortem',
+    'scheduled': 'Scheduled',
+    'in_progress': 'In progress',
+    'verifying': 'Verifying',
+    'completed': 'Completed',
+}
+
+
+class PushError(Exception):
+    """A push was rejected; `status` is the HTTP status to answer with"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def _timestamp(value: Any) -> Optional[datetime]:
+    if not isinstance(value, str):
+        return None
+    try:
+        when = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return when.astimezone(timezone.utc)
+
+
+def entry_from_payload(payload: Dict[str, Any], feed_config: FeedConfig) -> Optional[FeedEntry]:
+    """
+    The feed entry an incident push corresponds to, or None for other events.
+
+    The entry is built the way the page's history.rss shows the incident
+    (same ID, link and update text), so a later reconciliation poll sees
+    it as already processed rather than as a revision.
+
+    Raises:
+        PushError: If the payload is not a well-formed Statuspage event
+    """
+    if not isinstance(payload, dict):
+        raise PushError(400, "payload must be a JSON object")
+    incident = payload.get('incident')
+    if incident is None:
+        if 'component_update' in payload or 'component' in payload:
+            return None
+        raise PushError(400, "payload has no incident")
+    if not isinstance(incident, dict):
+        raise PushError(400, "incident must be an object")
+    incident_id, name = incident.get('id'), incident.get('name')
+    if not isinstance(incident_id, str) or not incident_id or not isinstance(name, str):
+        raise PushError(400, "incident needs an id and a name")
+    updates = incident.get('incident_updates') or []
+    if not isinstance(updates, list) or not all(isinstance(u, dict) for u in updates):
+        raise PushError(400, "incident_updates must be a list of objects")
+
+    # Newest update first, each as "Oct 25, 14:31 UTCResolved - body" like the cleaned RSS
+    def when(update: Dict[str, Any]) -> datetime:
+        return (
+            _timestamp(update.get('display_at')) or _timestamp(update.get('created_at'))
+            or datetime.min.replace(tzinfo=timezone.utc)
+        )
+
+    parts = []
+    for update in sorted(updates, key=when, reverse=True):
+        at = when(update)
+        status = str(update.get('status', ''))
+        stage = _STAGES.get(status, status.replace('_', ' ').capitalize())
+        parts.append(
+            f"{at.strftime('%b')} {at.day}, {at.strftime('%H:%M')} UTC{stage} - {update.get('body', '')}"
+        )
+
+    link = f"{feed_config.page_url}/incidents/{incident_id}"
+    created = _timestamp(incident.get('created_at'))
+    return FeedEntry.compact(
+        link,
+        name,
+        ''.join(parts),
+        link,
+        format_datetime(created) if created else None
+    )
+
+
+class PushReceiver:
+    """
+    POST /push/<service_id>?token=... endpoint for Statuspage webhook subscriptions.
+
+    Requests are checked (token, known service, payload shape) on the
+    HTTP thread and answered 202 straight away; accepted incidents are
+    queued to the monitor, which runs them through the same classify,
+    state and notify steps as a polled entry.
+    """
+
+    def __init__(self, monitor: "StatusMonitor", token: str):
+        self.monitor = monitor
+        self._token = token.encode('utf-8')
+
+    def routes(self) -> Dict[str, PostHandler]:
+        """POST routes to mount on the embedded HTTP server"""
+        return {PREFIX: self.handle}
+
+    def handle(self, request: Request) -> Response:
+        try:
+            result = self._accept(request)
+        except PushError as e:
+            self.monitor.metrics.pushes.labels('rejected').inc()
+            logger.warning("Rejected push to %s: %s", request.path, e)
+            return e.status, TEXT, f"{e}\n".encode('utf-8')
+        self.monitor.metrics.pushes.labels(result).inc()
+        return 202, TEXT, b'Accepted\n'
+
+    def _accept(self, request: Request) -> str:
+        """Validate a push and queue it; 'accepted' or 'ignored'"""
+        token = request.query.get('token') or request.headers.get('x-push-token') or ''
+        if not hmac.compare_digest(token.encode('utf-8'), self._token):
+            raise PushError(403, "invalid token")
+
+        service_id = request.path[len(PREFIX):].strip('/')
+        feed_config = self.monitor.feeds.get(service_id)
+        if feed_config is None:
+            raise PushError(404, f"unknown service {service_id!r}")
+
+        try:
+            payload = json.loads(request.body)
+        except ValueError as e:
+            raise PushError(400, f"invalid JSON: {e}")
+        entry = entry_from_payload(payload, feed_config)
+        if entry is None:
+            logger.debug("Ignoring non-incident push for %s", service_id)
+            return 'ignored'
+        self.monitor.receive_push(service_id, entry)
+        return 'accepted'
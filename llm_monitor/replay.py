@@ -0,0 +1,341 @@
+"""
+Record raw feed responses and replay them through the monitor on a virtual clock
+"""
+
+import bisect
+import gzip
+import json
+import logging
+import tempfile
+import time
+import zlib
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timezone
+from hashlib import blake2b
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Set
+
+from .config import Config, FeedConfig
+from .feed_parser import FetchResult
+from .monitor import StatusMonitor
+
+logger = logging.getLogger(__name__)
+
+
+class FeedRecorder:
+    """
+    Append every fetch result to a gzip-compressed JSON-lines archive.
+
+    Each distinct document is stored once and later responses refer to
+    it by hash, so weeks of polling mostly cost one short line per
+    fetch. Every recorder appends a new gzip member, which keeps earlier
+    sessions intact; documents are deduplicated within a session only.
+
+    Record types, one JSON object per line:
+        {"feed": id, "name": ..., "url": ..., "color": ...}
+        {"body": hash, "data": document}
+        {"t": unix time, "service": id, "status": 200/304/null, "body": hash}
+    """
+
+    def __init__(self, path: Path, clock: Callable[[], float] = time.time):
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._clock = clock
+        self._file = gzip.open(path, 'at', encoding='utf-8')
+        self._feeds: Set[str] = set()
+        self._bodies: Set[str] = set()
+
+    def record(self, service_id: str, feed_config: FeedConfig, result: Optional[FetchResult]) -> None:
+        """Record one fetch; None is a failed fetch"""
+        if service_id not in self._feeds:
+            self._feeds.add(service_id)
+            self._write({
+                'feed': service_id, 'name': feed_config.name,
+                'url': feed_config.url, 'color': feed_config.color
+            })
+
+        event: Dict[str, Any] = {'t': round(self._clock(), 3), 'service': service_id}
+        if result is None:
+            event['status'] = None
+        else:
+            event['status'] = result.status
+            if not result.not_modified:
+                body = blake2b(result.content, digest_size=8).hexdigest()
+                if body not in self._bodies:
+                    self._bodies.add(body)
+                    self._write({
+                        'body': body,
+                        'data': result.content.decode('utf-8', 'surrogateescape')
+                    })
+                event['body'] = body
+        self._write(event)
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        self._file.write(json.dumps(record, separators=(',', ':')))
+        self._file.write('\n')
+
+    def flush(self) -> None:
+        """Make everything recorded so far readable (called once per cycle)"""
+        self._file.flush()
+
+    def close(self) -> None:
+        """Finish the gzip member and close the archive"""
+        self._file.close()
+
+
+class ReplayEvent(NamedTuple):
+    """What a feed served at a point in time: a document hash, or None if the fetch failed"""
+    t: float
+    ok: bool
+    body: Optional[str]
+
+
+@dataclass
+class Archive:
+    """A loaded recording: feeds, per-feed timelines and the documents they refer to"""
+    feeds: Dict[str, FeedConfig] = field(default_factory=dict)
+    events: Dict[str, List[ReplayEvent]] = field(default_factory=dict)
+    bodies: Dict[str, bytes] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: Path) -> "Archive":
+        """
+        Read an archive written by FeedRecorder.
+
+        A truncated tail (e.g. the recorder was killed mid-write) is
+        dropped with a warning instead of failing the whole load.
+        """
+        archive = cls()
+        current: Dict[str, Optional[str]] = {}
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        logger.warning("Skipping malformed line in %s", path)
+                        continue
+                    archive._add(record, current)
+        except (EOFError, zlib.error) as e:
+            logger.warning("Archive %s is truncated, replaying what was read: %s", path, e)
+        for timeline in archive.events.values():
+            timeline.sort(key=lambda event: event.t)
+        return archive
+
+    def _add(self, record: Dict[str, Any], current: Dict[str, Optional[str]]) -> None:
+        if 'service' in record:
+            service_id = record['service']
+            ok = record['status'] is not None
+            # A 304 keeps serving the document in effect before it
+            if 'body' in record:
+                current[service_id] = record['body']
+            self.events.setdefault(service_id, []).append(
+                ReplayEvent(record['t'], ok, current.get(service_id))
+            )
+        elif 'body' in record:
+            self.bodies[record['body']] = record['data'].encode('utf-8', 'surrogateescape')
+        elif 'feed' in record:
+            self.feeds[record['feed']] = FeedConfig.from_dict(record)
+
+    @property
+    def start(self) -> float:
+        return min((timeline[0].t for timeline in self.events.values() if timeline), default=0.0)
+
+    @property
+    def end(self) -> float:
+        return max((timeline[-1].t for timeline in self.events.values() if timeline), default=0.0)
+
+
+class VirtualClock:
+    """Replay time, advanced by the driver instead of the wall clock"""
+
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class _ReplayFetcher:
+    """
+    Stand in for FeedParser.fetch_feed, serving each feed as it was at the virtual time.
+
+    Documents are served with their hash as ETag, so the monitor's
+    conditional requests get 304 until the recorded feed changes.
+    """
+
+    def __init__(self, archive: Archive, clock: VirtualClock):
+        self.archive = archive
+        self.clock = clock
+        self.urls = {feed.url: service_id for service_id, feed in archive.feeds.items()}
+        self.times = {
+            service_id: [event.t for event in timeline]
+            for service_id, timeline in archive.events.items()
+        }
+
+    def __call__(
+        self,
+        url: str,
+        etag: Optional[str] = None,
+        modified: Optional[str] = None,
+        timeout: Optional[float] = None
+    ) -> Optional[FetchResult]:
+        service_id = self.urls[url]
+        timeline = self.archive.events.get(service_id)
+        if not timeline:
+            return None
+        # Before its first recording a feed is assumed to look like it did then
+        index = max(0, bisect.bisect_right(self.times[service_id], self.clock.now) - 1)
+        event = timeline[index]
+        if not event.ok:
+            return None
+        if event.body is None or event.body == etag:
+            return FetchResult(304, b'', etag=etag)
+        return FetchResult(200, self.archive.bodies[event.body], etag=event.body)
+
+
+class ReplayedNotification(NamedTuple):
+    """A notification the monitor sent during replay, at virtual time `t`"""
+    t: float
+    service_name: str
+    kind: str
+    title: str
+
+
+class _CapturingNotifier:
+    """Notifier that records messages instead of sending them"""
+
+    def __init__(self, clock: VirtualClock):
+        self.clock = clock
+        self.sent: List[ReplayedNotification] = []
+
+    def send(self, service_name: str, title: str, kind: str, **kwargs: Any) -> bool:
+        self.sent.append(ReplayedNotification(self.clock.now, service_name, kind, title))
+        return True
+
+
+@dataclass
+class ReplayReport:
+    """Outcome of a replay"""
+    cycles: int = 0
+    failed: int = 0
+    start: float = 0.0
+    end: float = 0.0
+    elapsed: float = 0.0
+    notifications: List[ReplayedNotification] = field(default_factory=list)
+
+    @property
+    def speedup(self) -> float:
+        """Virtual time covered per second of wall time"""
+        return (self.end - self.start) / self.elapsed if self.elapsed else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        def iso(t: float) -> str:
+            return datetime.fromtimestamp(t, timezone.utc).isoformat()
+
+        return {
+            'cycles': self.cycles,
+            'failed': self.failed,
+            'start': iso(self.start),
+            'end': iso(self.end),
+            'elapsed_s': round(self.elapsed, 3),
+            'speedup': round(self.speedup, 1),
+            'notifications': [
+                {'t': iso(n.t), 'service': n.service_name, 'kind': n.kind, 'title': n.title}
+                for n in self.notifications
+            ],
+        }
+
+
+class ReplayDriver:
+    """
+    Run a recorded archive through StatusMonitor, one check cycle per interval of virtual time.
+
+    The monitor runs unmodified except for its fetcher and notifier:
+    fetches are answered from the archive at the virtual time, and
+    notifications are captured in the report instead of being sent.
+    State lives in a temporary file, so the real state is never touched.
+    """
+
+    def __init__(
+        self,
+        archive: Archive,
+        config: Config,
+        interval: Optional[float] = None,
+        speed: float = 1000.0,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """
+        Args:
+            archive: Recording to replay
+            config: Monitor configuration (parsing options are kept; state,
+                history, routing, tracing and the HTTP server are disabled)
+            interval: Virtual seconds between cycles (default: CHECK_INTERVAL)
+            speed: Virtual seconds per wall second; 0 runs as fast as possible
+            sleep: Used to pace cycles at `speed`
+        """
+        self.archive = archive
+        self.config = config
+        self.interval = float(interval or config.check_interval)
+        self.speed = speed
+        self._sleep = sleep
+
+    def run(self) -> ReplayReport:
+        """Replay the whole archive and report what the monitor did"""
+        clock = VirtualClock(self.archive.start)
+        report = ReplayReport(start=self.archive.start)
+        started = time.perf_counter()
+        with tempfile.TemporaryDirectory() as directory:
+            config = replace(
+                self.config,
+                state_file=Path(directory) / 'state.json',
+                history_file=None,
+                record_file=None,
+                routes_file=None,
+                slo_file=None,
+                component_status=False,
+                trace_file=None,
+                http_port=0,
+                profile=None
+            )
+            monitor = StatusMonitor(config, feeds=dict(self.archive.feeds))
+            monitor.parser.fetch_feed = _ReplayFetcher(self.archive, clock)
+            notifier = _CapturingNotifier(clock)
+            monitor.notifier = notifier
+            if monitor.dedup is not None:
+                # Expire duplicates in virtual time, as they would have expired live
+                monitor.dedup.clock = clock
+            try:
+                while clock.now <= self.archive.end:
+                    cycle_started = time.perf_counter()
+                    report.failed += monitor.run_check_cycle()
+                    report.cycles += 1
+                    if self.speed > 0:
+                        remaining = self.interval / self.speed - (time.perf_counter() - cycle_started)
+                        if remaining > 0:
+                            self._sleep(remaining)
+                    clock.advance(self.interval)
+            finally:
+                monitor.close()
+
+        report.end = clock.now - self.interval if report.cycles else clock.now
+        report.elapsed = time.perf_counter() - started
+        report.notifications = notifier.sent
+        return report
+
+
+def summarize(report: ReplayReport) -> List[str]:
+    """Human-readable summary lines for the CLI"""
+    days = (report.end - report.start) / 86400
+    lines = [
+        f"Replayed {days:.1f} days in {report.cycles} cycles, {report.elapsed:.1f}s "
+        f"({report.speedup:.0f}x), {report.failed} failed fetches, "
+        f"{len(report.notifications)} notifications"
+    ]
+    for notification in report.notifications:
+        when = datetime.fromtimestamp(notification.t, timezone.utc).strftime('%Y-%m-%d %H:%M')
+        lines.append(f"  {when}  {notification.kind:<8} {notification.service_name}: {notification.title}")
+    return lines
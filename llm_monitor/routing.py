@@ -0,0 +1,198 @@
+"""
+Notification routing: send each incident to the destinations its service, severity or keywords map to
+"""
+
+import json
+import logging
+import re
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, List, Optional, Pattern, Set, Tuple
+
+from .incidents import SEVERITIES
+from .notifiers import Notifier, create_notifier
+
+logger = logging.getLogger(__name__)
+
+# (service, severity) a rule is limited to; None matches any
+RouteKey = Tuple[Optional[str], Optional[str]]
+
+
+class RoutingTable:
+    """
+    Routing rules compiled into lookup tables.
+
+    Rules without keywords are indexed by (service, severity) with None
+    as a wildcard, so routing an incident is three dict lookups however
+    many rules and feeds there are. Keyword rules are folded into one
+    regex that finds every keyword in the text, overlapping ones
+    included; each keyword found indexes the rules that use it. Incidents
+    no rule matches go to the default destinations (or, with none
+    configured, to the monitor's own webhook).
+
+    Every destination has one notifier, and so one pooled HTTP session,
+    shared by all the rules that send to it.
+    """
+
+    def __init__(
+        self,
+        destinations: Dict[str, Notifier],
+        index: Dict[RouteKey, FrozenSet[str]],
+        keywords: Dict[str, Dict[RouteKey, FrozenSet[str]]],
+        default: Tuple[str, ...] = ()
+    ):
+        self.destinations = destinations
+        self._index = index
+        self._keywords = keywords
+        self._keyword_pattern: Optional[Pattern[str]] = None
+        # Keywords that start another one ("api" in "api gateway"), by the longer keyword
+        self._keyword_prefixes: Dict[str, Tuple[str, ...]] = {}
+        if keywords:
+            # A lookahead consumes nothing, so keywords that overlap across
+            # positions ("api gateway", "gateway errors") are all found. At
+            # one position the alternation only reports the longest keyword;
+            # the shorter ones it starts with are added from the prefix table.
+            alternatives = sorted(keywords, key=len, reverse=True)
+            self._keyword_pattern = re.compile(
+                r'\b(?=(' + '|'.join(re.escape(k) for k in alternatives) + r')\b)'
+            )
+            for keyword in alternatives:
+                prefixes = tuple(
+                    other for other in alternatives
+                    if len(other) < len(keyword) and re.match(re.escape(other) + r'\b', keyword)
+                )
+                if prefixes:
+                    self._keyword_prefixes[keyword] = prefixes
+        self.default = tuple(destinations[name] for name in default)
+        # Destination order for results, so notifications go out in file order
+        self._order = {name: position for position, name in enumerate(destinations)}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RoutingTable":
+        """
+        Compile a ROUTES_FILE document.
+
+        Raises:
+            ValueError: If a destination or rule is malformed
+        """
+        raw_destinations = data.get('destinations')
+        if not isinstance(raw_destinations, dict) or not raw_destinations:
+            raise ValueError("'destinations' must be a non-empty object")
+
+        destinations: Dict[str, Notifier] = {}
+        for name, spec in raw_destinations.items():
+            try:
+                notifier = create_notifier(str(spec.get('type', 'discord')).lower(), str(spec['url']))
+            except (AttributeError, KeyError) as e:
+                raise ValueError(f"Invalid destination '{name}': missing {e}")
+            if notifier is None:
+                raise ValueError(f"Invalid destination '{name}': type must be 'discord' or 'slack'")
+            destinations[name] = notifier
+
+        def names(value: Any, where: str) -> List[str]:
+            listed = [value] if isinstance(value, str) else value
+            if not isinstance(listed, list) or not all(isinstance(n, str) for n in listed):
+                raise ValueError(f"{where}: 'to' must be a destination name or a list of them")
+            unknown = [n for n in listed if n not in destinations]
+            if unknown:
+                raise ValueError(f"{where}: unknown destination(s) {', '.join(unknown)}")
+            return listed
+
+        index: Dict[RouteKey, Set[str]] = {}
+        keywords: Dict[str, Dict[RouteKey, Set[str]]] = {}
+        rules = data.get('routes', [])
+        if not isinstance(rules, list):
+            raise ValueError("'routes' must be a list")
+        for position, rule in enumerate(rules):
+            where = f"Route {position + 1}"
+            if not isinstance(rule, dict):
+                raise ValueError(f"{where} must be an object")
+            targets = names(rule.get('to'), where)
+            severity = rule.get('severity')
+            if severity is not None and severity not in SEVERITIES:
+                raise ValueError(f"{where}: severity must be one of {', '.join(SEVERITIES)}")
+            rule_keywords = rule.get('keyword', [])
+            if isinstance(rule_keywords, str):
+                rule_keywords = [rule_keywords]
+            if not isinstance(rule_keywords, list) or \
+                    not all(isinstance(k, str) and k.strip() for k in rule_keywords):
+                raise ValueError(f"{where}: 'keyword' must be a word or a list of words")
+            if 'service' not in rule and severity is None and not rule_keywords:
+                raise ValueError(f"{where} must match on service, severity or keyword")
+
+            # A list of services is the same rule repeated for each
+            services = rule.get('service')
+            services = services if isinstance(services, list) else [services]
+            if not all(isinstance(s, str) for s in services) and services != [None]:
+                raise ValueError(f"{where}: 'service' must be a service ID or a list of them")
+            for service in services:
+                key = (service, severity)
+                if rule_keywords:
+                    for keyword in rule_keywords:
+                        keywords.setdefault(keyword.lower(), {}).setdefault(key, set()).update(targets)
+                else:
+                    index.setdefault(key, set()).update(targets)
+
+        return cls(
+            destinations,
+            {key: frozenset(targets) for key, targets in index.items()},
+            {
+                keyword: {key: frozenset(targets) for key, targets in rules.items()}
+                for keyword, rules in keywords.items()
+            },
+            tuple(names(data.get('default', []), "default"))
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> "RoutingTable":
+        """
+        Read and compile a ROUTES_FILE.
+
+        Raises:
+            ValueError: If the file cannot be read or is malformed
+        """
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            raise ValueError(f"Cannot read ROUTES_FILE {path}: {e}")
+        if not isinstance(data, dict):
+            raise ValueError(f"ROUTES_FILE {path} must contain a JSON object")
+        try:
+            return cls.from_dict(data)
+        except ValueError as e:
+            raise ValueError(f"Invalid ROUTES_FILE {path}: {e}")
+
+    def route(self, service_id: str, severity: str, text: str = '') -> Tuple[Notifier, ...]:
+        """
+        Destinations for an incident; the defaults if no rule matches.
+
+        Args:
+            service_id: Service the incident belongs to
+            severity: One of SEVERITIES
+            text: Title and description, searched for keyword rules
+        """
+        matched: Set[str] = set()
+        for key in ((service_id, severity), (service_id, None), (None, severity)):
+            targets = self._index.get(key)
+            if targets:
+                matched |= targets
+
+        if self._keyword_pattern is not None and text:
+            found = set(self._keyword_pattern.findall(text.lower()))
+            for keyword in list(found):
+                found.update(self._keyword_prefixes.get(keyword, ()))
+            for keyword in found:
+                for (service, rule_severity), targets in self._keywords[keyword].items():
+                    if service in (None, service_id) and rule_severity in (None, severity):
+                        matched |= targets
+
+        if not matched:
+            return self.default
+        return tuple(
+            self.destinations[name] for name in sorted(matched, key=self._order.__getitem__)
+        )
+
+    def close(self) -> None:
+        """Close every destination's pooled connections"""
+        for notifier in self.destinations.values():
+            notifier.close()
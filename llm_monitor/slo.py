@@ -0,0 +1,143 @@
+"""
+Detection latency of alerts, from a feed publishing an incident to the webhook accepting it
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from .diagnostics import percentile
+
+logger = logging.getLogger(__name__)
+
+# Stages of an alert's latency, in order; 'total' is publish to ack
+STAGES = ('publish_to_fetch', 'fetch_to_classify', 'classify_to_ack', 'total')
+
+PERCENTILES = (50, 90, 99)
+
+
+class AlertLatency(NamedTuple):
+    """
+    Latency of one delivered alert, in seconds.
+
+    `publish_to_fetch` (and so `total`) is None when the entry has no
+    readable publish date. It is measured against the feed's own date, so
+    clock skew on the status page shows up here; negative values are
+    clamped to 0.
+    """
+    t: float
+    service: str
+    entry_id: str
+    destination: str
+    publish_to_fetch: Optional[float]
+    fetch_to_classify: float
+    classify_to_ack: float
+
+    @property
+    def total(self) -> Optional[float]:
+        if self.publish_to_fetch is None:
+            return None
+        return self.publish_to_fetch + self.fetch_to_classify + self.classify_to_ack
+
+
+class SloLog:
+    """Append every alert's latency to a JSON-lines file, one object per alert"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(path, 'a', encoding='utf-8')
+
+    def write(self, alert: AlertLatency) -> None:
+        self._file.write(json.dumps(alert._asdict(), separators=(',', ':')))
+        self._file.write('\n')
+
+    def flush(self) -> None:
+        """Make alerts logged so far readable (called once per cycle)"""
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def load(path: Path, since: Optional[float] = None, until: Optional[float] = None) -> List[AlertLatency]:
+    """Read alerts logged by SloLog, optionally only those acked within [since, until)"""
+    alerts = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                alert = AlertLatency(**json.loads(line))
+            except (TypeError, ValueError):
+                logger.warning("Skipping malformed line in %s", path)
+                continue
+            if since is not None and alert.t < since:
+                continue
+            if until is not None and alert.t >= until:
+                continue
+            alerts.append(alert)
+    return alerts
+
+
+def _stats(alerts: List[AlertLatency], target: float) -> Dict[str, Any]:
+    """Percentiles per stage and the share of alerts delivered within `target`"""
+    row: Dict[str, Any] = {'alerts': len(alerts)}
+    for stage in STAGES:
+        values = [v for v in (getattr(alert, stage) for alert in alerts) if v is not None]
+        for pct in PERCENTILES:
+            value = percentile(values, pct)
+            row[f'{stage}_p{pct}'] = None if value is None else round(value, 3)
+        row[f'{stage}_max'] = round(float(max(values)), 3) if values else None
+    totals = [alert.total for alert in alerts if alert.total is not None]
+    row['within_target'] = (
+        round(100.0 * sum(total <= target for total in totals) / len(totals), 2)
+        if totals else None
+    )
+    return row
+
+
+def summarize(alerts: List[AlertLatency], target: float = 300.0) -> List[Dict[str, Any]]:
+    """
+    One row per service plus an 'all' row, with p50/p90/p99/max per stage.
+
+    Args:
+        alerts: Logged alerts
+        target: Publish-to-ack SLO in seconds; `within_target` is the
+            percentage of alerts (with a publish date) that met it
+    """
+    by_service: Dict[str, List[AlertLatency]] = {}
+    for alert in alerts:
+        by_service.setdefault(alert.service, []).append(alert)
+    rows = [
+        {'service': service_id, **_stats(by_service[service_id], target)}
+        for service_id in sorted(by_service)
+    ]
+    rows.append({'service': 'all', **_stats(alerts, target)})
+    return rows
+
+
+def render(rows: List[Dict[str, Any]], output_format: str = 'table') -> str:
+    """Summary rows as a table, JSON or JSON lines"""
+    if output_format == 'json':
+        return json.dumps(rows, indent=2)
+    if output_format == 'jsonl':
+        return ''.join(json.dumps(row) + '\n' for row in rows)
+
+    def cell(value: Optional[float]) -> str:
+        return '-' if value is None else f"{value:.1f}"
+
+    lines = [
+        f"{'service':<16}{'alerts':>7}"
+        + ''.join(f"{stage + ' p50/p99':>28}" for stage in STAGES)
+        + f"{'in SLO %':>10}"
+    ]
+    for row in rows:
+        lines.append(
+            f"{row['service']:<16}{row['alerts']:>7}"
+            + ''.join(
+                f"{cell(row[f'{stage}_p50']) + ' / ' + cell(row[f'{stage}_p99']):>28}"
+                for stage in STAGES
+            )
+            + f"{cell(row['within_target']):>10}"
+        )
+    return '\n'.join(lines) + '\n'
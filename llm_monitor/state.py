@@ -4,8 +4,10 @@ State management for tracking processed RSS entries
 
 import json
 import logging
+import os
+import threading
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -17,38 +19,47 @@ class StateManager:
     def __init__(self, state_file: Path):
         self.state_file = state_file
         self._state: Dict[str, Any] = {}
+        # Guards _state so a shutdown watchdog can flush while a check runs
+        self._lock = threading.RLock()
+        # Bumped whenever entry state changes, so readers can cache views of it
+        self.version = 0
 
     def load(self) -> Dict[str, Any]:
         """Load state from file"""
         if not self.state_file.exists():
-            logger.info(f"State file not found: {self.state_file}")
+            logger.info("State file not found: %s", self.state_file)
             self._state = {}
             return self._state
 
         try:
             with open(self.state_file, 'r') as f:
                 self._state = json.load(f)
-            logger.info(f"Loaded state from {self.state_file}")
+            self.version += 1
+            logger.info("Loaded state from %s", self.state_file)
             return self._state
         except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse state file {self.state_file}: {e}")
+            logger.error("Failed to parse state file %s: %s", self.state_file, e)
             self._state = {}
             return self._state
         except Exception as e:
-            logger.error(f"Failed to load state from {self.state_file}: {e}")
+            logger.error("Failed to load state from %s: %s", self.state_file, e)
             self._state = {}
             return self._state
 
     def save(self) -> bool:
-        """Save current state to file"""
+        """Save current state to file, atomically replacing the old one"""
+        tmp_file = self.state_file.with_name(self.state_file.name + '.tmp')
         try:
             self.state_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.state_file, 'w') as f:
-                json.dump(self._state, f, indent=2)
-            logger.debug(f"Saved state to {self.state_file}")
+            with self._lock:
+                # dumps() encodes in one C call; dump() streams through the pure-Python encoder
+                with open(tmp_file, 'w') as f:
+                    f.write(json.dumps(self._state, indent=2))
+                os.replace(tmp_file, self.state_file)
+            logger.debug("Saved state to %s", self.state_file)
             return True
         except Exception as e:
-            logger.error(f"Failed to save state to {self.state_file}: {e}")
+            logger.error("Failed to save state to %s: %s", self.state_file, e)
             return False
 
     def get_last_id(self, service_id: str) -> Optional[str]:
@@ -56,19 +67,101 @@ class StateManager:
         service_state = self._state.get(service_id, {})
         return service_state.get('last_id')
 
+    def get_last_entry(self, service_id: str) -> Tuple[Optional[str], Optional[str]]:
+        """Get the (entry ID, content fingerprint) of the last processed entry"""
+        service_state = self._state.get(service_id, {})
+        return service_state.get('last_id'), service_state.get('last_hash')
+
+    def set_content_hash(self, service_id: str, content_hash: str) -> None:
+        """Record the fingerprint of the last entry without touching anything else"""
+        with self._lock:
+            self._state.setdefault(service_id, {})['last_hash'] = content_hash
+
     def update_service(
         self,
         service_id: str,
         entry_id: str,
-        title: str
+        title: str,
+        active: bool = False,
+        link: Optional[str] = None,
+        content_hash: Optional[str] = None
     ) -> None:
         """Update state for a service with new entry information"""
-        self._state[service_id] = {
-            'last_id': entry_id,
-            'last_title': title,
-            'last_checked': datetime.now().isoformat()
-        }
-        logger.debug(f"Updated state for {service_id}: {title}")
+        with self._lock:
+            self._state.setdefault(service_id, {}).update({
+                'last_id': entry_id,
+                'last_title': title,
+                'last_link': link,
+                'last_hash': content_hash,
+                'active': active,
+                'last_checked': datetime.now().isoformat()
+            })
+            self.version += 1
+        logger.debug("Updated state for %s: %s", service_id, title)
+
+    def get_validators(
+        self,
+        service_id: str,
+        prefix: str = ''
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """Get the (ETag, Last-Modified) pair from the last feed (or `prefix`ed document) response"""
+        service_state = self._state.get(service_id, {})
+        return service_state.get(prefix + 'etag'), service_state.get(prefix + 'last_modified')
+
+    def set_validators(
+        self,
+        service_id: str,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        prefix: str = ''
+    ) -> None:
+        """Remember conditional GET validators for a service's feed (or `prefix`ed document)"""
+        with self._lock:
+            service_state = self._state.setdefault(service_id, {})
+            service_state[prefix + 'etag'] = etag
+            service_state[prefix + 'last_modified'] = last_modified
+
+    def get_components(self, service_id: str) -> Optional[Dict[str, int]]:
+        """Get the status of each component by ID, or None before the first summary"""
+        return self._state.get(service_id, {}).get('components')
+
+    def set_components(self, service_id: str, statuses: Dict[str, int]) -> None:
+        """Replace a service's component status vector"""
+        with self._lock:
+            self._state.setdefault(service_id, {})['components'] = statuses
+            self.version += 1
+
+    def get_incidents(self, service_id: str) -> Dict[str, Dict[str, Any]]:
+        """Get the open incidents for a service, keyed by incident ID"""
+        return self._state.get(service_id, {}).get('incidents', {})
+
+    def set_incident(self, service_id: str, incident_id: str, record: Dict[str, Any]) -> None:
+        """Add or replace an open incident"""
+        with self._lock:
+            service_state = self._state.setdefault(service_id, {})
+            service_state.setdefault('incidents', {})[incident_id] = record
+            self.version += 1
+
+    def remove_incident(self, service_id: str, incident_id: str) -> None:
+        """Drop a closed incident"""
+        with self._lock:
+            service_state = self._state.get(service_id, {})
+            incidents = service_state.get('incidents', {})
+            if incidents.pop(incident_id, None) is None:
+                return
+            if not incidents:
+                del service_state['incidents']
+            self.version += 1
+
+    def snapshot(self) -> Tuple[int, Dict[str, Dict[str, Any]]]:
+        """Get the state version and a copy of the state, safe to read from other threads"""
+        with self._lock:
+            snapshot = {}
+            for service_id, service_state in self._state.items():
+                snapshot[service_id] = dict(service_state)
+                if 'incidents' in service_state:
+                    snapshot[service_id]['incidents'] = dict(service_state['incidents'])
+            return self.version, snapshot
 
     def get_state(self) -> Dict[str, Any]:
         """Get the current state dictionary"""
@@ -0,0 +1,146 @@
+"""
+Read-only HTTP status API backed by the monitor's in-memory state
+"""
+
+import json
+import threading
+import time
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, Optional, Tuple
+
+from .httpd import Response
+
+if TYPE_CHECKING:
+    from .monitor import StatusMonitor
+
+CONTENT_TYPE = 'application/json; charset=utf-8'
+
+
+def _isoformat(timestamp: float) -> Optional[str]:
+    """Format a Unix timestamp as UTC ISO 8601, None for 'never'"""
+    if not timestamp:
+        return None
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat()
+
+
+class _Snapshot:
+    """A JSON document rebuilt only when its cache key changes"""
+
+    def __init__(self, key: Callable[[], Hashable], build: Callable[[], Any]):
+        self._key = key
+        self._build = build
+        self._lock = threading.Lock()
+        self._cached: Tuple[Optional[Hashable], bytes] = (None, b'')
+
+    def get(self) -> bytes:
+        key = self._key()
+        cached_key, body = self._cached
+        if cached_key == key:
+            return body
+        with self._lock:
+            # Another request may have rebuilt it while we waited
+            if self._cached[0] != key:
+                body = json.dumps(self._build(), ensure_ascii=False).encode('utf-8')
+                self._cached = (key, body)
+            return self._cached[1]
+
+
+class StatusAPI:
+    """
+    Serves /status, /incidents and /healthz for dashboards and health checks.
+
+    /status and /incidents are pre-serialized and only rebuilt after the
+    state changes or a cycle completes, so polling them costs a dict
+    lookup and a socket write; the monitor loop never does any work for
+    them. /healthz is computed per request from two timestamps.
+    """
+
+    def __init__(self, monitor: "StatusMonitor"):
+        self.monitor = monitor
+        self.started_at = time.time()
+        self._status = _Snapshot(self._status_key, self._build_status)
+        self._incidents = _Snapshot(lambda: self.monitor.state_manager.version,
+                                    self._build_incidents)
+
+    def routes(self) -> Dict[str, Callable[[], Response]]:
+        """Route handlers to register on the embedded HTTP server"""
+        return {
+            '/status': self.status,
+            '/incidents': self.incidents,
+            '/healthz': self.healthz,
+        }
+
+    def status(self) -> Response:
+        return 200, CONTENT_TYPE, self._status.get()
+
+    def incidents(self) -> Response:
+        return 200, CONTENT_TYPE, self._incidents.get()
+
+    def healthz(self) -> Response:
+        """Liveness: 200 while cycles keep completing on schedule, else 503"""
+        monitor = self.monitor
+        last_cycle = monitor.last_cycle_at
+        age = time.time() - (last_cycle or self.started_at)
+        max_age = 2 * monitor.config.check_interval + monitor.config.effective_cycle_budget
+
+        if monitor.stopping:
+            status, healthy = 'stopping', False
+        elif age > max_age:
+            status, healthy = 'stale', False
+        else:
+            status, healthy = 'ok', True
+
+        body = json.dumps({
+            'status': status,
+            'last_cycle': _isoformat(last_cycle),
+            'age_seconds': round(age, 1),
+        }).encode('utf-8')
+        return (200 if healthy else 503), CONTENT_TYPE, body
+
+    def _status_key(self) -> Hashable:
+        return self.monitor.state_manager.version, self.monitor.last_cycle_at
+
+    def _build_status(self) -> Dict[str, Any]:
+        monitor = self.monitor
+        _, state = monitor.state_manager.snapshot()
+        services = {}
+        for service_id, feed_config in monitor.feeds.items():
+            service_state = state.get(service_id, {})
+            services[service_id] = {
+                'name': feed_config.name,
+                'url': feed_config.url,
+                'active_incident': bool(service_state.get('active')),
+                'degraded': bool(service_state.get('incidents')),
+                'open_incidents': len(service_state.get('incidents', {})),
+                'last_id': service_state.get('last_id'),
+                'last_title': service_state.get('last_title'),
+                'last_link': service_state.get('last_link'),
+                'last_changed': service_state.get('last_checked'),
+                'last_success': _isoformat(
+                    monitor.metrics.service(service_id).last_success.value
+                ),
+            }
+        return {
+            'last_cycle': _isoformat(monitor.last_cycle_at),
+            'check_interval': monitor.config.check_interval,
+            'services': services,
+        }
+
+    def _build_incidents(self) -> Dict[str, Any]:
+        monitor = self.monitor
+        _, state = monitor.state_manager.snapshot()
+        incidents = []
+        for service_id, feed_config in monitor.feeds.items():
+            open_incidents = state.get(service_id, {}).get('incidents', {})
+            for incident_id, record in open_incidents.items():
+                incidents.append({
+                    'service': service_id,
+                    'name': feed_config.name,
+                    'id': incident_id,
+                    'title': record.get('title'),
+                    'link': record.get('link'),
+                    'stage': record.get('stage'),
+                    'detected_at': record.get('opened_at'),
+                    'updated_at': record.get('updated_at'),
+                })
+        return {'incidents': incidents}
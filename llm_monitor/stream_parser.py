@@ -0,0 +1,142 @@
+"""
+Streaming RSS/Atom entry extraction
+"""
+
+import logging
+from typing import Dict, Iterator, List, Optional
+from xml.etree.ElementTree import Element, ParseError, XMLPullParser
+
+from .feed_parser import FeedEntry, FeedParser
+
+logger = logging.getLogger(__name__)
+
+# Bytes handed to the pull parser at a time; parsing stops at the first
+# chunk that completes the last wanted entry
+CHUNK_SIZE = 16 * 1024
+
+# RSS <item> and Atom <entry>
+_ENTRY_TAGS = frozenset(('item', 'entry'))
+
+
+def _local_name(tag: str) -> str:
+    """Strip the {namespace} prefix from an element tag"""
+    return tag.rsplit('}', 1)[-1]
+
+
+def _to_entry(element: Element) -> Optional[FeedEntry]:
+    """Build a FeedEntry from an <item>/<entry>, using feedparser's field precedence"""
+    fields: Dict[str, str] = {}
+    link = ''
+    for child in element:
+        name = _local_name(child.tag)
+        if name == 'link':
+            href = child.get('href')
+            if href is None:
+                link = (child.text or '').strip()
+            elif not link and child.get('rel', 'alternate') == 'alternate':
+                link = href.strip()
+        elif name not in fields:
+            fields[name] = child.text or ''
+
+    entry_id = (fields.get('guid') or fields.get('id') or link).strip()
+    if not entry_id:
+        logger.warning("Feed entry has no ID or link")
+        return None
+
+    description = fields.get('description') or fields.get('summary') or fields.get('content', '')
+    return FeedEntry.compact(
+        entry_id=entry_id,
+        title=fields.get('title', 'Status Update').strip(),
+        description=FeedParser._clean_html(description) if description else '',
+        link=link,
+        published=fields.get('pubDate') or fields.get('published') or fields.get('updated')
+    )
+
+
+def _iter_entry_elements(content: bytes) -> Iterator[Optional[FeedEntry]]:
+    """
+    Convert entry elements one at a time as the parser reaches them.
+
+    Yields None for entries without an ID. Each element is discarded once
+    converted, and no more input is parsed once the caller stops.
+    """
+    parser = XMLPullParser(events=('end',))
+    for offset in range(0, len(content), CHUNK_SIZE):
+        parser.feed(content[offset:offset + CHUNK_SIZE])
+        for _, element in parser.read_events():
+            if _local_name(element.tag) in _ENTRY_TAGS:
+                entry = _to_entry(element)
+                element.clear()
+                yield entry
+    parser.close()
+
+
+def iter_entries(
+    content: bytes,
+    stop_id: Optional[str] = None,
+    max_entries: Optional[int] = None
+) -> Iterator[FeedEntry]:
+    """
+    Yield entries in document order (newest first on status pages).
+
+    The document is fed to an incremental parser chunk by chunk, so work
+    stops as soon as the last-seen entry or `max_entries` is reached and
+    memory stays proportional to the entries actually yielded.
+
+    Args:
+        content: Raw RSS or Atom document
+        stop_id: Entry ID already processed; iteration ends before it
+        max_entries: Maximum number of entries to yield
+
+    Raises:
+        xml.etree.ElementTree.ParseError: If the document is not well-formed
+    """
+    if max_entries is not None and max_entries <= 0:
+        return
+    yielded = 0
+    for entry in _iter_entry_elements(content):
+        if entry is None:
+            continue
+        if stop_id is not None and entry.entry_id == stop_id:
+            return
+        yield entry
+        yielded += 1
+        if max_entries is not None and yielded >= max_entries:
+            return
+
+
+def extract_entries(
+    content: bytes,
+    limit: int,
+    stop_id: Optional[str] = None,
+    url: str = ''
+) -> Optional[List[FeedEntry]]:
+    """
+    Extract up to `limit` new entries, or None if feedparser should be used instead.
+
+    None is returned for documents the streaming parser cannot handle:
+    malformed XML (feedparser is more forgiving) or documents without
+    any RSS/Atom entries.
+
+    Args:
+        content: Raw RSS or Atom document
+        limit: Maximum number of entries to extract
+        stop_id: Entry ID already processed; extraction ends before it
+        url: Feed URL, used for log messages only
+    """
+    entries: List[FeedEntry] = []
+    seen = False
+    try:
+        for entry in _iter_entry_elements(content):
+            seen = True
+            if entry is None:
+                continue
+            if entry.entry_id == stop_id or limit <= 0:
+                break
+            entries.append(entry)
+            if len(entries) >= limit:
+                break
+    except ParseError as e:
+        logger.debug("Streaming parse failed for %s, falling back to feedparser: %s", url, e)
+        return None
+    return entries if seen else None
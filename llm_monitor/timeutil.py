@@ -0,0 +1,65 @@
+"""
+Feed timestamp parsing
+"""
+
+import re
+from calendar import timegm
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Optional
+
+_MONTHS = {
+    name: number for number, name in enumerate(
+        ('jan', 'feb', 'mar', 'apr', 'may', 'jun',
+         'jul', 'aug', 'sep', 'oct', 'nov', 'dec'), start=1
+    )
+}
+
+# The RFC 822 shape every Statuspage feed uses: "Sat, 25 Oct 2025 13:03:00 +0000"
+_RFC822 = re.compile(
+    r'(?:[A-Za-z]{3}, )?(\d{1,2}) ([A-Za-z]{3}) (\d{4}) (\d{2}):(\d{2})(?::(\d{2}))? '
+    r'(?:([+-])(\d{2})(\d{2})|GMT|UTC|UT|Z)$'
+)
+
+
+def _rfc822(value: str) -> Optional[int]:
+    """Fast path for numeric-offset and GMT RFC 822 dates"""
+    match = _RFC822.match(value)
+    if match is None or match.group(2).lower() not in _MONTHS:
+        return None
+    day, month, year, hour, minute, second, sign, offset_h, offset_m = match.groups()
+    timestamp = timegm((
+        int(year), _MONTHS[month.lower()], int(day), int(hour), int(minute), int(second or 0)
+    ))
+    if sign:
+        offset = int(offset_h) * 3600 + int(offset_m) * 60
+        timestamp -= offset if sign == '+' else -offset
+    return timestamp
+
+
+@lru_cache(maxsize=4096)
+def parse_timestamp(value: Optional[str]) -> Optional[int]:
+    """
+    RSS (RFC 822) or Atom (ISO 8601) date as UTC epoch seconds, or None.
+
+    Cached by the string: a feed repeats the same dates on every poll, so
+    only an entry's first sighting pays for parsing. Dates without a
+    timezone are taken as UTC.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    timestamp = _rfc822(value)
+    if timestamp is not None:
+        return timestamp
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        try:
+            when = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return int(when.timestamp())
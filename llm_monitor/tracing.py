@@ -0,0 +1,233 @@
+"""
+Lightweight tracing spans with pluggable hooks
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# OpenTelemetry status codes
+STATUS_UNSET = 0
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar('llm_monitor_span', default=None)
+
+
+class Span:
+    """A timed unit of work, optionally nested under a parent span"""
+
+    __slots__ = (
+        'tracer', 'name', 'trace_id', 'span_id', 'parent_id', 'attributes',
+        'start_ns', 'end_ns', 'status', 'status_message', '_token',
+    )
+
+    def __init__(
+        self,
+        tracer: "Tracer",
+        name: str,
+        attributes: Dict[str, Any],
+        parent: Optional["Span"]
+    ):
+        self.tracer = tracer
+        self.name = name
+        self.trace_id = parent.trace_id if parent else os.urandom(16).hex()
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent.span_id if parent else None
+        self.attributes = attributes
+        self.start_ns = 0
+        self.end_ns = 0
+        self.status = STATUS_UNSET
+        self.status_message = ''
+        self._token = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    @property
+    def duration(self) -> float:
+        """Span duration in seconds"""
+        return (self.end_ns - self.start_ns) / 1e9
+
+    def __enter__(self) -> "Span":
+        self.start_ns = time.time_ns()
+        self._token = _current_span.set(self)
+        for hook in self.tracer.hooks:
+            hook.on_start(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.end_ns = time.time_ns()
+        _current_span.reset(self._token)
+        if exc_type is not None:
+            self.status = STATUS_ERROR
+            self.status_message = f"{exc_type.__name__}: {exc}"
+        for hook in self.tracer.hooks:
+            try:
+                hook.on_end(self)
+            except Exception as e:
+                logger.error("Span hook %r failed: %s", hook, e)
+
+
+class _NoopSpan:
+    """Shared stand-in used while no hooks are registered"""
+
+    __slots__ = ()
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class SpanHook:
+    """Base class for span start/end callbacks"""
+
+    def on_start(self, span: Span) -> None:
+        """Called when a span starts"""
+
+    def on_end(self, span: Span) -> None:
+        """Called when a span ends"""
+
+    def shutdown(self) -> None:
+        """Flush and release any resources"""
+
+
+class Tracer:
+    """
+    Creates spans and dispatches them to registered hooks.
+
+    With no hooks registered, span() returns a shared no-op object, so
+    instrumentation costs a single method call.
+    """
+
+    def __init__(self):
+        self.hooks: List[SpanHook] = []
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.hooks)
+
+    def add_hook(self, hook: SpanHook) -> None:
+        self.hooks = self.hooks + [hook]
+
+    def remove_hook(self, hook: SpanHook) -> None:
+        self.hooks = [h for h in self.hooks if h is not hook]
+
+    def span(self, name: str, service_id: Optional[str] = None, **attributes: Any):
+        """
+        Create a span context manager.
+
+        Args:
+            name: Stage name (fetch, parse, classify, ...)
+            service_id: Service the work belongs to, added as an attribute
+            **attributes: Extra span attributes
+        """
+        if not self.hooks:
+            return _NOOP_SPAN
+        if service_id is not None:
+            attributes['service_id'] = service_id
+        return Span(self, name, attributes, _current_span.get())
+
+    def shutdown(self) -> None:
+        for hook in self.hooks:
+            hook.shutdown()
+        self.hooks = []
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    """Encode an attribute value as an OTLP AnyValue"""
+    if isinstance(value, bool):
+        return {'boolValue': value}
+    if isinstance(value, int):
+        return {'intValue': str(value)}
+    if isinstance(value, float):
+        return {'doubleValue': value}
+    return {'stringValue': str(value)}
+
+
+class FileSpanExporter(SpanHook):
+    """
+    Write finished spans to a local file as OTLP/JSON lines.
+
+    Spans are buffered and written once their root span ends, one
+    ExportTraceServiceRequest per line, the same layout the
+    OpenTelemetry Collector file exporter produces.
+    """
+
+    def __init__(self, path: Path, service_name: str = 'llm-status-monitor'):
+        self.path = path
+        self.service_name = service_name
+        self._buffer: List[Span] = []
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, 'a', encoding='utf-8')
+
+    def on_end(self, span: Span) -> None:
+        with self._lock:
+            self._buffer.append(span)
+            if span.parent_id is None:
+                self._flush_trace(span.trace_id)
+
+    def _flush_trace(self, trace_id: str) -> None:
+        spans = [s for s in self._buffer if s.trace_id == trace_id]
+        self._buffer = [s for s in self._buffer if s.trace_id != trace_id]
+        self._file.write(json.dumps(self._encode(spans), separators=(',', ':')))
+        self._file.write('\n')
+        self._file.flush()
+
+    def _encode(self, spans: List[Span]) -> Dict[str, Any]:
+        return {
+            'resourceSpans': [{
+                'resource': {
+                    'attributes': [
+                        {'key': 'service.name', 'value': {'stringValue': self.service_name}}
+                    ]
+                },
+                'scopeSpans': [{
+                    'scope': {'name': 'llm_monitor'},
+                    'spans': [self._encode_span(span) for span in spans]
+                }]
+            }]
+        }
+
+    @staticmethod
+    def _encode_span(span: Span) -> Dict[str, Any]:
+        encoded = {
+            'traceId': span.trace_id,
+            'spanId': span.span_id,
+            'name': span.name,
+            'kind': 1,  # SPAN_KIND_INTERNAL
+            'startTimeUnixNano': str(span.start_ns),
+            'endTimeUnixNano': str(span.end_ns),
+            'attributes': [
+                {'key': key, 'value': _otlp_value(value)}
+                for key, value in span.attributes.items()
+            ],
+            'status': {'code': span.status},
+        }
+        if span.parent_id:
+            encoded['parentSpanId'] = span.parent_id
+        if span.status_message:
+            encoded['status']['message'] = span.status_message
+        return encoded
+
+    def shutdown(self) -> None:
+        with self._lock:
+            for trace_id in {s.trace_id for s in self._buffer}:
+                self._flush_trace(trace_id)
+            self._file.close()
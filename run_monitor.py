@@ -3,57 +3,354 @@
 Main entry point for LLM Status Monitor
 """
 
+import os
 import sys
+import argparse
 import logging
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import List, Optional
 
 # Add package to path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from llm_monitor import StatusMonitor, Config
+from llm_monitor.config import ProfileConfig
+from llm_monitor.logging_setup import setup_logging as configure_logging
 
 
 def setup_logging(log_level: str = "INFO") -> None:
     """
     Configure logging for the application.
 
+    Records are handed to a background thread through a queue, so
+    formatting and file I/O stay off the monitoring thread. Output
+    format, rotation and sampling are controlled by LOG_* variables.
+
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
     """
-    # Create logs directory if it doesn't exist
-    log_dir = Path("logs")
-    log_dir.mkdir(exist_ok=True)
-
-    # Configure logging format
-    log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    date_format = "%Y-%m-%d %H:%M:%S"
-
-    # Configure root logger
-    logging.basicConfig(
-        level=getattr(logging, log_level.upper()),
-        format=log_format,
-        datefmt=date_format,
-        handlers=[
-            # Console handler
-            logging.StreamHandler(sys.stdout),
-            # File handler
-            logging.FileHandler(
-                log_dir / "monitor.log",
-                encoding="utf-8"
-            )
-        ]
-    )
-
-    # Set third-party loggers to WARNING to reduce noise
-    logging.getLogger("urllib3").setLevel(logging.WARNING)
-    logging.getLogger("requests").setLevel(logging.WARNING)
-
-
-def main() -> int:
+    log_file = os.getenv("LOG_FILE", "logs/monitor.log")
+
+    configure_logging(
+        log_level=log_level,
+        log_file=Path(log_file) if log_file else None,
+        json_format=os.getenv("LOG_FORMAT", "text").lower() == "json",
+        max_bytes=int(os.getenv("LOG_MAX_BYTES", str(10 * 1024 * 1024))),
+        backup_count=int(os.getenv("LOG_BACKUP_COUNT", "5")),
+        sample_burst=int(os.getenv("LOG_SAMPLE_BURST", "0")),
+        sample_rate=int(os.getenv("LOG_SAMPLE_RATE", "100"))
+    )
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="LLM Status Monitor")
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help="Profile check cycles (same as PROFILE=1; tune with PROFILE_* variables)"
+    )
+    parser.add_argument(
+        '--once',
+        action='store_true',
+        help="Run a single check cycle and exit "
+             "(exit code 0 = ok, 1 = error, 2 = some feeds failed)"
+    )
+    parser.add_argument(
+        '--async',
+        dest='async_mode',
+        action='store_true',
+        help="Check feeds concurrently on an asyncio event loop "
+             "(same as ASYNC_MODE=1; requires the 'async' extra)"
+    )
+    parser.add_argument(
+        '--record',
+        type=Path,
+        metavar='ARCHIVE',
+        help="Archive every raw feed response for the replay command (same as RECORD_FILE)"
+    )
+
+    commands = parser.add_subparsers(dest='command', metavar='COMMAND')
+    backfill = commands.add_parser(
+        'backfill',
+        help="Ingest every entry of the configured feeds into the history store, "
+             "without sending notifications"
+    )
+    backfill.add_argument(
+        'services',
+        nargs='*',
+        help="Service IDs to backfill (default: all configured feeds)"
+    )
+    backfill.add_argument(
+        '--history-file',
+        type=Path,
+        help="SQLite history database (default: HISTORY_FILE)"
+    )
+    backfill.add_argument('--workers', type=int, default=32, help="Feeds fetched in parallel")
+    backfill.add_argument(
+        '--max-entries', type=int, default=10000, help="Entries read per feed"
+    )
+
+    analytics = commands.add_parser(
+        'analytics',
+        help="Incident counts, MTTR and availability from the history store "
+             "(requires the 'analytics' extra)"
+    )
+    analytics.add_argument(
+        'services',
+        nargs='*',
+        help="Service IDs to report on (default: all in the history)"
+    )
+    analytics.add_argument(
+        '--history-file',
+        type=Path,
+        help="SQLite history database (default: HISTORY_FILE)"
+    )
+    analytics.add_argument(
+        '--report',
+        choices=['summary', 'windows', 'heatmap'],
+        default='summary',
+        help="summary per service, the same per --window, or starts per weekday/hour"
+    )
+    analytics.add_argument(
+        '--window', choices=['day', 'week', 'month', 'year'], default='month'
+    )
+    analytics.add_argument('--since', type=parse_date, help="Period start, YYYY-MM-DD (UTC)")
+    analytics.add_argument('--until', type=parse_date, help="Period end, YYYY-MM-DD (UTC)")
+    analytics.add_argument('--format', choices=['json', 'csv'], default='json')
+    analytics.add_argument('--output', type=Path, help="Write to this file instead of stdout")
+
+    replay = commands.add_parser(
+        'replay',
+        help="Run a recorded archive through the monitor on a virtual clock, "
+             "capturing notifications instead of sending them"
+    )
+    replay.add_argument('archive', type=Path, help="Archive written with --record / RECORD_FILE")
+    replay.add_argument(
+        '--speed',
+        type=float,
+        default=1000.0,
+        help="Virtual seconds per real second (default: 1000; 0 = as fast as possible)"
+    )
+    replay.add_argument(
+        '--interval', type=float, help="Virtual seconds between cycles (default: CHECK_INTERVAL)"
+    )
+    replay.add_argument('--json', type=Path, help="Write the report, with every notification, here")
+
+    slo = commands.add_parser(
+        'slo',
+        help="Detection latency of delivered alerts (publish -> fetch -> classify -> "
+             "webhook ack) against a target, from SLO_FILE"
+    )
+    slo.add_argument('--slo-file', type=Path, help="Alert latency log (default: SLO_FILE)")
+    slo.add_argument('--since', type=parse_date, help="Only alerts from this date, YYYY-MM-DD (UTC)")
+    slo.add_argument('--until', type=parse_date, help="Only alerts before this date, YYYY-MM-DD (UTC)")
+    slo.add_argument(
+        '--target',
+        type=float,
+        default=300.0,
+        help="Publish-to-ack target in seconds (default: 300)"
+    )
+    slo.add_argument(
+        '--objective',
+        type=float,
+        default=99.0,
+        help="Percent of alerts that must meet --target; exit code 2 below it (default: 99)"
+    )
+    slo.add_argument('--format', choices=['table', 'json', 'jsonl'], default='table')
+    slo.add_argument('--output', type=Path, help="Write to this file instead of stdout")
+
+    diagnose = commands.add_parser(
+        'diagnose',
+        help="Probe the configured feeds concurrently and report DNS, connect, TLS, "
+             "TTFB, transfer and parse timings"
+    )
+    diagnose.add_argument(
+        'services',
+        nargs='*',
+        help="Service IDs to probe (default: all configured feeds)"
+    )
+    diagnose.add_argument('--probes', type=int, default=10, help="Requests per feed")
+    diagnose.add_argument('--concurrency', type=int, default=16, help="Feeds probed at once")
+    diagnose.add_argument('--timeout', type=float, default=10.0, help="Seconds per request")
+    diagnose.add_argument('--format', choices=['table', 'json'], default='table')
+    diagnose.add_argument('--output', type=Path, help="Write to this file instead of stdout")
+    return parser.parse_args(argv)
+
+
+def parse_date(value: str) -> float:
+    """YYYY-MM-DD (or full ISO 8601) as UTC epoch seconds"""
+    try:
+        when = datetime.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid date: {value!r}")
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return when.timestamp()
+
+
+def run_backfill(args: argparse.Namespace, config: Config) -> int:
+    """Run the backfill command; exit code 2 if some feeds failed"""
+    from llm_monitor.backfill import Backfill
+    from llm_monitor.history import HistoryStore
+
+    logger = logging.getLogger(__name__)
+    history_file = args.history_file or config.history_file
+    if history_file is None:
+        logger.error("Set HISTORY_FILE or pass --history-file to backfill")
+        return 1
+
+    feeds = config.load_feeds()
+    unknown = [service_id for service_id in args.services if service_id not in feeds]
+    if unknown:
+        logger.error("Unknown service(s): %s", ', '.join(unknown))
+        return 1
+    if args.services:
+        feeds = {service_id: feeds[service_id] for service_id in args.services}
+
+    parse_pool = None
+    if config.parse_workers > 0:
+        from llm_monitor.parse_pool import ParsePool
+        parse_pool = ParsePool(config.parse_workers)
+    store = HistoryStore(history_file)
+    try:
+        report = Backfill(
+            store,
+            workers=args.workers,
+            max_entries=args.max_entries,
+            parse_pool=parse_pool
+        ).run(feeds)
+    finally:
+        store.close()
+        if parse_pool is not None:
+            parse_pool.shutdown()
+
+    logger.info(
+        "Backfilled %d entries from %d feed(s) in %.1fs (%d new or changed, %d failed)",
+        report.entries, report.feeds, report.elapsed, report.stored, len(report.failed)
+    )
+    return 2 if report.failed else 0
+
+
+def run_analytics(args: argparse.Namespace, config: Config) -> int:
+    """Run the analytics command"""
+    logger = logging.getLogger(__name__)
+    try:
+        from llm_monitor.analytics import render, run_report
+    except ImportError as e:
+        logger.error("Analytics needs numpy (pip install 'llm-status-monitor[analytics]'): %s", e)
+        return 1
+    from llm_monitor.history import HistoryStore
+
+    history_file = args.history_file or config.history_file
+    if history_file is None or not history_file.exists():
+        logger.error("No history to analyze; set HISTORY_FILE or pass --history-file "
+                     "and run backfill first")
+        return 1
+
+    store = HistoryStore(history_file)
+    try:
+        rows = run_report(
+            store, args.report, args.services, args.since, args.until, args.window
+        )
+    finally:
+        store.close()
+
+    output = render(rows, args.format)
+    if args.output:
+        args.output.write_text(output)
+    else:
+        sys.stdout.write(output if output.endswith('\n') else output + '\n')
+    return 0
+
+
+def run_slo(args: argparse.Namespace, config: Config) -> int:
+    """Run the slo command; exit code 2 if the objective is not met"""
+    from llm_monitor.slo import load, render, summarize
+
+    logger = logging.getLogger(__name__)
+    slo_file = args.slo_file or config.slo_file
+    if slo_file is None or not slo_file.exists():
+        logger.error("No alert latencies to report; set SLO_FILE or pass --slo-file")
+        return 1
+
+    rows = summarize(load(slo_file, args.since, args.until), args.target)
+    output = render(rows, args.format)
+    if args.output:
+        args.output.write_text(output)
+    else:
+        sys.stdout.write(output)
+    attained = rows[-1]['within_target']
+    if attained is not None and attained < args.objective:
+        logger.warning(
+            "Detection SLO missed: %.2f%% of alerts within %.0fs (objective %.2f%%)",
+            attained, args.target, args.objective
+        )
+        return 2
+    return 0
+
+
+def run_diagnose(args: argparse.Namespace, config: Config) -> int:
+    """Run the diagnose command; exit code 2 if some feed never answered"""
+    from llm_monitor.diagnostics import diagnose, render
+
+    logger = logging.getLogger(__name__)
+    feeds = config.load_feeds()
+    unknown = [service_id for service_id in args.services if service_id not in feeds]
+    if unknown:
+        logger.error("Unknown service(s): %s", ', '.join(unknown))
+        return 1
+    if args.services:
+        feeds = {service_id: feeds[service_id] for service_id in args.services}
+
+    reports = diagnose(
+        feeds,
+        probes=max(1, args.probes),
+        concurrency=args.concurrency,
+        timeout=args.timeout,
+        stream=config.stream_parse
+    )
+    output = render(reports, args.format)
+    if args.output:
+        args.output.write_text(output)
+    else:
+        sys.stdout.write(output if output.endswith('\n') else output + '\n')
+    return 2 if any(report['ok'] == 0 for report in reports) else 0
+
+
+def run_replay(args: argparse.Namespace, config: Config) -> int:
+    """Run the replay command"""
+    import json
+    from llm_monitor.replay import Archive, ReplayDriver, summarize
+
+    logger = logging.getLogger(__name__)
+    if not args.archive.exists():
+        logger.error("Archive not found: %s", args.archive)
+        return 1
+    archive = Archive.load(args.archive)
+    if not archive.events:
+        logger.error("Archive %s has no recorded fetches", args.archive)
+        return 1
+
+    report = ReplayDriver(archive, config, interval=args.interval, speed=args.speed).run()
+    for line in summarize(report):
+        print(line)
+    if args.json:
+        args.json.write_text(json.dumps(report.to_dict(), indent=2))
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
     """Main function"""
+    args = parse_args(argv)
+
     # Setup logging
-    import os
-    log_level = os.getenv("LOG_LEVEL", "INFO")
+    # Replays run thousands of cycles and list their notifications at the end
+    log_level = os.getenv("LOG_LEVEL", "ERROR" if args.command == 'replay' else "INFO")
+    if args.command in ('analytics', 'diagnose', 'slo') and args.output is None:
+        # Console logs share stdout with the report
+        log_level = "ERROR"
     setup_logging(log_level)
 
     logger = logging.getLogger(__name__)
@@ -61,10 +358,35 @@ def main() -> int:
     try:
         # Load configuration
         config = Config.from_env()
+        if args.profile and config.profile is None:
+            config.profile = ProfileConfig.from_env()
         logger.info("Configuration loaded successfully")
 
+        if args.command == 'backfill':
+            return run_backfill(args, config)
+        if args.command == 'analytics':
+            return run_analytics(args, config)
+        if args.command == 'replay':
+            return run_replay(args, config)
+        if args.command == 'diagnose':
+            return run_diagnose(args, config)
+        if args.command == 'slo':
+            return run_slo(args, config)
+        if args.record:
+            config.record_file = args.record
+
         # Create and run monitor
-        monitor = StatusMonitor(config)
+        if args.async_mode or config.async_mode:
+            try:
+                from llm_monitor.async_monitor import AsyncStatusMonitor
+            except ImportError as e:
+                logger.error("Async mode needs aiohttp (pip install 'llm-status-monitor[async]'): %s", e)
+                return 1
+            monitor = AsyncStatusMonitor(config)
+        else:
+            monitor = StatusMonitor(config)
+        if args.once:
+            return monitor.run_once()
         monitor.run()
 
         return 0
@@ -3,11 +3,12 @@
 Test script to validate the incident filter logic
 """
 
-# Import the filter function from monitor.py
 import sys
 import os
-sys.path.insert(0, os.path.dirname(__file__))
-from monitor import is_active_incident
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from llm_monitor.filters import IncidentFilter
+
+is_active_incident = IncidentFilter.is_active_incident
 
 
 # Test cases from real RSS feeds
@@ -14,15 +14,47 @@ def clean_env(monkeypatch):
     This prevents tests from being affected by actual .env file.
     """
     # Mock load_dotenv to prevent loading .env file in tests
-    with patch('llm_monitor.config.load_dotenv'):
+    with patch('llm_monitor.config.load_dotenv', return_value=None):
         # Clear common env vars
         env_vars = [
             'NOTIFICATION_TYPE',
             'DISCORD_WEBHOOK_URL',
             'SLACK_WEBHOOK_URL',
             'CHECK_INTERVAL',
+            'CYCLE_BUDGET',
+            'SHUTDOWN_TIMEOUT',
+            'FEEDS_FILE',
+            'CONFIG_POLL_INTERVAL',
+            'ASYNC_MODE',
+            'ASYNC_CONCURRENCY',
+            'PARSE_WORKERS',
+            'STREAM_PARSE',
             'STATE_FILE',
-            'LOG_LEVEL'
+            'HISTORY_FILE',
+            'RECORD_FILE',
+            'ROUTES_FILE',
+            'SLO_FILE',
+            'PUSH_TOKEN',
+            'RECONCILE_INTERVAL',
+            'COMPONENT_STATUS',
+            'DEDUP_WINDOW',
+            'DEDUP_THRESHOLD',
+            'LOG_LEVEL',
+            'HTTP_HOST',
+            'HTTP_PORT',
+            'TRACE_FILE',
+            'PROFILE',
+            'PROFILE_DIR',
+            'PROFILE_EVERY',
+            'PROFILE_THRESHOLD_MS',
+            'PROFILE_KEEP',
+            'PROFILE_TOP',
+            'LOG_FORMAT',
+            'LOG_FILE',
+            'LOG_MAX_BYTES',
+            'LOG_BACKUP_COUNT',
+            'LOG_SAMPLE_BURST',
+            'LOG_SAMPLE_RATE'
         ]
 
         for var in env_vars:
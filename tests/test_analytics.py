@@ -0,0 +1,188 @@
+"""
+Test suite for the uptime and MTTR analytics
+"""
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from llm_monitor.analytics import (
+    IncidentTable,
+    heatmap,
+    render,
+    run_report,
+    window_edges,
+    window_stats,
+)
+from llm_monitor.history import HistoryStore
+
+HOUR = 3600.0
+
+
+def ts(*args):
+    return datetime(*args, tzinfo=timezone.utc).timestamp()
+
+
+def row(service_id, entry_id, started, resolved=None, stage='resolved', title="Elevated errors"):
+    return (service_id, entry_id, title, "", "", None, entry_id, False, stage, started, resolved)
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = HistoryStore(tmp_path / "history.db")
+    store.insert_many([
+        # Two overlapping incidents (2.5h of downtime between them)
+        row('openai', 'a1', ts(2025, 1, 6, 10), ts(2025, 1, 6, 11)),
+        row('openai', 'a2', ts(2025, 1, 6, 10, 30), ts(2025, 1, 6, 12, 30)),
+        row('openai', 'a3', ts(2025, 2, 3, 9), ts(2025, 2, 3, 12)),
+        row('claude', 'c1', ts(2025, 1, 20, 23), ts(2025, 1, 21, 1)),
+        row('claude', 'c2', ts(2025, 2, 27, 12), None, stage='investigating'),
+        # Resolved but no readable resolution time; maintenance
+        row('claude', 'c3', ts(2025, 2, 10, 8), None),
+        row('claude', 'm1', ts(2025, 1, 8, 2), ts(2025, 1, 8, 6), title="Scheduled maintenance"),
+    ])
+    yield store
+    store.close()
+
+
+class TestIncidentTable:
+    """Tests for loading the history into arrays"""
+
+    def test_load(self, store):
+        """Test incidents are grouped by service and maintenance is skipped"""
+        table = IncidentTable.load(store)
+
+        assert table.services == ['claude', 'openai']
+        assert table.service.tolist() == [0, 0, 0, 1, 1, 1]
+        assert np.isnan(table.resolved).sum() == 2
+        assert table.open.sum() == 1
+
+    def test_load_services(self, store):
+        """Test loading a subset of services"""
+        table = IncidentTable.load(store, ['openai'])
+
+        assert table.services == ['openai']
+        assert len(table) == 3
+
+
+class TestWindowStats:
+    """Tests for counts, MTTR, percentiles and availability"""
+
+    def test_summary(self, store):
+        """Test per-service statistics over a whole period"""
+        table = IncidentTable.load(store)
+        start, end = ts(2025, 1, 1), ts(2025, 3, 1)
+        claude, openai = window_stats(table, np.array([start, end]))
+
+        assert openai['incidents'] == 3
+        assert openai['resolved'] == 3
+        assert openai['mttr_minutes'] == 120.0
+        assert openai['p50_minutes'] == 120.0
+        assert openai['max_minutes'] == 180.0
+        # Overlapping incidents only count once
+        assert openai['downtime_minutes'] == 5.5 * 60
+        assert openai['availability'] == round(100 * (1 - 5.5 * HOUR / (end - start)), 4)
+
+        assert claude['incidents'] == 3
+        assert claude['resolved'] == 1
+        assert claude['mttr_minutes'] == 120.0
+        # The open incident counts until the end of the period
+        assert claude['downtime_minutes'] == (2 + 36) * 60
+
+    def test_percentiles_match_numpy(self):
+        """Test grouped percentiles equal np.percentile per service"""
+        rng = np.random.default_rng(0)
+        service = np.repeat(np.arange(3), [50, 1, 20])
+        started = rng.uniform(0, 1e6, len(service))
+        durations = rng.exponential(3600, len(service))
+        table = IncidentTable(['a', 'b', 'c'], service, started, started + durations,
+                              np.zeros(len(service), dtype=bool))
+
+        rows = window_stats(table, np.array([0.0, 2e6]))
+
+        for index, stats in enumerate(rows):
+            expected = np.percentile(durations[service == index], 90) / 60
+            assert stats['p90_minutes'] == round(expected, 1)
+
+    def test_windows_split_downtime(self, store):
+        """Test an incident crossing a window boundary is split between windows"""
+        table = IncidentTable.load(store, ['claude'])
+        edges = np.array([ts(2025, 1, 20), ts(2025, 1, 21), ts(2025, 1, 22)])
+
+        first, second = window_stats(table, edges)
+
+        assert first['incidents'] == 1 and second['incidents'] == 0
+        assert first['downtime_minutes'] == 60.0
+        assert second['downtime_minutes'] == 60.0
+
+    def test_empty_service_window(self, store):
+        """Test windows without incidents report no durations and full availability"""
+        table = IncidentTable.load(store, ['openai'])
+        (stats,) = window_stats(table, np.array([ts(2025, 1, 10), ts(2025, 1, 20)]))
+
+        assert stats['incidents'] == 0
+        assert stats['mttr_minutes'] is None
+        assert stats['availability'] == 100.0
+
+
+class TestWindowEdges:
+    """Tests for calendar windows"""
+
+    def test_months(self):
+        """Test month windows are clipped to the period"""
+        edges = window_edges(ts(2025, 1, 15), ts(2025, 3, 10), 'month')
+
+        assert edges.tolist() == [ts(2025, 1, 15), ts(2025, 2, 1), ts(2025, 3, 1), ts(2025, 3, 10)]
+
+    def test_weeks_start_on_monday(self):
+        """Test week windows start on Monday"""
+        edges = window_edges(ts(2025, 1, 1), ts(2025, 1, 20), 'week')
+
+        assert edges.tolist() == [ts(2025, 1, 1), ts(2025, 1, 6), ts(2025, 1, 13), ts(2025, 1, 20)]
+
+
+class TestHeatmap:
+    """Tests for the weekday/hour heatmap"""
+
+    def test_counts_starts(self, store):
+        """Test incidents are counted by UTC weekday and hour of start"""
+        table = IncidentTable.load(store, ['openai'])
+        rows = heatmap(table, ts(2025, 1, 1), ts(2025, 3, 1))
+
+        monday = rows[0]
+        assert len(rows) == 7
+        assert monday['weekday'] == 'Mon'
+        assert monday['10'] == 2
+        assert monday['09'] == 1
+        assert sum(rows[1][f'{hour:02d}'] for hour in range(24)) == 0
+
+
+class TestReports:
+    """Tests for report loading and rendering"""
+
+    def test_run_report_windows(self, store):
+        """Test the windows report has a row per service and month"""
+        rows = run_report(store, 'windows', since=ts(2025, 1, 1), until=ts(2025, 3, 1))
+
+        assert len(rows) == 4
+        assert [r['start'][:7] for r in rows] == ['2025-01', '2025-01', '2025-02', '2025-02']
+
+    def test_run_report_empty(self, tmp_path):
+        """Test an empty history gives an empty report"""
+        store = HistoryStore(tmp_path / "empty.db")
+        try:
+            assert run_report(store) == []
+        finally:
+            store.close()
+
+    def test_render(self, store):
+        """Test JSON and CSV output"""
+        rows = run_report(store, since=ts(2025, 1, 1), until=ts(2025, 3, 1))
+
+        assert json.loads(render(rows, 'json')) == rows
+        lines = render(rows, 'csv').splitlines()
+        assert lines[0].startswith('service,start,end,incidents,resolved,mttr_minutes')
+        assert len(lines) == 3
@@ -0,0 +1,171 @@
+"""
+Test suite for the asyncio monitor, run against the local stand-in server
+"""
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from llm_monitor.config import Config, FeedConfig
+from llm_monitor.async_monitor import AsyncStatusMonitor
+from llm_monitor.tracing import SpanHook
+from benchmarks.standin import StandinServer, StandinOptions
+
+
+@pytest.fixture
+def standin():
+    server = StandinServer(StandinOptions(feeds=10, entries=5, churn=1.0, tick=0))
+    server.start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def monitor(standin, tmp_path):
+    config = Config(
+        notification_type='discord',
+        discord_webhook=standin.webhook_url,
+        slack_webhook=None,
+        check_interval=60,
+        state_file=tmp_path / "state.json",
+        async_concurrency=8
+    )
+    monitor = AsyncStatusMonitor(config, feeds=standin.feed_configs(), parse_threads=2)
+    yield monitor
+    monitor.close()
+
+
+class TestAsyncStatusMonitor:
+    """Tests running AsyncStatusMonitor end to end"""
+
+    def test_resolved_history_does_not_notify(self, standin, monitor):
+        """Test that a first cycle over resolved history records state only"""
+        assert monitor.run_check_cycle() == 0
+
+        assert standin.stats()['deliveries'] == 0
+        assert len(monitor.state_manager.get_state()) == 10
+
+    def test_new_incidents_are_delivered(self, standin, monitor):
+        """Test that churned incidents reach the webhook sink"""
+        monitor.run_check_cycle()
+        assert standin.churn_once() == 10
+
+        monitor.run_check_cycle()
+
+        assert standin.stats()['deliveries'] == 10
+        assert monitor.metrics.notifications.labels('feed0', 'sent').value == 1
+
+    def test_unchanged_feeds_use_etag(self, standin, monitor):
+        """Test that the pooled session sends conditional requests"""
+        monitor.run_check_cycle()
+        monitor.run_check_cycle()
+
+        assert standin.stats()['not_modified'] == 10
+
+    def test_fetch_failure_counts_error(self, monitor, tmp_path):
+        """Test an unreachable feed fails without affecting the others"""
+        monitor.feeds = dict(monitor.feeds)
+        monitor.feeds['dead'] = FeedConfig(name="Dead", url="http://127.0.0.1:9/history.rss", color=0)
+
+        assert monitor.run_check_cycle() == 1
+        assert monitor.metrics.service('dead').errors.value == 1
+
+    def test_expired_deadline_defers_feeds(self, monitor):
+        """Test feeds not started before the deadline are deferred"""
+        assert monitor.run_check_cycle(deadline=0.0) == 0
+
+        assert len(monitor._deferred) == 10
+        assert monitor.state_manager.get_state() == {}
+
+    def test_run_once(self, standin, monitor):
+        """Test the one-shot entry point works unchanged"""
+        assert monitor.run_once() == 0
+        assert monitor.state_manager.state_file.exists()
+
+    def test_parse_spans_nest_under_feed(self, monitor):
+        """Test spans from the parse thread pool keep their parent"""
+        class Collector(SpanHook):
+            def __init__(self):
+                self.spans = []
+
+            def on_end(self, span):
+                self.spans.append(span)
+
+        collector = Collector()
+        monitor.tracer.add_hook(collector)
+        monitor.run_check_cycle()
+
+        roots = {s.span_id: s for s in collector.spans if s.name == 'check_feed'}
+        parses = [s for s in collector.spans if s.name == 'parse']
+        assert len(parses) == 10
+        assert all(s.parent_id in roots for s in parses)
+        assert all(roots[s.parent_id].attributes['service_id'] == s.attributes['service_id']
+                   for s in parses)
+
+    def test_parse_workers(self, standin, tmp_path):
+        """Test parsing in worker processes gives the same results"""
+        config = Config(
+            notification_type='discord',
+            discord_webhook=standin.webhook_url,
+            slack_webhook=None,
+            check_interval=60,
+            state_file=tmp_path / "state-pool.json",
+            parse_workers=2
+        )
+        monitor = AsyncStatusMonitor(config, feeds=standin.feed_configs())
+        try:
+            monitor.run_check_cycle()
+            standin.churn_once()
+            assert monitor.run_check_cycle() == 0
+        finally:
+            monitor.close()
+
+        assert standin.stats()['deliveries'] == 10
+
+    def test_component_transitions(self, standin, tmp_path):
+        """Test component summaries are diffed on the event loop too"""
+        config = Config(
+            notification_type='discord',
+            discord_webhook=standin.webhook_url,
+            slack_webhook=None,
+            check_interval=60,
+            state_file=tmp_path / "state-components.json",
+            component_status=True
+        )
+        monitor = AsyncStatusMonitor(config, feeds=standin.feed_configs())
+        try:
+            monitor.run_check_cycle()
+            standin.set_component(3, "claude.ai", "major_outage")
+            assert monitor.run_check_cycle() == 0
+        finally:
+            monitor.close()
+
+        assert standin.stats()['deliveries'] == 1
+        assert monitor.metrics.service('feed3').components_degraded.value == 1
+
+    def test_duplicate_alerts_merged(self, standin, tmp_path):
+        """Test one incident on several services is sent once on the event loop too"""
+        config = Config(
+            notification_type='discord',
+            discord_webhook=standin.webhook_url,
+            slack_webhook=None,
+            check_interval=60,
+            state_file=tmp_path / "state-dedup.json",
+            dedup_window=900
+        )
+        monitor = AsyncStatusMonitor(config, feeds=standin.feed_configs())
+        try:
+            monitor.run_check_cycle()
+            standin.churn_once()
+            # The same outage opened on every stand-in page
+            for feed in standin.feeds:
+                feed.incidents[0].title = "Elevated errors on API"
+                feed.touch(feed.changed_at)
+            assert monitor.run_check_cycle() == 0
+        finally:
+            monitor.close()
+
+        assert standin.stats()['deliveries'] == 1
+        assert sum(
+            monitor.metrics.service(f'feed{n}').duplicates_merged.value for n in range(10)
+        ) == 9
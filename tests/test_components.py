@@ -0,0 +1,240 @@
+"""
+Test suite for component status tracking
+"""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from llm_monitor.components import (
+    OPERATIONAL, STATUSES, Component, alert, diff, parse_summary, summary_url, watched
+)
+from llm_monitor.config import Config, FeedConfig
+from llm_monitor.feed_parser import FeedEntry, FetchResult
+from llm_monitor.incidents import CRITICAL, MINOR
+from llm_monitor.monitor import StatusMonitor
+from llm_monitor.notifiers import NEW, RESOLVED, UPDATED
+from benchmarks.standin import StandinOptions, StandinServer
+
+FEED = FeedConfig(name="Example", url="https://status.example.com/history.rss", color=0)
+CODE = {status: code for code, status in enumerate(STATUSES)}
+
+
+def summary(**statuses):
+    """summary.json with an 'API' group holding the given components"""
+    components = [{"id": "grp", "name": "API", "status": "operational", "group": True}]
+    components += [
+        {"id": name.lower(), "name": name, "status": status, "group": False, "group_id": "grp"}
+        for name, status in statuses.items()
+    ]
+    return json.dumps({"page": {}, "components": components}).encode()
+
+
+def component(name, status, group=None):
+    return Component(name.lower(), name, group, CODE[status])
+
+
+class TestComponents:
+    """Tests for parsing and diffing component statuses"""
+
+    def test_parse_summary(self):
+        """Test groups are skipped and their name kept on their components"""
+        components = parse_summary(summary(Chat="operational", Files="partial_outage"))
+
+        assert components == [
+            Component('chat', 'Chat', 'API', OPERATIONAL),
+            Component('files', 'Files', 'API', CODE['partial_outage']),
+        ]
+
+    def test_parse_summary_unknown_status(self):
+        """Test components in a status the monitor does not know are left out"""
+        assert parse_summary(summary(Chat="sideways")) == []
+
+    @pytest.mark.parametrize("content", [b"not json", b"{}", b'{"components": [1]}'])
+    def test_parse_summary_malformed(self, content):
+        """Test malformed documents return None"""
+        assert parse_summary(content) is None
+
+    def test_diff(self):
+        """Test only changed components are returned, new ones compared to operational"""
+        current = [
+            component('Chat', 'operational'),
+            component('Files', 'major_outage'),
+            component('Batch', 'degraded_performance'),
+            component('Login', 'operational'),
+        ]
+        previous = {'chat': OPERATIONAL, 'files': CODE['partial_outage']}
+
+        transitions = diff(previous, current)
+
+        assert [(t.component.name, t.before) for t in transitions] == [
+            ('Files', CODE['partial_outage']), ('Batch', OPERATIONAL)
+        ]
+
+    def test_watched(self):
+        """Test components are selected by name, group or ID, ignoring case"""
+        components = [component('Chat', 'operational', 'API'), component('Login', 'operational')]
+
+        assert watched(components, ()) == components
+        assert [c.name for c in watched(components, ('api',))] == ['Chat']
+        assert [c.name for c in watched(components, ('LOGIN',))] == ['Login']
+
+    @pytest.mark.parametrize("before,after,kind,severity", [
+        ('operational', 'major_outage', NEW, CRITICAL),
+        ('partial_outage', 'degraded_performance', UPDATED, MINOR),
+        ('major_outage', 'operational', RESOLVED, MINOR),
+    ])
+    def test_alert(self, before, after, kind, severity):
+        """Test the notification kind and severity follow the transition"""
+        transitions = diff({'chat': CODE[before]}, [component('Chat', after)])
+
+        entry, alert_kind, alert_severity = alert(FEED, transitions)
+
+        assert (alert_kind, alert_severity) == (kind, severity)
+        assert entry.link == "https://status.example.com"
+        assert entry.title.startswith("Chat: ")
+        assert "→" in entry.description
+
+
+class TestFeedConfigComponents:
+    """Tests for the components option in FEEDS_FILE"""
+
+    @pytest.mark.parametrize("value,expected", [
+        (None, None), (False, None), (True, ()), (["API", "Login"], ("API", "Login")),
+    ])
+    def test_from_dict(self, value, expected):
+        """Test components can be off, all, or a list of names"""
+        data = {"name": "Example", "url": FEED.url}
+        if value is not None:
+            data["components"] = value
+
+        assert FeedConfig.from_dict(data).components == expected
+
+    def test_from_dict_invalid(self):
+        """Test anything else is rejected"""
+        with pytest.raises(ValueError, match="components"):
+            FeedConfig.from_dict({"name": "Example", "url": FEED.url, "components": "API"})
+
+
+class TestMonitorComponents:
+    """Tests for component tracking in StatusMonitor"""
+
+    @pytest.fixture
+    def monitor(self, tmp_path):
+        config = Config(
+            notification_type='discord',
+            discord_webhook='https://discord.com/webhook',
+            slack_webhook=None,
+            check_interval=60,
+            state_file=tmp_path / "state.json"
+        )
+        feed = FeedConfig(name="Example", url=FEED.url, color=0, components=("API",))
+        monitor = StatusMonitor(config, feeds={'example': feed})
+        monitor.notifier = MagicMock()
+        monitor.notifier.send.return_value = True
+        monitor.summary = summary(Chat="operational", Files="operational")
+
+        def fetch(url, etag=None, modified=None, timeout=None):
+            if url == summary_url(feed):
+                return FetchResult(200, monitor.summary, etag='"v1"')
+            return FetchResult(304, b'')
+
+        monitor.parser.fetch_feed = MagicMock(side_effect=fetch)
+        yield monitor
+        monitor.close()
+
+    def test_first_summary_is_baseline(self, monitor):
+        """Test the first summary is stored without notifying"""
+        assert monitor.run_check_cycle() == 0
+
+        monitor.notifier.send.assert_not_called()
+        assert monitor.state_manager.get_components('example') == {'chat': 0, 'files': 0}
+        assert monitor.state_manager.get_validators('example', 'components_') == ('"v1"', None)
+        # The feed's own validators are untouched
+        assert monitor.state_manager.get_validators('example') == (None, None)
+
+    def test_transition_notifies_once(self, monitor):
+        """Test a status change notifies once, and recovering notifies RESOLVED"""
+        monitor.run_check_cycle()
+        monitor.summary = summary(Chat="major_outage", Files="operational")
+        monitor.run_check_cycle()
+        monitor.run_check_cycle()
+
+        monitor.notifier.send.assert_called_once()
+        call = monitor.notifier.send.call_args.kwargs
+        assert (call['title'], call['kind']) == ("Chat: Major outage", NEW)
+        metrics = monitor.metrics.service('example')
+        assert metrics.components_degraded.value == 1
+        assert metrics.component_transitions.value == 1
+
+        monitor.summary = summary(Chat="operational", Files="operational")
+        monitor.run_check_cycle()
+
+        assert monitor.notifier.send.call_args.kwargs['kind'] == RESOLVED
+
+    def test_unwatched_components_ignored(self, monitor):
+        """Test components outside the feed's list do not notify"""
+        monitor.feeds['example'].components = ("Chat",)
+        monitor.run_check_cycle()
+        monitor.summary = summary(Chat="operational", Files="major_outage")
+        monitor.run_check_cycle()
+
+        monitor.notifier.send.assert_not_called()
+        # The vector keeps every component, so changing the list later does not alert
+        assert monitor.state_manager.get_components('example')['files'] == CODE['major_outage']
+
+    def test_push_fed_summary_still_polled(self, monitor):
+        """Test a service that receives pushes keeps its component alerts on the normal cadence"""
+        monitor.run_check_cycle()
+        monitor.receive_push('example', FeedEntry.compact(
+            f"{FEED.page_url}/incidents/abc", "Elevated errors on API", "", f"{FEED.page_url}/incidents/abc"
+        ))
+        monitor._process_pushes()
+        monitor.parser.fetch_feed.reset_mock()
+        monitor.notifier.send.reset_mock()
+        monitor.summary = summary(Chat="major_outage", Files="operational")
+
+        monitor.run_check_cycle()
+
+        # Only the summary is fetched; the feed waits for RECONCILE_INTERVAL
+        fetched = [call.args[0] for call in monitor.parser.fetch_feed.call_args_list]
+        assert fetched == [summary_url(FEED)]
+        assert monitor.notifier.send.call_args.kwargs['title'] == "Chat: Major outage"
+
+    def test_malformed_summary_fails_check(self, monitor):
+        """Test an unreadable summary counts as a failed check"""
+        monitor.summary = b"<html>"
+
+        assert monitor.run_check_cycle() == 1
+        assert monitor.state_manager.get_components('example') is None
+
+
+class TestComponentsEndToEnd:
+    """Tests against the stand-in server's summary.json"""
+
+    def test_standin_transition(self, tmp_path):
+        """Test a component change on the stand-in reaches its webhook sink"""
+        standin = StandinServer(StandinOptions(feeds=2, entries=3))
+        standin.start()
+        config = Config(
+            notification_type='discord',
+            discord_webhook=standin.webhook_url,
+            slack_webhook=None,
+            check_interval=60,
+            state_file=tmp_path / "state.json",
+            component_status=True
+        )
+        monitor = StatusMonitor(config, feeds=standin.feed_configs())
+        try:
+            monitor.run_check_cycle()
+            standin.set_component(1, "API", "partial_outage")
+            monitor.run_check_cycle()
+            monitor.run_check_cycle()
+
+            stats = standin.stats()
+            assert stats['deliveries'] == 1
+            # After the first cycle only feed 1's changed summary is downloaded again
+            assert stats['not_modified'] == 7
+        finally:
+            monitor.close()
+            standin.stop()
@@ -2,6 +2,7 @@
 Test suite for configuration management
 """
 
+import json
 import pytest
 import os
 from pathlib import Path
@@ -95,3 +96,95 @@ class TestConfig:
 
         config = Config.from_env()
         assert config.check_interval == 600
+
+    def test_profile_disabled_by_default(self):
+        """Test that profiling is off unless PROFILE is set"""
+        config = Config.from_env()
+        assert config.profile is None
+
+    def test_profile_from_env(self, monkeypatch):
+        """Test profiling options from environment"""
+        monkeypatch.setenv('PROFILE', '1')
+        monkeypatch.setenv('PROFILE_EVERY', '5')
+        monkeypatch.setenv('PROFILE_THRESHOLD_MS', '250')
+
+        config = Config.from_env()
+        assert config.profile.every == 5
+        assert config.profile.threshold_ms == 250.0
+        assert config.profile.output_dir == Path('logs/profiles')
+
+    def test_cycle_budget_defaults_to_interval(self, monkeypatch):
+        """Test the cycle budget falls back to the check interval"""
+        monkeypatch.setenv('CHECK_INTERVAL', '120')
+
+        config = Config.from_env()
+        assert config.effective_cycle_budget == 120.0
+
+        monkeypatch.setenv('CYCLE_BUDGET', '45')
+        assert Config.from_env().effective_cycle_budget == 45.0
+
+    def test_feeds_default_to_builtin(self):
+        """Test that without FEEDS_FILE the built-in feeds are used"""
+        config = Config.from_env()
+        assert config.load_feeds() == FEEDS
+
+    def test_feeds_from_file(self, tmp_path, monkeypatch):
+        """Test loading feeds from FEEDS_FILE with hex colors"""
+        feeds_file = tmp_path / "feeds.json"
+        feeds_file.write_text(
+            '{"gemini": {"name": "Google (Gemini)", '
+            '"url": "https://status.cloud.google.com/feed.atom", "color": "#4285F4"}}'
+        )
+        monkeypatch.setenv('FEEDS_FILE', str(feeds_file))
+
+        feeds = Config.from_env().load_feeds()
+        assert feeds['gemini'].color == 0x4285F4
+        assert feeds['gemini'].name == "Google (Gemini)"
+
+    def test_feeds_file_invalid(self, tmp_path, monkeypatch):
+        """Test that a malformed feeds file raises ValueError"""
+        feeds_file = tmp_path / "feeds.json"
+        feeds_file.write_text('{"broken": {"name": "No URL"}}')
+        monkeypatch.setenv('FEEDS_FILE', str(feeds_file))
+
+        with pytest.raises(ValueError):
+            Config.from_env().load_feeds()
+
+    def test_feeds_file_non_object_entry(self, tmp_path, monkeypatch):
+        """Test that a feed that is not a JSON object raises ValueError"""
+        feeds_file = tmp_path / "feeds.json"
+        feeds_file.write_text('{"claude": "oops"}')
+        monkeypatch.setenv('FEEDS_FILE', str(feeds_file))
+
+        with pytest.raises(ValueError, match="claude"):
+            Config.from_env().load_feeds()
+
+    def test_routes_unset(self):
+        """Test that without ROUTES_FILE there is no routing table"""
+        assert Config.from_env().load_routes() is None
+
+    def test_routes_from_file(self, tmp_path, monkeypatch):
+        """Test ROUTES_FILE is compiled and watched for reloads"""
+        routes_file = tmp_path / "routes.json"
+        routes_file.write_text(json.dumps({
+            "destinations": {"oncall": {"type": "slack", "url": "https://hooks.slack.com/x"}},
+            "routes": [{"severity": "critical", "to": "oncall"}]
+        }))
+        monkeypatch.setenv('ROUTES_FILE', str(routes_file))
+
+        config = Config.from_env()
+        routes = config.load_routes()
+        assert [n.webhook_url for n in routes.route('claude', 'critical')] == ["https://hooks.slack.com/x"]
+        assert routes_file in config.watched_files()
+
+    def test_routes_file_invalid(self, tmp_path, monkeypatch):
+        """Test that a route to an unknown destination raises ValueError"""
+        routes_file = tmp_path / "routes.json"
+        routes_file.write_text(json.dumps({
+            "destinations": {"oncall": {"url": "https://discord.com/x"}},
+            "routes": [{"service": "claude", "to": ["nowhere"]}]
+        }))
+        monkeypatch.setenv('ROUTES_FILE', str(routes_file))
+
+        with pytest.raises(ValueError, match="nowhere"):
+            Config.from_env().load_routes()
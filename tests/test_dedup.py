@@ -0,0 +1,204 @@
+"""
+Test suite for cross-service duplicate alert merging
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+from llm_monitor.config import Config, FeedConfig
+from llm_monitor.dedup import DuplicateIndex, HeldAlert, follow_up, merge_alerts, shingles, words
+from llm_monitor.feed_parser import FeedEntry, FetchResult
+from llm_monitor.monitor import StatusMonitor
+from llm_monitor.notifiers import RESOLVED, UPDATED
+from tests.test_monitor import make_rss
+
+UPSTREAM = (
+    "Elevated errors due to upstream cloud provider outage",
+    "Oct 25, 14:31 UTCInvestigating - We are investigating elevated error rates "
+    "caused by an outage at our cloud provider."
+)
+UPSTREAM_AGAIN = (
+    "Elevated error rates from upstream cloud provider",
+    "Oct 25, 14:35 UTCInvestigating - We are investigating elevated error rates "
+    "caused by an outage at our cloud provider."
+)
+UNRELATED = (
+    "Login issues on claude.ai",
+    "Oct 25, 14:31 UTCInvestigating - We are currently investigating this issue."
+)
+
+
+@pytest.fixture
+def index():
+    return DuplicateIndex(window=900)
+
+
+def held(index, service_id, text, name=None):
+    title, description = text
+    entry = FeedEntry(f"https://{service_id}.example.com/incidents/1", title, description,
+                      f"https://{service_id}.example.com/incidents/1")
+    feed_config = FeedConfig(name=name or service_id.capitalize(), url="https://x/history.rss", color=0)
+    return HeldAlert(service_id, feed_config, entry, None, index.signature(title, description), 0.0)
+
+
+class TestDuplicateIndex:
+    """Tests for the MinHash index"""
+
+    def test_words_drop_boilerplate(self):
+        """Test timestamps, stage markers and stock phrases are not compared"""
+        assert words(*UNRELATED) == ['login', 'issues', 'claude', 'ai']
+        assert shingles(['login', 'issues']) == {'login', 'issues', 'login issues'}
+
+    def test_similarity(self, index):
+        """Test rewordings of one outage score high and unrelated incidents low"""
+        upstream = index.signature(*UPSTREAM)
+
+        assert index.similarity(upstream, index.signature(*UPSTREAM_AGAIN)) >= 0.5
+        assert index.similarity(upstream, index.signature(*UNRELATED)) < 0.3
+        # A shared stock title is not enough when the updates describe different failures
+        assert index.similarity(
+            index.signature("Elevated errors on API", "Requests to the batch endpoint are failing."),
+            index.signature("Elevated errors on Sora", "Video generation jobs are timing out.")
+        ) < 0.3
+
+    def test_match_other_services_only(self, index):
+        """Test a match needs another service and a similar incident"""
+        index.add('claude', 'a', index.signature(*UPSTREAM), now=0)
+
+        assert index.match('chatgpt', index.signature(*UPSTREAM_AGAIN), now=1) == ('claude', 'a')
+        assert index.match('claude', index.signature(*UPSTREAM_AGAIN), now=1) is None
+        assert index.match('chatgpt', index.signature(*UNRELATED), now=1) is None
+
+    def test_expiry(self, index):
+        """Test incidents older than the window are forgotten"""
+        index.add('claude', 'a', index.signature(*UPSTREAM), now=0)
+
+        assert index.match('chatgpt', index.signature(*UPSTREAM), now=901) is None
+        assert len(index) == 0
+        assert not index._buckets
+
+    def test_bounded(self):
+        """Test the oldest incidents are evicted beyond max_entries"""
+        index = DuplicateIndex(window=900, max_entries=10)
+        for n in range(50):
+            index.add(f'feed{n}', 'a', index.signature(f"Outage number {n} of widget{n}", ""), now=n)
+
+        assert len(index) == 10
+        assert sum(len(bucket) for bucket in index._buckets.values()) == 10 * 32
+        assert index.match('x', index.signature("Outage number 3 of widget3", ""), now=50) is None
+        assert index.match('x', index.signature("Outage number 45 of widget45", ""), now=50) == ('feed45', 'a')
+
+    def test_group(self, index):
+        """Test a cycle's alerts are grouped, and repeats of an earlier alert set apart"""
+        first = [held(index, 'claude', UPSTREAM), held(index, 'chatgpt', UPSTREAM_AGAIN),
+                 held(index, 'gemini', UNRELATED)]
+        groups, duplicates = index.group(first, now=0)
+
+        assert [[a.service_id for a in group] for group in groups] == [['claude', 'chatgpt'], ['gemini']]
+        assert duplicates == []
+
+        groups, duplicates = index.group([held(index, 'sora', UPSTREAM)], now=60)
+        assert groups == []
+        assert [(a.service_id, key[0]) for a, key in duplicates] == [('sora', 'claude')]
+
+    def test_merge_alerts(self, index):
+        """Test merged alerts name every service and link each incident"""
+        feed_config, entry = merge_alerts(
+            [held(index, 'claude', UPSTREAM), held(index, 'chatgpt', UPSTREAM_AGAIN)]
+        )
+
+        assert feed_config.name == "Claude, Chatgpt"
+        assert entry.title == UPSTREAM[0]
+        assert entry.description.startswith("Affects Claude, Chatgpt\n")
+        assert "Chatgpt: https://chatgpt.example.com/incidents/1" in entry.description
+
+
+    def test_follow_up(self, index):
+        """Test a later report names the service and the one first alerted on"""
+        entry = follow_up(held(index, 'chatgpt', UPSTREAM_AGAIN), "Claude")
+
+        assert entry.title == UPSTREAM_AGAIN[0]
+        assert entry.description.startswith("Also affects Chatgpt (same incident as Claude)\n\n")
+
+
+class TestMonitorDedup:
+    """Tests for merging alerts in StatusMonitor"""
+
+    @pytest.fixture
+    def monitor(self, tmp_path):
+        config = Config(
+            notification_type='discord',
+            discord_webhook='https://discord.com/webhook',
+            slack_webhook=None,
+            check_interval=60,
+            state_file=tmp_path / "state.json",
+            dedup_window=900
+        )
+        feeds = {
+            service_id: FeedConfig(
+                name=service_id.capitalize(), url=f"https://{service_id}.example.com/history.rss", color=0
+            )
+            for service_id in ('claude', 'chatgpt', 'gemini')
+        }
+        monitor = StatusMonitor(config, feeds=feeds)
+        monitor.notifier = MagicMock()
+        monitor.notifier.send.return_value = True
+        monitor.documents = {}
+        monitor.parser.fetch_feed = MagicMock(
+            side_effect=lambda url, *args, **kwargs: FetchResult(200, monitor.documents[url])
+        )
+        yield monitor
+        monitor.close()
+
+    def publish(self, monitor, service_id, text, guid="inc1"):
+        title, description = text
+        monitor.documents[monitor.feeds[service_id].url] = make_rss(
+            guid=guid, title=title, description=description
+        )
+
+    def test_shared_outage_sent_once(self, monitor):
+        """Test the same outage on two services in one cycle is one alert"""
+        self.publish(monitor, 'claude', UPSTREAM)
+        self.publish(monitor, 'chatgpt', UPSTREAM_AGAIN)
+        self.publish(monitor, 'gemini', UNRELATED)
+
+        monitor.run_check_cycle()
+
+        names = [call.kwargs['service_name'] for call in monitor.notifier.send.call_args_list]
+        assert names == ["Claude, Chatgpt", "Gemini"]
+        assert monitor.metrics.service('chatgpt').duplicates_merged.value == 1
+        assert monitor.metrics.service('chatgpt').notifications_sent.value == 0
+
+    def test_later_report_followed_up(self, monitor):
+        """Test a service reporting an already-alerted incident in a later cycle gets a follow-up"""
+        self.publish(monitor, 'claude', UPSTREAM)
+        monitor.run_check_cycle()
+        monitor.notifier.send.reset_mock()
+
+        self.publish(monitor, 'gemini', UPSTREAM, guid="inc2")
+        monitor.run_check_cycle()
+
+        monitor.notifier.send.assert_called_once()
+        call = monitor.notifier.send.call_args.kwargs
+        assert (call['service_name'], call['kind']) == ("Gemini", UPDATED)
+        assert call['description'].startswith("Also affects Gemini (same incident as Claude)")
+        assert monitor.metrics.service('gemini').duplicates_followed_up.value == 1
+        assert monitor.state_manager.get_last_id('gemini').endswith('/incidents/inc2')
+
+        # Its resolution follows on from the follow-up the channel has seen
+        monitor.notifier.send.reset_mock()
+        self.publish(monitor, 'gemini', (UPSTREAM[0], "Resolved - This incident has been resolved."),
+                     guid="inc2")
+        monitor.run_check_cycle()
+
+        assert [c.kwargs['kind'] for c in monitor.notifier.send.call_args_list] == [RESOLVED]
+
+    def test_disabled_by_default(self, monitor):
+        """Test every service alerts on its own without DEDUP_WINDOW"""
+        monitor.dedup = None
+        self.publish(monitor, 'claude', UPSTREAM)
+        self.publish(monitor, 'chatgpt', UPSTREAM)
+
+        monitor.run_check_cycle()
+
+        assert monitor.notifier.send.call_count == 2
@@ -0,0 +1,147 @@
+"""
+Test suite for the feed diagnostics, run against the local stand-in server
+"""
+
+import gzip
+import json
+import socket
+import zlib
+from unittest.mock import MagicMock
+
+import pytest
+
+from llm_monitor import diagnostics
+from llm_monitor.config import FeedConfig
+from llm_monitor.diagnostics import decode_body, diagnose, percentile, probe, render
+from benchmarks.standin import StandinServer, StandinOptions
+
+
+@pytest.fixture
+def standin():
+    server = StandinServer(StandinOptions(feeds=2, entries=5, tick=0))
+    server.start()
+    yield server
+    server.stop()
+
+
+def closed_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+class TestHelpers:
+    """Tests for percentiles and body decoding"""
+
+    def test_percentile(self):
+        """Test linear interpolation between ranks"""
+        values = [4.0, 1.0, 3.0, 2.0]
+
+        assert percentile(values, 0) == 1.0
+        assert percentile(values, 50) == 2.5
+        assert percentile(values, 100) == 4.0
+        assert percentile([7.0], 99) == 7.0
+        assert percentile([], 50) is None
+
+    def test_decode_body(self):
+        """Test gzip, zlib and raw deflate bodies are decoded"""
+        body = b'<rss>feed</rss>'
+        raw = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+
+        assert decode_body(body, None) == body
+        assert decode_body(gzip.compress(body), 'gzip') == body
+        assert decode_body(zlib.compress(body), 'deflate') == body
+        assert decode_body(raw.compress(body) + raw.flush(), 'deflate') == body
+        assert decode_body(body, 'br') is None
+
+
+class TestProbe:
+    """Tests for probing feeds"""
+
+    def test_phases(self, standin):
+        """Test a plain HTTP probe times every phase except TLS"""
+        url = standin.feed_configs()['feed0'].url
+        result = probe(url, timeout=5)
+
+        assert result.error is None
+        assert result.status == 200
+        assert result.size == result.wire_size > 0
+        assert result.timings['tls'] is None
+        assert all(result.timings[phase] >= 0 for phase in ('dns', 'connect', 'ttfb', 'transfer', 'parse'))
+        assert result.timings['total'] >= result.timings['parse']
+
+        revalidated = probe(url, timeout=5, etag=result.etag)
+        assert revalidated.status == 304
+        assert revalidated.error is None
+
+    def test_unreachable(self):
+        """Test a refused connection is reported as an error"""
+        result = probe(f'http://127.0.0.1:{closed_port()}/feed', timeout=2)
+
+        assert result.status == 0
+        assert 'ConnectionRefusedError' in result.error
+
+
+    @pytest.mark.parametrize("encoding,body", [
+        ('gzip', b'\x1f\x8bgarbage'),
+        ('gzip', gzip.compress(b'<rss>feed</rss>')[:-8]),
+        ('deflate', b'garbage'),
+    ])
+    def test_corrupt_body(self, monkeypatch, encoding, body):
+        """Test a body that does not decompress is a failed probe, not a crash"""
+        response = MagicMock(status=200)
+        response.getheader.side_effect = {'Content-Encoding': encoding}.get
+        monkeypatch.setattr(diagnostics, '_request', lambda *args: ({'tls': None}, response, body))
+
+        result = probe('http://status.example.com/history.rss', timeout=2)
+
+        assert result.error.startswith("bad Content-Encoding body: ")
+        assert result.timings['total'] >= 0
+
+
+class TestDiagnose:
+    """Tests for the per-feed reports"""
+
+    def test_report(self, standin):
+        """Test every feed gets percentiles and validator support"""
+        reports = diagnose(standin.feed_configs(), probes=4, timeout=5)
+
+        assert [r['service'] for r in reports] == ['feed0', 'feed1']
+        for report in reports:
+            assert report['ok'] == 4
+            assert report['errors'] == {}
+            assert report['etag'] and report['last_modified']
+            assert report['conditional_status'] == 304
+            ttfb = report['timings_ms']['ttfb']
+            assert ttfb['p50'] <= ttfb['p95'] <= ttfb['p99'] <= ttfb['max']
+            assert 'tls' not in report['timings_ms']
+
+    def test_no_validators(self):
+        """Test feeds without ETag/Last-Modified skip the conditional probe"""
+        server = StandinServer(StandinOptions(feeds=1, entries=5, etag=False, tick=0))
+        server.start()
+        try:
+            (report,) = diagnose(server.feed_configs(), probes=2, timeout=5)
+        finally:
+            server.stop()
+
+        assert not report['etag'] and not report['last_modified']
+        assert report['conditional_status'] is None
+
+    def test_failures(self):
+        """Test a feed that never answers has errors and no timings"""
+        feeds = {'down': FeedConfig(name="Down", url=f'http://127.0.0.1:{closed_port()}/', color=0)}
+        (report,) = diagnose(feeds, probes=3, timeout=2)
+
+        assert report['ok'] == 0
+        assert sum(report['errors'].values()) == 3
+        assert report['timings_ms'] == {}
+
+    def test_render(self, standin):
+        """Test table and JSON output"""
+        reports = diagnose(standin.feed_configs(), probes=2, timeout=5)
+
+        assert json.loads(render(reports, 'json')) == reports
+        table = render(reports, 'table')
+        assert '(feed0)' in table and '(feed1)' in table
+        assert 'validators: ETag, Last-Modified; conditional request -> 304' in table
@@ -0,0 +1,131 @@
+"""
+Test suite for the entry history store and backfill
+"""
+
+import pytest
+from llm_monitor.backfill import Backfill
+from llm_monitor.config import FeedConfig
+from llm_monitor.feed_parser import FeedEntry
+from llm_monitor.history import HistoryStore, entry_row, resolved_at
+from llm_monitor.timeutil import parse_timestamp
+from benchmarks.standin import StandinOptions, StandinServer
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = HistoryStore(tmp_path / "history.db")
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def standin():
+    server = StandinServer(StandinOptions(feeds=4, entries=50, tick=0))
+    server.start()
+    yield server
+    server.stop()
+
+
+def make_row(entry_id="inc1", description="Investigating - Elevated errors"):
+    entry = FeedEntry.compact(entry_id, "Elevated errors", description, f"https://x/{entry_id}")
+    return entry_row('openai', entry, True)
+
+
+class TestHistoryStore:
+    """Tests for HistoryStore"""
+
+    def test_upsert_only_counts_changes(self, store):
+        """Test re-ingesting an unchanged entry is a no-op and a revision replaces it"""
+        assert store.insert_many([make_row(), make_row("inc2")]) == 2
+        assert store.insert_many([make_row()]) == 0
+        assert store.insert_many([make_row(description="Resolved - Fixed")]) == 1
+
+        rows = {row['entry_id']: row for row in store.entries('openai')}
+        assert store.count() == 2
+        assert rows['inc1']['stage'] == 'resolved'
+
+    def test_batches(self, store, monkeypatch):
+        """Test large inserts are split into several transactions"""
+        monkeypatch.setattr(HistoryStore, 'BATCH_SIZE', 3)
+
+        assert store.insert_many(make_row(f"inc{i}") for i in range(10)) == 10
+        assert store.count('openai') == 10
+
+
+class TestIncidentTimes:
+    """Tests for the start and resolution times stored with each entry"""
+
+    def test_resolved_at_newest_resolution(self):
+        """Test the resolution time comes from the newest resolved update"""
+        description = (
+            "Oct 25, 14:30 UTCPostmortem - Details.Oct 25, 13:45 UTCResolved - Fixed."
+            "Oct 25, 13:03 UTCInvestigating - Looking into it."
+        )
+        started = parse_timestamp("Sat, 25 Oct 2025 13:03:00 +0000")
+
+        assert resolved_at(description, started) == started + 42 * 60
+
+    def test_resolved_at_crosses_new_year(self):
+        """Test an incident resolved in January after starting in December"""
+        started = parse_timestamp("Wed, 31 Dec 2025 23:30:00 +0000")
+
+        assert resolved_at("Jan 1, 00:15 UTCResolved - Fixed.", started) == started + 45 * 60
+
+    def test_entry_row_times(self):
+        """Test only resolved entries get a resolution time"""
+        entry = FeedEntry.compact(
+            "inc1", "Elevated errors", "Oct 25, 13:45 UTCResolved - Fixed.", "https://x/inc1",
+            "Sat, 25 Oct 2025 13:03:00 +0000"
+        )
+        open_entry = entry._replace(description="Oct 25, 13:45 UTCIdentified - Found it.")
+
+        assert entry_row('openai', entry, False)[9:] == (1761397380.0, 1761399900.0)
+        assert entry_row('openai', open_entry, True)[9:] == (1761397380.0, None)
+
+
+class TestBackfill:
+    """Tests for the backfill command"""
+
+    def test_ingests_every_entry(self, store, standin):
+        """Test all entries of all feeds are stored without notifying"""
+        report = Backfill(store, workers=4).run(standin.feed_configs())
+
+        assert report.failed == []
+        assert report.entries == 4 * 50
+        assert store.count() == 4 * 50
+        assert store.count('feed0') == 50
+        assert standin.stats()['deliveries'] == 0
+
+    def test_failed_feed_is_reported(self, store, standin):
+        """Test an unreachable feed is reported without stopping the others"""
+        feeds = standin.feed_configs()
+        feeds['broken'] = FeedConfig(name="Broken", url=f"{standin.base_url}/missing", color=0)
+
+        report = Backfill(store, workers=4, timeout=5).run(feeds)
+
+        assert report.failed == ['broken']
+        assert store.count() == 4 * 50
+
+
+class TestMonitorHistory:
+    """Tests for recording new entries from the live monitor"""
+
+    def test_new_entries_written_per_cycle(self, tmp_path, standin):
+        """Test entries processed in a cycle land in the history when HISTORY_FILE is set"""
+        from llm_monitor.config import Config
+        from llm_monitor.monitor import StatusMonitor
+
+        config = Config(
+            notification_type='discord',
+            discord_webhook=standin.webhook_url,
+            slack_webhook=None,
+            check_interval=60,
+            state_file=tmp_path / "state.json",
+            history_file=tmp_path / "history.db"
+        )
+        monitor = StatusMonitor(config, feeds=standin.feed_configs())
+        try:
+            monitor.run_check_cycle()
+            assert monitor.history.count() == 4
+        finally:
+            monitor.close()
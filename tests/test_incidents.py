@@ -0,0 +1,110 @@
+"""
+Test suite for incident lifecycle tracking
+"""
+
+import random
+from datetime import datetime
+
+import pytest
+from llm_monitor.feed_parser import FeedEntry, FeedParser
+from llm_monitor.incidents import (
+    CRITICAL, IDENTIFIED, INVESTIGATING, MAINTENANCE, MAJOR, MAX_OPEN_INCIDENTS, MINOR,
+    MONITORING, OPENED, RESOLVED, UPDATED, IncidentTracker, classify_severity, classify_stage
+)
+from llm_monitor.state import StateManager
+from benchmarks.synthetic import incident_description
+
+
+def statuspage_entry(stages, entry_id="inc1", title="Elevated errors on API"):
+    """Entry whose description has the first `stages` Statuspage updates, newest first"""
+    html = incident_description(random.Random(0), datetime(2025, 10, 25, 14, 3), stages)
+    return FeedEntry.compact(entry_id, title, FeedParser._clean_html(html), f"https://x/{entry_id}")
+
+
+@pytest.fixture
+def tracker(tmp_path):
+    return IncidentTracker(StateManager(tmp_path / "state.json"))
+
+
+class TestClassifyStage:
+    """Tests for classify_stage"""
+
+    @pytest.mark.parametrize("stages,expected", [
+        (1, INVESTIGATING), (2, IDENTIFIED), (3, MONITORING), (4, RESOLVED),
+    ])
+    def test_statuspage_markers(self, stages, expected):
+        """Test the newest update's stage marker wins"""
+        entry = statuspage_entry(stages)
+        assert classify_stage(entry.title, entry.description) == expected
+
+    def test_plain_update_keeps_stage(self):
+        """Test an "Update" post keeps the stage recorded so far"""
+        assert classify_stage("Outage", "Update - Still working on it", IDENTIFIED) == IDENTIFIED
+
+    def test_without_markers(self):
+        """Test resolution keywords are used when there is no stage marker"""
+        assert classify_stage("Outage", "This incident has been resolved.") == RESOLVED
+        assert classify_stage("Outage", "We are looking into it") == INVESTIGATING
+
+
+class TestClassifySeverity:
+    """Tests for classify_severity"""
+
+    @pytest.mark.parametrize("title,expected", [
+        ("Major outage of the API", CRITICAL),
+        ("ChatGPT unavailable for some users", CRITICAL),
+        ("Elevated error rates on Claude.ai", MAJOR),
+        ("Partial outage in EU region", MAJOR),
+        ("Increased latency for Sonnet", MINOR),
+        ("Scheduled maintenance: API unavailable", MAINTENANCE),
+    ])
+    def test_title(self, title, expected):
+        """Test the title's wording decides the severity"""
+        assert classify_severity(title, "") == expected
+
+    def test_description_fallback(self):
+        """Test the description is used when the title says nothing"""
+        assert classify_severity("Claude.ai", "Investigating - Logins are failing") == MAJOR
+        assert classify_severity("Claude.ai", "Investigating - Looking into it") == MINOR
+
+
+class TestIncidentTracker:
+    """Tests for IncidentTracker"""
+
+    def test_lifecycle(self, tracker):
+        """Test an incident opens, follows its stages and closes exactly once"""
+        assert tracker.observe('openai', statuspage_entry(1), True) == OPENED
+        assert tracker.is_degraded('openai')
+        assert tracker.observe('openai', statuspage_entry(2), True) == UPDATED
+        assert tracker.open_incidents('openai')['inc1']['stage'] == IDENTIFIED
+        assert tracker.observe('openai', statuspage_entry(2), True) is None
+
+        assert tracker.observe('openai', statuspage_entry(4), False) == RESOLVED
+        assert tracker.observe('openai', statuspage_entry(4), False) is None
+        assert not tracker.is_degraded('openai')
+
+    def test_inactive_entries_do_not_open(self, tracker):
+        """Test entries the filter does not flag never open an incident"""
+        assert tracker.observe('openai', statuspage_entry(1), False) is None
+        assert tracker.observe('openai', statuspage_entry(4), False) is None
+        assert not tracker.is_degraded('openai')
+
+    def test_survives_restart(self, tmp_path, tracker):
+        """Test open incidents are saved and loaded with the state"""
+        tracker.observe('openai', statuspage_entry(2), True)
+        tracker.state_manager.save()
+
+        reloaded = IncidentTracker(StateManager(tmp_path / "state.json"))
+        reloaded.state_manager.load()
+
+        assert reloaded.is_degraded('openai')
+        assert reloaded.observe('openai', statuspage_entry(4), False) == RESOLVED
+
+    def test_open_incidents_are_bounded(self, tracker):
+        """Test the least recently updated incidents are dropped past the limit"""
+        for index in range(MAX_OPEN_INCIDENTS + 3):
+            tracker.observe('openai', statuspage_entry(1, entry_id=f"inc{index}"), True)
+
+        open_ids = set(tracker.open_incidents('openai'))
+        assert len(open_ids) == MAX_OPEN_INCIDENTS
+        assert "inc0" not in open_ids
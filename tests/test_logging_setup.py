@@ -0,0 +1,148 @@
+"""
+Test suite for the queue-based logging pipeline
+"""
+
+import json
+import logging
+import sys
+import pytest
+from llm_monitor.logging_setup import (
+    JsonFormatter, SamplingFilter, LazyQueueHandler, setup_logging, stop_logging
+)
+from llm_monitor.config import Config
+from llm_monitor.monitor import StatusMonitor
+
+
+def make_record(msg="Checking %s...", args=("Claude",), level=logging.INFO, **extra):
+    record = logging.LogRecord('llm_monitor.monitor', level, __file__, 1, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+@pytest.fixture
+def restore_root_logger():
+    root = logging.getLogger()
+    handlers, level = list(root.handlers), root.level
+    yield
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    for handler in handlers:
+        root.addHandler(handler)
+    root.setLevel(level)
+
+
+class TestJsonFormatter:
+    """Tests for structured JSON output"""
+
+    def test_format_fields(self):
+        """Test that records become JSON with message and extra fields"""
+        line = JsonFormatter().format(make_record(service_id='claude'))
+        entry = json.loads(line)
+
+        assert entry['message'] == "Checking Claude..."
+        assert entry['level'] == 'INFO'
+        assert entry['logger'] == 'llm_monitor.monitor'
+        assert entry['service_id'] == 'claude'
+        assert 'args' not in entry
+
+    def test_format_exception(self):
+        """Test that exception info is included"""
+        try:
+            raise ValueError("bad feed")
+        except ValueError:
+            record = make_record(level=logging.ERROR)
+            record.exc_info = sys.exc_info()
+
+        entry = json.loads(JsonFormatter().format(record))
+        assert 'ValueError: bad feed' in entry['exc_info']
+
+
+class TestSamplingFilter:
+    """Tests for high-volume message sampling"""
+
+    def test_burst_then_sample(self):
+        """Test that a template passes its burst, then one in N"""
+        sampler = SamplingFilter(burst=3, rate=5)
+        passed = sum(sampler.filter(make_record()) for _ in range(23))
+
+        # 3 burst records plus records 8, 13, 18 and 23
+        assert passed == 7
+
+    def test_warnings_always_pass(self):
+        """Test that warnings and errors are never sampled"""
+        sampler = SamplingFilter(burst=0, rate=1000)
+        record = make_record(level=logging.WARNING)
+        assert all(sampler.filter(record) for _ in range(10))
+
+    def test_templates_counted_separately(self):
+        """Test that different templates have independent budgets"""
+        sampler = SamplingFilter(burst=1, rate=1000)
+        assert sampler.filter(make_record(msg="first %s")) is True
+        assert sampler.filter(make_record(msg="second %s")) is True
+        assert sampler.filter(make_record(msg="first %s")) is False
+
+
+class TestSetupLogging:
+    """Tests for the queue pipeline"""
+
+    def test_lazy_prepare(self):
+        """Test that records are enqueued without formatting"""
+        record = make_record()
+        prepared = LazyQueueHandler(None).prepare(record)
+        assert prepared is record
+        assert prepared.args == ("Claude",)
+
+    def test_mutable_args_formatted_eagerly(self):
+        """Test records with arguments that may change are formatted before enqueueing"""
+        feeds = ['claude']
+        record = LazyQueueHandler(None).prepare(make_record("Feeds: %s", (feeds,)))
+        feeds.append('chatgpt')
+
+        assert record.getMessage() == "Feeds: ['claude']"
+        assert record.args is None
+        # Immutable arguments stay lazy
+        assert LazyQueueHandler(None).prepare(make_record("%s: %d", ("Claude", 3))).args == ("Claude", 3)
+
+    def test_writes_json_through_queue(self, tmp_path, restore_root_logger):
+        """Test end to end delivery to a rotating JSON log file"""
+        log_file = tmp_path / "logs" / "monitor.log"
+        listener = setup_logging("INFO", log_file=log_file, json_format=True)
+
+        logging.getLogger('llm_monitor.test').info("Checked %d feeds", 3)
+        logging.getLogger('llm_monitor.test').debug("discarded")
+        listener.stop()
+
+        lines = log_file.read_text().splitlines()
+        assert len(lines) == 1
+        assert json.loads(lines[0])['message'] == "Checked 3 feeds"
+
+    def test_stop_logging_drains_queue(self, tmp_path, restore_root_logger):
+        """Test stop_logging() writes out queued records and can be called again"""
+        log_file = tmp_path / "monitor.log"
+        setup_logging("INFO", log_file=log_file)
+
+        logging.getLogger('llm_monitor.test').error("Last words")
+        stop_logging()
+        stop_logging()
+
+        assert "Last words" in log_file.read_text()
+
+    def test_force_exit_flushes_logs(self, tmp_path, restore_root_logger, monkeypatch):
+        """Test the forced-exit message reaches the log file before os._exit"""
+        log_file = tmp_path / "monitor.log"
+        setup_logging("INFO", log_file=log_file)
+        monitor = StatusMonitor(Config(
+            notification_type='discord',
+            discord_webhook=None,
+            slack_webhook=None,
+            check_interval=60,
+            state_file=tmp_path / "state.json"
+        ))
+        exits = []
+        monkeypatch.setattr('llm_monitor.monitor.os._exit', exits.append)
+
+        monitor._force_exit("Shutdown did not finish in time")
+        monitor.close()
+
+        assert exits == [1]
+        assert "Shutdown did not finish in time" in log_file.read_text()
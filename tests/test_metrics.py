@@ -0,0 +1,88 @@
+"""
+Test suite for metrics collection and the embedded HTTP server
+"""
+
+import urllib.request
+import pytest
+from llm_monitor.metrics import Counter, Histogram, MetricsRegistry, MonitorMetrics
+from llm_monitor.httpd import EmbeddedServer
+
+
+class TestMetrics:
+    """Tests for metric types and rendering"""
+
+    def test_counter_labels(self):
+        """Test labelled counter children are reused"""
+        counter = Counter('requests_total', 'Requests', ('service',))
+        counter.labels('claude').inc()
+        counter.labels('claude').inc(2)
+
+        assert counter.labels('claude') is counter.labels('claude')
+        assert 'requests_total{service="claude"} 3' in counter.render()
+
+    def test_wrong_label_count(self):
+        """Test that mismatched labels raise ValueError"""
+        counter = Counter('requests_total', 'Requests', ('service',))
+        with pytest.raises(ValueError):
+            counter.labels('claude', 'extra')
+
+    def test_histogram_buckets(self):
+        """Test histogram buckets are cumulative and include +Inf"""
+        histogram = Histogram('latency_seconds', 'Latency', buckets=(0.1, 1.0))
+        histogram.observe(0.05)
+        histogram.observe(0.5)
+        histogram.observe(5.0)
+
+        output = histogram.render()
+        assert 'latency_seconds_bucket{le="0.1"} 1' in output
+        assert 'latency_seconds_bucket{le="1"} 2' in output
+        assert 'latency_seconds_bucket{le="+Inf"} 3' in output
+        assert 'latency_seconds_count 3' in output
+        assert 'latency_seconds_sum 5.55' in output
+
+    def test_registry_render(self):
+        """Test registry output includes HELP and TYPE lines"""
+        registry = MetricsRegistry()
+        registry.gauge('up', 'Whether the monitor is up').set(1)
+
+        output = registry.render()
+        assert '# HELP up Whether the monitor is up' in output
+        assert '# TYPE up gauge' in output
+        assert output.endswith('up 1\n')
+
+    def test_service_metrics_bound_once(self):
+        """Test per-service children are bound once and cached"""
+        metrics = MonitorMetrics()
+        bound = metrics.service('claude')
+        bound.notifications_sent.inc()
+
+        assert metrics.service('claude') is bound
+        assert (
+            'llm_monitor_notifications_total{service="claude",result="sent"} 1'
+            in metrics.registry.render()
+        )
+
+
+class TestEmbeddedServer:
+    """Tests for the embedded HTTP server"""
+
+    def test_serves_metrics(self):
+        """Test that /metrics is served and unknown paths return 404"""
+        metrics = MonitorMetrics()
+        metrics.cycles.inc()
+
+        server = EmbeddedServer('127.0.0.1', 0)
+        server.add_route('/metrics', metrics.http_handler)
+        server.start()
+        try:
+            base = f"http://127.0.0.1:{server.port}"
+            with urllib.request.urlopen(f"{base}/metrics", timeout=5) as response:
+                body = response.read().decode()
+                assert response.status == 200
+                assert 'llm_monitor_cycles_total 1' in body
+
+            with pytest.raises(urllib.error.HTTPError) as exc_info:
+                urllib.request.urlopen(f"{base}/missing", timeout=5)
+            assert exc_info.value.code == 404
+        finally:
+            server.stop()
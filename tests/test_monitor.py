@@ -0,0 +1,469 @@
+"""
+Test suite for the monitoring orchestrator
+"""
+
+import json
+import logging
+import os
+import signal
+import time
+
+import pytest
+from unittest.mock import MagicMock
+from llm_monitor.config import Config, FeedConfig
+from llm_monitor.feed_parser import FeedEntry, FetchResult
+from llm_monitor.monitor import StatusMonitor
+from llm_monitor.notifiers import NEW
+from llm_monitor.tracing import SpanHook
+
+FEED_URL = "https://status.example.com/history.rss"
+
+RSS_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0">
+  <channel>
+    <title>Example Status - Incident History</title>
+    <item>
+      <title>{title}</title>
+      <description>&lt;p&gt;{description}&lt;/p&gt;</description>
+      <pubDate>Sat, 25 Oct 2025 14:03:00 +0000</pubDate>
+      <link>https://status.example.com/incidents/{guid}</link>
+      <guid>https://status.example.com/incidents/{guid}</guid>
+    </item>
+  </channel>
+</rss>
+"""
+
+
+def make_rss(guid="abc123", title="Elevated errors on API",
+             description="We are investigating this issue."):
+    """Build a single-entry Statuspage-style RSS document"""
+    return RSS_TEMPLATE.format(guid=guid, title=title, description=description).encode()
+
+
+@pytest.fixture
+def feed_config():
+    return FeedConfig(name="Example", url=FEED_URL, color=0xFF0000)
+
+
+@pytest.fixture
+def monitor(tmp_path):
+    config = Config(
+        notification_type='discord',
+        discord_webhook='https://discord.com/webhook',
+        slack_webhook=None,
+        check_interval=60,
+        state_file=tmp_path / "state.json"
+    )
+    monitor = StatusMonitor(config)
+    monitor.notifier = MagicMock()
+    monitor.notifier.send.return_value = True
+    monitor.parser.fetch_feed = MagicMock()
+    return monitor
+
+
+class TestStatusMonitor:
+    """Tests for StatusMonitor.check_feed"""
+
+    def test_new_incident_notifies(self, monitor, feed_config):
+        """Test that a new active incident sends a notification"""
+        monitor.parser.fetch_feed.return_value = FetchResult(200, make_rss(), etag='"v1"')
+
+        monitor.check_feed('example', feed_config)
+
+        monitor.notifier.send.assert_called_once()
+        assert monitor.notifier.send.call_args.kwargs['title'] == "Elevated errors on API"
+        assert monitor.state_manager.get_last_id('example').endswith('/abc123')
+
+    def test_process_entry_only_decides(self, monitor, feed_config):
+        """Test _process_entry records the entry and returns what to send without sending"""
+        entry = FeedEntry("https://status.example.com/incidents/abc123", "Elevated errors on API",
+                          "We are investigating this issue.", "https://status.example.com/incidents/abc123")
+
+        assert monitor._process_entry('example', feed_config, entry) == [NEW]
+        assert monitor._process_entry('example', feed_config, entry) == []
+
+        monitor.notifier.send.assert_not_called()
+        assert monitor.state_manager.get_last_id('example') == entry.entry_id
+
+    def test_seen_entry_is_skipped(self, monitor, feed_config):
+        """Test that an already processed entry does not notify again"""
+        monitor.parser.fetch_feed.return_value = FetchResult(200, make_rss())
+
+        monitor.check_feed('example', feed_config)
+        monitor.check_feed('example', feed_config)
+
+        assert monitor.notifier.send.call_count == 1
+
+    def test_revised_entry_notifies_update(self, monitor, feed_config):
+        """Test an in-place edit under the same ID is reclassified and sent as an update"""
+        monitor.parser.fetch_feed.return_value = FetchResult(200, make_rss())
+        monitor.check_feed('example', feed_config)
+
+        monitor.parser.fetch_feed.return_value = FetchResult(
+            200, make_rss(description="The issue has been identified. We are investigating.")
+        )
+        monitor.check_feed('example', feed_config)
+
+        assert monitor.notifier.send.call_count == 2
+        assert monitor.notifier.send.call_args.kwargs['kind'] == 'updated'
+        assert monitor.notifier.send.call_args_list[0].kwargs['kind'] == 'new'
+
+    def test_revision_to_resolved_sends_one_notice(self, monitor, feed_config):
+        """Test resolving a tracked incident sends a single resolution notice"""
+        monitor.parser.fetch_feed.return_value = FetchResult(200, make_rss())
+        monitor.check_feed('example', feed_config)
+        assert monitor.incidents.is_degraded('example')
+
+        for description in ("Resolved - This incident has been resolved.",
+                            "Resolved - This incident has been resolved. Thanks."):
+            monitor.parser.fetch_feed.return_value = FetchResult(
+                200, make_rss(description=description)
+            )
+            monitor.check_feed('example', feed_config)
+
+        kinds = [c.kwargs['kind'] for c in monitor.notifier.send.call_args_list]
+        assert kinds == ['new', 'resolved']
+        assert not monitor.incidents.is_degraded('example')
+        assert monitor.state_manager.get_state()['example']['active'] is False
+        assert monitor.metrics.service('example').open_incidents.value == 0
+
+    def test_whitespace_change_is_not_a_revision(self, monitor, feed_config):
+        """Test the fingerprint ignores whitespace and case"""
+        monitor.parser.fetch_feed.return_value = FetchResult(200, make_rss())
+        monitor.check_feed('example', feed_config)
+
+        monitor.parser.fetch_feed.return_value = FetchResult(
+            200, make_rss(description="We are  INVESTIGATING\nthis issue.")
+        )
+        monitor.check_feed('example', feed_config)
+
+        assert monitor.notifier.send.call_count == 1
+
+    def test_state_without_fingerprint_is_adopted(self, monitor, feed_config):
+        """Test state written before fingerprints existed does not re-notify"""
+        monitor.state_manager.update_service(
+            'example', 'https://status.example.com/incidents/abc123', "Elevated errors on API"
+        )
+        monitor.parser.fetch_feed.return_value = FetchResult(200, make_rss())
+
+        monitor.check_feed('example', feed_config)
+
+        monitor.notifier.send.assert_not_called()
+        assert monitor.state_manager.get_last_entry('example')[1] is not None
+
+    def test_resolved_entry_does_not_notify(self, monitor, feed_config):
+        """Test that resolution updates are recorded without notifying"""
+        monitor.parser.fetch_feed.return_value = FetchResult(
+            200, make_rss(description="This incident has been resolved.")
+        )
+
+        monitor.check_feed('example', feed_config)
+
+        monitor.notifier.send.assert_not_called()
+        assert monitor.state_manager.get_last_id('example') is not None
+
+    def test_conditional_get_validators(self, monitor, feed_config):
+        """Test ETag is reused and 304 responses are counted as skips"""
+        monitor.parser.fetch_feed.return_value = FetchResult(200, make_rss(), etag='"v1"')
+        monitor.check_feed('example', feed_config)
+
+        monitor.parser.fetch_feed.return_value = FetchResult(304, b'')
+        monitor.check_feed('example', feed_config)
+
+        assert monitor.parser.fetch_feed.call_args.args == (FEED_URL, '"v1"', None)
+        assert monitor.metrics.service('example').not_modified.value == 1
+
+    def test_fetch_failure_counts_error(self, monitor, feed_config):
+        """Test that a failed fetch is counted and does not touch state"""
+        monitor.parser.fetch_feed.return_value = None
+
+        monitor.check_feed('example', feed_config)
+
+        assert monitor.metrics.service('example').errors.value == 1
+        assert monitor.state_manager.get_last_id('example') is None
+
+    def test_stage_spans(self, monitor, feed_config):
+        """Test that every stage emits a span tagged with the service"""
+        class Collector(SpanHook):
+            def __init__(self):
+                self.spans = []
+
+            def on_end(self, span):
+                self.spans.append(span)
+
+        collector = Collector()
+        monitor.tracer.add_hook(collector)
+        monitor.parser.fetch_feed.return_value = FetchResult(200, make_rss())
+
+        monitor.check_feed('example', feed_config)
+
+        names = [span.name for span in collector.spans]
+        assert names == ['fetch', 'parse', 'classify', 'state', 'notify', 'check_feed']
+        assert collector.spans[1].attributes['parser'] == 'stream'
+        assert all(span.attributes['service_id'] == 'example' for span in collector.spans)
+
+    def test_stage_spans_without_streaming(self, monitor, feed_config):
+        """Test that feedparser extraction gets its own span when streaming is off"""
+        class Collector(SpanHook):
+            def __init__(self):
+                self.spans = []
+
+            def on_end(self, span):
+                self.spans.append(span)
+
+        collector = Collector()
+        monitor.config.stream_parse = False
+        monitor.tracer.add_hook(collector)
+        monitor.parser.fetch_feed.return_value = FetchResult(200, make_rss())
+
+        monitor.check_feed('example', feed_config)
+
+        names = [span.name for span in collector.spans]
+        assert names == ['fetch', 'parse', 'extract', 'classify', 'state', 'notify', 'check_feed']
+
+    def test_stream_parse_falls_back_to_feedparser(self, monitor, feed_config):
+        """Test that documents the streaming parser rejects still go through feedparser"""
+        monitor.parser.fetch_feed.return_value = FetchResult(200, b'<rss><channel>')
+        monitor.parser.parse_content = MagicMock(return_value=None)
+
+        assert monitor.check_feed('example', feed_config) is False
+        monitor.parser.parse_content.assert_called_once()
+
+
+class TestRunOnce:
+    """Tests for StatusMonitor.run_once"""
+
+    def test_success_saves_state(self, monitor, feed_config):
+        """Test a clean one-shot run exits 0 and flushes state with validators"""
+        monitor.feeds = {'example': feed_config}
+        monitor.parser.fetch_feed.return_value = FetchResult(200, make_rss(), etag='"v1"')
+
+        assert monitor.run_once() == 0
+
+        saved = monitor.state_manager.state_file.read_text()
+        assert 'abc123' in saved
+        assert '\\"v1\\"' in saved
+
+    def test_feed_failure_exit_code(self, monitor, feed_config):
+        """Test that a failed feed yields exit code 2"""
+        monitor.feeds = {'example': feed_config}
+        monitor.parser.fetch_feed.return_value = None
+
+        assert monitor.run_once() == 2
+
+    def test_state_save_failure_exit_code(self, monitor, feed_config):
+        """Test that an unwritable state file yields exit code 1"""
+        monitor.feeds = {'example': feed_config}
+        monitor.parser.fetch_feed.return_value = FetchResult(304, b'')
+        monitor.state_manager.save = MagicMock(return_value=False)
+
+        assert monitor.run_once() == 1
+
+
+class TestScheduling:
+    """Tests for cycle budgets, drift-free scheduling and shutdown"""
+
+    @pytest.fixture
+    def two_feeds(self, monitor, feed_config):
+        other = FeedConfig(name="Other", url="https://status.other.com/history.rss", color=0)
+        monitor.feeds = {'example': feed_config, 'other': other}
+        monitor.metrics.service('other')
+        return monitor
+
+    def test_budget_defers_remaining_feeds(self, two_feeds):
+        """Test feeds past the deadline are deferred and checked first next cycle"""
+        monitor = two_feeds
+
+        def slow_fetch(url, etag, modified, timeout):
+            time.sleep(0.05)
+            return FetchResult(304, b'')
+
+        monitor.parser.fetch_feed.side_effect = slow_fetch
+        monitor.run_check_cycle(deadline=time.monotonic() + 0.01)
+
+        assert monitor.parser.fetch_feed.call_count == 1
+        assert monitor.metrics.service('other').deferred.value == 1
+
+        monitor.parser.fetch_feed.reset_mock()
+        monitor.run_check_cycle()
+
+        urls = [c.args[0] for c in monitor.parser.fetch_feed.call_args_list]
+        assert urls == ["https://status.other.com/history.rss", FEED_URL]
+
+    def test_fetch_timeout_capped_by_deadline(self, monitor, feed_config):
+        """Test the fetch timeout never exceeds the time left in the cycle"""
+        monitor.parser.fetch_feed.return_value = FetchResult(304, b'')
+
+        monitor.check_feed('example', feed_config, deadline=time.monotonic() + 2)
+
+        assert monitor.parser.fetch_feed.call_args.kwargs['timeout'] <= 2
+
+    @pytest.mark.parametrize("now,expected", [
+        (10.0, 60.0),    # short cycle: next tick stays on the grid
+        (59.9, 60.0),
+        (130.0, 180.0),  # overran two ticks: skip them
+    ])
+    def test_next_run_stays_on_grid(self, now, expected):
+        """Test next cycle start is anchored to the schedule, not to cycle end"""
+        assert StatusMonitor._next_run(0.0, now, 60.0) == expected
+
+    def test_request_stop_drains_and_saves(self, two_feeds):
+        """Test a stop finishes the feed in flight, skips the rest and saves state"""
+        monitor = two_feeds
+
+        def fetch_then_stop(url, etag, modified, timeout):
+            monitor.request_stop()
+            return FetchResult(200, make_rss(), etag='"v1"')
+
+        monitor.parser.fetch_feed.side_effect = fetch_then_stop
+        monitor.run()
+
+        assert monitor.parser.fetch_feed.call_count == 1
+        assert 'abc123' in monitor.state_manager.state_file.read_text()
+
+    def test_sigterm_stops_loop(self, monitor, feed_config):
+        """Test SIGTERM ends the loop gracefully and restores the old handler"""
+        monitor.feeds = {'example': feed_config}
+        previous = signal.getsignal(signal.SIGTERM)
+
+        def fetch_then_signal(url, etag, modified, timeout):
+            os.kill(os.getpid(), signal.SIGTERM)
+            return FetchResult(304, b'')
+
+        monitor.parser.fetch_feed.side_effect = fetch_then_signal
+        monitor.run()
+
+        assert monitor.state_manager.state_file.exists()
+        assert signal.getsignal(signal.SIGTERM) is previous
+
+
+    @pytest.mark.parametrize("second_signal,message", [
+        (True, "Received SIGTERM again, saving state and exiting now"),
+        (False, "Shutdown did not finish in time, saving state and exiting now"),
+    ])
+    def test_forced_exit_reason(self, monitor, monkeypatch, caplog, second_signal, message):
+        """Test a forced exit logs whether a second signal or the timeout caused it"""
+        exits = []
+        monkeypatch.setattr('llm_monitor.monitor.os._exit', exits.append)
+        monitor.config.shutdown_timeout = 0 if not second_signal else 60
+
+        with caplog.at_level(logging.ERROR, logger='llm_monitor.monitor'):
+            monitor._handle_signal(signal.SIGTERM, None)
+            if second_signal:
+                monitor._handle_signal(signal.SIGTERM, None)
+            else:
+                monitor._shutdown_timer.join(5)
+        monitor._shutdown_timer.cancel()
+
+        assert exits == [1]
+        assert [r.getMessage() for r in caplog.records if r.levelno == logging.ERROR] == [message]
+
+
+class TestReload:
+    """Tests for live config reload"""
+
+    @pytest.fixture
+    def feeds_file(self, tmp_path, monkeypatch):
+        path = tmp_path / "feeds.json"
+        path.write_text(json.dumps({
+            'example': {'name': 'Example', 'url': FEED_URL, 'color': '#FF0000'},
+            'other': {'name': 'Other', 'url': 'https://status.other.com/history.rss'},
+        }))
+        monkeypatch.setenv('FEEDS_FILE', str(path))
+        monkeypatch.setenv('CHECK_INTERVAL', '60')
+        monkeypatch.setenv('STATE_FILE', str(tmp_path / "state.json"))
+        return path
+
+    @pytest.fixture
+    def reloadable(self, feeds_file):
+        monitor = StatusMonitor(Config.from_env())
+        monitor.parser.fetch_feed = MagicMock(return_value=FetchResult(304, b''))
+        return monitor
+
+    def test_feed_set_diff(self, reloadable, feeds_file):
+        """Test only added, removed and changed feeds are touched"""
+        monitor = reloadable
+        monitor.state_manager.set_validators('example', '"v1"', None)
+        monitor.state_manager.set_validators('other', '"v2"', None)
+        example_metrics = monitor.metrics.service('example')
+        session = monitor.parser.session
+
+        feeds_file.write_text(json.dumps({
+            'example': {'name': 'Example', 'url': FEED_URL, 'color': '#FF0000'},
+            'other': {'name': 'Other', 'url': 'https://status.other.com/feed.rss'},
+            'third': {'name': 'Third', 'url': 'https://status.third.com/history.rss'},
+        }))
+        assert monitor.reload_config() is True
+
+        assert set(monitor.feeds) == {'example', 'other', 'third'}
+        assert monitor.metrics.service('example') is example_metrics
+        assert monitor.parser.session is session
+        assert monitor.state_manager.get_validators('example') == ('"v1"', None)
+        assert monitor.state_manager.get_validators('other') == (None, None)
+
+    def test_removed_feed_metrics_dropped(self, reloadable, feeds_file):
+        """Test a removed feed stops being checked and exported"""
+        monitor = reloadable
+        feeds_file.write_text(json.dumps({
+            'example': {'name': 'Example', 'url': FEED_URL},
+        }))
+        monitor.reload_config()
+        monitor.run_check_cycle()
+
+        assert monitor.parser.fetch_feed.call_count == 1
+        assert 'service="other"' not in monitor.metrics.registry.render()
+
+    def test_removed_feed_no_longer_push_fed(self, reloadable, feeds_file):
+        """Test reload prunes push-fed feeds in place, keeping the dict the HTTP thread writes to"""
+        monitor = reloadable
+        monitor._push_fed.update({'example': 1.0, 'other': 2.0})
+        push_fed = monitor._push_fed
+        feeds_file.write_text(json.dumps({
+            'example': {'name': 'Example', 'url': FEED_URL},
+        }))
+        monitor.reload_config()
+
+        assert monitor._push_fed is push_fed
+        assert push_fed == {'example': 1.0}
+
+    def test_invalid_config_is_rejected(self, reloadable, feeds_file):
+        """Test a broken feeds file keeps the running config"""
+        monitor = reloadable
+        feeds_file.write_text("{not json")
+
+        assert monitor.reload_config() is False
+        assert set(monitor.feeds) == {'example', 'other'}
+
+    @pytest.mark.parametrize("content", [
+        {'example': 'oops'},
+        {'example': ['https://status.example.com/history.rss']},
+        {'example': {'name': 'Example', 'url': FEED_URL, 'color': []}},
+    ])
+    def test_malformed_feed_is_rejected(self, reloadable, feeds_file, content):
+        """Test a feed entry of the wrong shape keeps the running feeds instead of crashing"""
+        monitor = reloadable
+        feeds_file.write_text(json.dumps(content))
+
+        assert monitor.reload_config() is False
+        assert set(monitor.feeds) == {'example', 'other'}
+
+    def test_reload_request_reschedules(self, reloadable, monkeypatch):
+        """Test a reload while sleeping applies a new interval to the pending cycle"""
+        monitor = reloadable
+        monkeypatch.setenv('CHECK_INTERVAL', '10')
+        now = time.monotonic()
+
+        monitor.request_reload()
+        next_run = monitor._sleep_until(now + 30)
+
+        assert monitor.config.check_interval == 10
+        assert next_run <= now
+
+    def test_file_change_detected(self, reloadable, feeds_file):
+        """Test that touching a watched file is picked up"""
+        monitor = reloadable
+        assert monitor._config_files_changed() is False
+
+        stat = feeds_file.stat()
+        os.utime(feeds_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert monitor._config_files_changed() is True
@@ -0,0 +1,85 @@
+"""
+Test suite for notification handlers
+"""
+
+import pytest
+import requests
+from unittest.mock import patch, MagicMock
+from llm_monitor.notifiers import (
+    RESOLVED, UPDATED, DiscordNotifier, SlackNotifier, create_notifier
+)
+
+
+class TestNotifiers:
+    """Tests for Discord and Slack notifiers"""
+
+    def test_discord_payload(self):
+        """Test Discord embed payload structure"""
+        notifier = DiscordNotifier("https://discord.com/webhook")
+        payload = notifier.build_payload(
+            "Anthropic (Claude)", "Elevated errors", "x" * 2000,
+            "https://status.claude.com/incidents/1", 0xD97757
+        )
+
+        embed = payload["embeds"][0]
+        assert embed["title"] == "🚨 Anthropic (Claude) Status Update"
+        assert embed["description"] == "Elevated errors"
+        assert embed["color"] == 0xD97757
+        assert len(embed["fields"][0]["value"]) == 1024
+
+    @pytest.mark.parametrize("kind,heading", [
+        (UPDATED, "🔄 OpenAI Incident Updated"),
+        (RESOLVED, "✅ OpenAI Incident Resolved"),
+    ])
+    def test_kind_heading(self, kind, heading):
+        """Test revisions and resolutions of a reported incident get their own heading"""
+        discord = DiscordNotifier("https://discord.com/webhook").build_payload(
+            "OpenAI", "Identified", "", "https://status.openai.com/incidents/1", 0, kind=kind
+        )
+        slack = SlackNotifier("https://hooks.slack.com/webhook").build_payload(
+            "OpenAI", "Identified", "", "https://status.openai.com/incidents/1", 0, kind=kind
+        )
+
+        assert discord["embeds"][0]["title"] == heading
+        assert slack["blocks"][0]["text"]["text"] == heading
+
+    def test_slack_payload(self):
+        """Test Slack Block Kit payload structure"""
+        notifier = SlackNotifier("https://hooks.slack.com/webhook")
+        payload = notifier.build_payload(
+            "OpenAI (ChatGPT)", "High error rates", "",
+            "https://status.openai.com/incidents/1", 0x10A37F
+        )
+
+        assert payload["attachments"][0]["color"] == '#10A37F'
+        assert "No additional details" in payload["blocks"][1]["text"]["text"]
+        assert "https://status.openai.com/incidents/1" in payload["blocks"][2]["text"]["text"]
+
+    def test_send_posts_payload(self):
+        """Test that send posts the built payload and reports success"""
+        notifier = DiscordNotifier("https://discord.com/webhook")
+        with patch('requests.Session.post') as post:
+            post.return_value = MagicMock()
+            assert notifier.send("Svc", "Title", "Desc", "https://x", 0) is True
+
+        assert post.call_args.args[0] == "https://discord.com/webhook"
+        assert "embeds" in post.call_args.kwargs["json"]
+
+    def test_send_failure(self):
+        """Test that request errors are reported as failure"""
+        notifier = SlackNotifier("https://hooks.slack.com/webhook")
+        with patch('requests.Session.post') as post:
+            post.side_effect = requests.exceptions.ConnectionError("refused")
+            assert notifier.send("Svc", "Title", "Desc", "https://x", 0) is False
+
+    @pytest.mark.parametrize("notification_type,expected", [
+        ('discord', DiscordNotifier),
+        ('slack', SlackNotifier),
+    ])
+    def test_create_notifier(self, notification_type, expected):
+        """Test notifier factory"""
+        assert isinstance(create_notifier(notification_type, "https://x"), expected)
+
+    def test_create_notifier_unknown(self):
+        """Test notifier factory with unknown type"""
+        assert create_notifier('email', "https://x") is None
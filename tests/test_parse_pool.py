@@ -0,0 +1,65 @@
+"""
+Test suite for process-pool parsing
+"""
+
+import pickle
+
+import pytest
+from llm_monitor.feed_parser import FeedEntry, parse_entries
+from llm_monitor.parse_pool import ParsePool
+from tests.test_monitor import make_rss
+from benchmarks.synthetic import generate_feed
+
+
+@pytest.fixture(scope="module")
+def pool():
+    pool = ParsePool(2)
+    yield pool
+    pool.shutdown()
+
+
+class TestParseEntries:
+    """Tests for the worker-side parse function"""
+
+    def test_returns_plain_tuples(self):
+        """Test entries come back as small picklable tuples, newest first"""
+        fields = parse_entries(generate_feed(20), limit=3)
+
+        assert len(fields) == 3
+        assert all(type(f) is tuple and len(f) == 5 for f in fields)
+        assert len(pickle.dumps(fields)) < len(generate_feed(20))
+
+    def test_invalid_document(self):
+        """Test an unparseable document yields None"""
+        assert parse_entries(b"not a feed") is None
+
+    @pytest.mark.parametrize("fields,expected", [
+        (None, (False, None)),
+        ([], (True, None)),
+    ])
+    def test_to_result_edge_cases(self, fields, expected):
+        """Test failures and empty feeds map to (ok, None)"""
+        assert ParsePool.to_result(fields) == expected
+
+
+class TestParsePool:
+    """Tests for parsing in worker processes"""
+
+    def test_parse_latest_entry(self, pool):
+        """Test a worker returns the same entry as in-process parsing"""
+        ok, entry = pool.parse(make_rss(guid="abc123"), "https://status.example.com")
+
+        assert ok is True
+        assert isinstance(entry, FeedEntry)
+        assert entry.entry_id == "https://status.example.com/incidents/abc123"
+        assert entry.description == "We are investigating this issue."
+
+    def test_parse_failure(self, pool):
+        """Test a bad document is reported as a failed parse"""
+        assert pool.parse(b"<html>oops</html>") == (False, None)
+
+    def test_many_documents(self, pool):
+        """Test documents submitted together are all parsed"""
+        futures = [pool.submit(make_rss(guid=f"inc{i}")) for i in range(8)]
+        ids = [ParsePool.to_result(f.result())[1].entry_id for f in futures]
+        assert ids == [f"https://status.example.com/incidents/inc{i}" for i in range(8)]
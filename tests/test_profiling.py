@@ -0,0 +1,54 @@
+"""
+Test suite for per-cycle profiling
+"""
+
+import logging
+import pstats
+from llm_monitor.profiling import CycleProfiler
+
+
+def busy_cycle():
+    return sum(i * i for i in range(10000))
+
+
+class TestCycleProfiler:
+    """Tests for the CycleProfiler class"""
+
+    def test_profiles_every_nth_cycle(self, tmp_path):
+        """Test that only every Nth cycle is profiled"""
+        profiler = CycleProfiler(tmp_path, every=3)
+
+        results = [profiler.run(busy_cycle) for _ in range(6)]
+
+        assert results == [busy_cycle()] * 6
+        assert len(list(tmp_path.glob("cycle-*.pstats"))) == 2
+
+    def test_dump_is_loadable_and_logged(self, tmp_path, caplog):
+        """Test that dumps are valid pstats files with a logged summary"""
+        profiler = CycleProfiler(tmp_path, top=5)
+
+        with caplog.at_level(logging.INFO, logger='llm_monitor.profiling'):
+            profiler.run(busy_cycle)
+
+        dump = next(tmp_path.glob("cycle-*.pstats"))
+        assert pstats.Stats(str(dump)).total_calls > 0
+        assert "busy_cycle" in caplog.text
+
+    def test_threshold_skips_fast_cycles(self, tmp_path):
+        """Test that cycles faster than the threshold are not dumped"""
+        profiler = CycleProfiler(tmp_path, threshold_ms=60_000)
+
+        profiler.run(busy_cycle)
+
+        assert list(tmp_path.glob("*.pstats")) == []
+
+    def test_rotation_keeps_newest(self, tmp_path):
+        """Test that old profiles are rotated out"""
+        profiler = CycleProfiler(tmp_path, keep=2)
+
+        for _ in range(4):
+            profiler.run(busy_cycle)
+
+        dumps = sorted(p.name for p in tmp_path.glob("cycle-*.pstats"))
+        assert len(dumps) == 2
+        assert dumps[-1].endswith("-000004.pstats")
@@ -0,0 +1,223 @@
+"""
+Test suite for the webhook push receiver
+"""
+
+import http.client
+import json
+import random
+import socket
+import threading
+import time
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+from benchmarks.standin import StandinOptions, StandinServer
+from benchmarks.synthetic import incident_description, incident_payload, render_feed, render_item
+from llm_monitor.config import Config, FeedConfig
+from llm_monitor.feed_parser import FeedParser
+from llm_monitor.httpd import MAX_BODY, Request
+from llm_monitor.monitor import StatusMonitor
+from llm_monitor.push import PushReceiver, entry_from_payload
+
+PAGE = "https://status.example.com"
+FEED = FeedConfig(name="Example", url=f"{PAGE}/history.rss", color=0)
+CREATED = datetime(2025, 10, 25, 14, 3, tzinfo=timezone.utc)
+
+
+def payload(stages=2, guid="abc123", title="Elevated errors on API"):
+    return incident_payload(random.Random(guid), guid, title, CREATED, stages)
+
+
+def post(body, path="/push/example", token="secret", headers=None):
+    if not isinstance(body, bytes):
+        body = json.dumps(body).encode()
+    return Request(path, {'token': token} if token else {}, headers or {}, body)
+
+
+@pytest.fixture
+def monitor(tmp_path):
+    config = Config(
+        notification_type='discord',
+        discord_webhook=None,
+        slack_webhook=None,
+        check_interval=60,
+        state_file=tmp_path / "state.json",
+        push_token='secret'
+    )
+    monitor = StatusMonitor(config, feeds={'example': FEED})
+    yield monitor
+    monitor.close()
+
+
+class TestEntryFromPayload:
+    """Tests for turning incident pushes into feed entries"""
+
+    def test_matches_feed_entry(self):
+        """Test a push builds the entry the feed shows, so a later poll is not a revision"""
+        document = render_feed(PAGE, [render_item(
+            PAGE, "abc123", "Elevated errors on API",
+            incident_description(random.Random("abc123"), CREATED, 2), CREATED
+        )])
+        parser = FeedParser()
+        polled = parser.extract_latest_entry(parser.parse_content(document, FEED.url))
+
+        pushed = entry_from_payload(payload(), FEED)
+
+        assert pushed.entry_id == polled.entry_id
+        assert pushed.link == polled.link
+        assert pushed.published_at == polled.published_at
+        assert pushed.fingerprint() == polled.fingerprint()
+
+    def test_newest_update_first(self):
+        """Test the description lists updates newest first with their stage"""
+        entry = entry_from_payload(payload(stages=4), FEED)
+
+        assert entry.description.startswith("Oct 25")
+        assert "UTCResolved - This incident has been resolved." in entry.description
+        assert entry.description.index("Resolved") < entry.description.index("Investigating")
+
+    def test_component_update_ignored(self):
+        """Test component status pushes produce no entry"""
+        assert entry_from_payload({"component_update": {}, "component": {}}, FEED) is None
+
+
+class TestPushReceiver:
+    """Tests for validating pushes"""
+
+    @pytest.mark.parametrize("request_,status", [
+        (post(payload(), token="wrong"), 403),
+        (post(payload(), token=None), 403),
+        (post(payload(), path="/push/unknown"), 404),
+        (post(b"{not json"), 400),
+        (post({"incident": {"name": "No id"}}), 400),
+        (post({"meta": {}}), 400),
+    ])
+    def test_rejected(self, monitor, request_, status):
+        """Test bad tokens, unknown services and malformed payloads are rejected"""
+        code, _, _ = PushReceiver(monitor, 'secret').handle(request_)
+
+        assert code == status
+        assert not monitor._pushes
+        assert monitor.metrics.pushes.labels('rejected').value == 1
+
+    def test_accepted(self, monitor):
+        """Test a valid push (token in a header) is queued and answered 202"""
+        code, _, _ = PushReceiver(monitor, 'secret').handle(
+            post(payload(), token=None, headers={'x-push-token': 'secret'})
+        )
+
+        assert code == 202
+        assert [p[0] for p in monitor._pushes] == ['example']
+        assert monitor.metrics.pushes.labels('accepted').value == 1
+
+    def test_component_update_acknowledged(self, monitor):
+        """Test non-incident pushes are answered 202 and dropped"""
+        code, _, _ = PushReceiver(monitor, 'secret').handle(post({"component_update": {}}))
+
+        assert code == 202
+        assert not monitor._pushes
+        assert monitor.metrics.pushes.labels('ignored').value == 1
+
+
+class TestMonitorPush:
+    """Tests for processing pushes in StatusMonitor"""
+
+    def test_push_notifies_once(self, monitor):
+        """Test a pushed incident notifies, and the same push again does not"""
+        monitor.notifier = MagicMock()
+        monitor.notifier.send.return_value = True
+
+        for _ in range(2):
+            monitor.receive_push('example', entry_from_payload(payload(), FEED))
+            monitor._process_pushes()
+
+        monitor.notifier.send.assert_called_once()
+        assert monitor.notifier.send.call_args.kwargs['title'] == "Elevated errors on API"
+        assert monitor.state_manager.get_last_entry('example')[0] == f"{PAGE}/incidents/abc123"
+
+    def test_push_fed_feeds_poll_to_reconcile(self, monitor):
+        """Test feeds that got a push are only polled every RECONCILE_INTERVAL"""
+        monitor.feeds['other'] = FEED
+        monitor.receive_push('example', entry_from_payload(payload(), FEED))
+
+        assert monitor._cycle_order() == ['other']
+        assert monitor.metrics.service('example').push_fed.value == 1
+
+        monitor.config.reconcile_interval = 0
+        assert monitor._cycle_order() == ['example', 'other']
+
+
+class TestPushEndToEnd:
+    """Tests pushing from the stand-in server through the embedded HTTP server"""
+
+    @pytest.fixture
+    def standin(self):
+        server = StandinServer(StandinOptions(feeds=2, entries=3, churn=1.0, tick=0))
+        server.start()
+        yield server
+        server.stop()
+
+    def test_push_delivered_within_a_second(self, standin, tmp_path):
+        """Test a push is alerted on between polls, and the reconcile poll does not repeat it"""
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            port = sock.getsockname()[1]
+        config = Config(
+            notification_type='discord',
+            discord_webhook=standin.webhook_url,
+            slack_webhook=None,
+            check_interval=60,
+            state_file=tmp_path / "state.json",
+            http_host='127.0.0.1',
+            http_port=port,
+            push_token='secret'
+        )
+        monitor = StatusMonitor(config, feeds=standin.feed_configs())
+        monitor.start_http_server()
+        try:
+            monitor.run_check_cycle()
+            standin.churn_once()
+
+            sleeper = threading.Thread(
+                target=monitor._sleep_until, args=(time.monotonic() + 30,)
+            )
+            sleeper.start()
+            url = f"http://127.0.0.1:{port}/push/feed0?token=secret"
+            sent = time.monotonic()
+            assert standin.send_push(0, url) == 202
+            while not standin.stats()['deliveries'] and time.monotonic() - sent < 5:
+                time.sleep(0.01)
+            delivered = time.monotonic() - sent
+            monitor.request_stop()
+            sleeper.join()
+
+            assert standin.stats()['deliveries'] == 1
+            assert delivered < 1.0
+
+            # Only the feed without pushes is polled, then both once reconciling is due
+            monitor._stop.clear()
+            monitor.run_check_cycle()
+            assert standin.stats()['deliveries'] == 2
+            monitor.config.reconcile_interval = 0
+            monitor.run_check_cycle()
+            assert standin.stats()['deliveries'] == 2
+
+            # Oversized bodies are refused from the headers, before being read
+            connection = http.client.HTTPConnection('127.0.0.1', port, timeout=5)
+            connection.putrequest('POST', '/push/feed0?token=secret')
+            connection.putheader('Content-Length', str(MAX_BODY + 1))
+            connection.endheaders()
+            assert connection.getresponse().status == 413
+            connection.close()
+
+            # So are negative lengths, which would otherwise block on reading to EOF
+            connection = http.client.HTTPConnection('127.0.0.1', port, timeout=5)
+            connection.putrequest('POST', '/push/feed0?token=secret')
+            connection.putheader('Content-Length', '-1')
+            connection.endheaders()
+            assert connection.getresponse().status == 400
+            connection.close()
+        finally:
+            monitor.stop_http_server()
+            monitor.close()
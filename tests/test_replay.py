@@ -0,0 +1,213 @@
+"""
+Test suite for feed recording and replay
+"""
+
+import gzip
+import json
+from dataclasses import replace
+
+import pytest
+from llm_monitor.config import Config, FeedConfig
+from llm_monitor.feed_parser import FetchResult
+from llm_monitor.monitor import StatusMonitor
+from llm_monitor.notifiers import NEW
+from llm_monitor.replay import Archive, FeedRecorder, ReplayDriver, VirtualClock
+from benchmarks.soak import _SoakFetcher
+from benchmarks.synthetic import generate_feed
+from tests.test_monitor import make_rss
+
+START = 1_700_000_000.0
+INTERVAL = 300
+
+
+@pytest.fixture
+def config(tmp_path):
+    return Config(
+        notification_type='discord',
+        discord_webhook=None,
+        slack_webhook=None,
+        check_interval=INTERVAL,
+        state_file=tmp_path / "state.json",
+        record_file=tmp_path / "archive.jsonl.gz"
+    )
+
+
+class _ListNotifier:
+    def __init__(self):
+        self.sent = []
+
+    def send(self, service_name, title, kind, **kwargs):
+        self.sent.append((service_name, kind, title))
+        return True
+
+
+def record_live_run(config, cycles, feeds=4):
+    """Run the monitor against rotating synthetic feeds while recording"""
+    fetcher = _SoakFetcher(feeds, entries=5, period=3, variants=4)
+    clock = VirtualClock(START)
+    monitor = StatusMonitor(replace(config, record_file=None), feeds={
+        f"feed{i}": FeedConfig(name=f"Feed {i}", url=url, color=0)
+        for url, i in fetcher.urls.items()
+    })
+    monitor.recorder = FeedRecorder(config.record_file, clock=clock)
+    monitor.parser.fetch_feed = fetcher
+    monitor.notifier = _ListNotifier()
+    try:
+        for cycle in range(cycles):
+            fetcher.cycle = cycle
+            monitor.run_check_cycle()
+            clock.advance(INTERVAL)
+    finally:
+        monitor.close()
+    return monitor.notifier.sent
+
+
+class TestFeedRecorder:
+    """Tests for the archive format"""
+
+    def test_documents_stored_once(self, tmp_path):
+        """Test repeated documents are referenced by hash and 304s carry no body"""
+        path = tmp_path / "archive.jsonl.gz"
+        feed = FeedConfig(name="OpenAI", url="https://x/feed", color=0x10A37F)
+        recorder = FeedRecorder(path, clock=lambda: START)
+        recorder.record('openai', feed, FetchResult(200, b'<rss>one</rss>', etag='a'))
+        recorder.record('openai', feed, FetchResult(304, b'', etag='a'))
+        recorder.record('openai', feed, FetchResult(200, b'<rss>one</rss>', etag='b'))
+        recorder.record('openai', feed, None)
+        recorder.close()
+
+        with gzip.open(path, 'rt') as f:
+            records = [json.loads(line) for line in f]
+        assert sum('data' in r for r in records) == 1
+        assert sum('feed' in r for r in records) == 1
+        assert [r['status'] for r in records if 'service' in r] == [200, 304, 200, None]
+
+        archive = Archive.load(path)
+        assert archive.feeds['openai'] == feed
+        # The 304 keeps serving the same document; the failure has none
+        timeline = archive.events['openai']
+        assert [event.ok for event in timeline] == [True, True, True, False]
+        assert timeline[1].body == timeline[0].body
+        assert archive.bodies[timeline[0].body] == b'<rss>one</rss>'
+
+    def test_sessions_append(self, tmp_path):
+        """Test a second recording session appends to the same archive"""
+        path = tmp_path / "archive.jsonl.gz"
+        feed = FeedConfig(name="OpenAI", url="https://x/feed", color=0)
+        for t in (START, START + 60):
+            recorder = FeedRecorder(path, clock=lambda t=t: t)
+            recorder.record('openai', feed, FetchResult(200, b'<rss/>'))
+            recorder.close()
+
+        archive = Archive.load(path)
+        assert [event.t for event in archive.events['openai']] == [START, START + 60]
+
+    def test_truncated_archive(self, tmp_path):
+        """Test an archive cut off mid-write still loads its complete records"""
+        path = tmp_path / "archive.jsonl.gz"
+        feed = FeedConfig(name="OpenAI", url="https://x/feed", color=0)
+        recorder = FeedRecorder(path, clock=lambda: START)
+        recorder.record('openai', feed, FetchResult(200, b'<rss/>'))
+        recorder.flush()
+        # What is on disk if the process dies before the member is finished
+        partial = path.read_bytes()
+        recorder.record('openai', feed, FetchResult(304, b''))
+        recorder.close()
+        path.write_bytes(partial)
+
+        archive = Archive.load(path)
+        assert len(archive.events['openai']) == 1
+
+
+class TestReplay:
+    """Tests for replaying an archive through the monitor"""
+
+    def test_records_from_monitor(self, config):
+        """Test the monitor records every fetch when RECORD_FILE is set"""
+        fetcher = _SoakFetcher(2, entries=5, period=3, variants=4)
+        monitor = StatusMonitor(config, feeds={
+            f"feed{i}": FeedConfig(name=f"Feed {i}", url=url, color=0)
+            for url, i in fetcher.urls.items()
+        })
+        monitor.parser.fetch_feed = fetcher
+        for cycle in range(5):
+            fetcher.cycle = cycle
+            monitor.run_check_cycle()
+        monitor.close()
+
+        archive = Archive.load(config.record_file)
+        assert sorted(archive.feeds) == ['feed0', 'feed1']
+        assert all(len(timeline) == 5 for timeline in archive.events.values())
+
+    def test_replay_matches_live_run(self, config, tmp_path):
+        """Test replaying a recording produces the same notifications as the live run"""
+        live = record_live_run(config, cycles=30)
+        replay_config = replace(config, state_file=tmp_path / "other.json")
+
+        report = ReplayDriver(
+            Archive.load(config.record_file), replay_config, speed=0
+        ).run()
+
+        assert report.cycles == 30
+        assert report.failed == 0
+        assert [(n.service_name, n.kind, n.title) for n in report.notifications] == live
+        assert report.end - report.start == 29 * INTERVAL
+        # Replay never touches the real state file
+        assert not (tmp_path / "other.json").exists()
+
+    def test_failed_fetches_replayed(self, config):
+        """Test recorded fetch failures fail the replayed fetch too"""
+        feed = FeedConfig(name="OpenAI", url="https://x/feed", color=0)
+        clock = VirtualClock(START)
+        recorder = FeedRecorder(config.record_file, clock=clock)
+        for result in (FetchResult(200, generate_feed(3)), None, FetchResult(304, b'')):
+            recorder.record('openai', feed, result)
+            clock.advance(INTERVAL)
+        recorder.close()
+
+        report = ReplayDriver(Archive.load(config.record_file), config, speed=0).run()
+
+        assert report.cycles == 3
+        assert report.failed == 1
+
+    def test_paced_at_speed(self, config):
+        """Test cycles are spaced interval / speed apart in wall time"""
+        record_live_run(config, cycles=3)
+        sleeps = []
+
+        ReplayDriver(
+            Archive.load(config.record_file), config, speed=1000, sleep=sleeps.append
+        ).run()
+
+        assert len(sleeps) == 3
+        assert all(0 < pause <= INTERVAL / 1000 for pause in sleeps)
+
+    def test_duplicate_window_in_virtual_time(self, config):
+        """Test DEDUP_WINDOW expires in replayed time, not in the replay's wall time"""
+        clock = VirtualClock(START)
+        recorder = FeedRecorder(config.record_file, clock=clock)
+        feeds = {
+            service_id: FeedConfig(name=service_id.capitalize(), url=f"https://{service_id}/feed", color=0)
+            for service_id in ('claude', 'chatgpt')
+        }
+        resolved = make_rss(guid="old", title="Scheduled maintenance",
+                            description="This incident has been resolved.")
+        outage = "Elevated errors due to upstream cloud provider outage"
+        timeline = [
+            (0, 'claude', resolved), (0, 'chatgpt', resolved),
+            (3600, 'claude', make_rss(guid="a", title=outage)),
+            (5 * 86400, 'chatgpt', make_rss(guid="b", title=outage)),
+        ]
+        for offset, service_id, document in timeline:
+            clock.now = START + offset
+            recorder.record(service_id, feeds[service_id], FetchResult(200, document))
+        recorder.close()
+        archive = Archive.load(config.record_file)
+
+        for window, expected in ((0, ['Claude', 'Chatgpt']), (900, ['Claude', 'Chatgpt']),
+                                 (10 * 86400, ['Claude'])):
+            report = ReplayDriver(
+                archive, replace(config, dedup_window=window), interval=3600, speed=0
+            ).run()
+
+            assert [n.service_name for n in report.notifications if n.kind == NEW] == expected
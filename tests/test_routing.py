@@ -0,0 +1,170 @@
+"""
+Test suite for notification routing
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+from llm_monitor.config import Config, FeedConfig
+from llm_monitor.feed_parser import FetchResult
+from llm_monitor.monitor import StatusMonitor
+from llm_monitor.notifiers import DiscordNotifier, SlackNotifier
+from llm_monitor.routing import RoutingTable
+from tests.test_monitor import FEED_URL, make_rss
+
+ROUTES = {
+    "destinations": {
+        "general": {"type": "discord", "url": "https://discord.com/general"},
+        "oncall": {"type": "slack", "url": "https://hooks.slack.com/oncall"},
+        "openai-team": {"type": "discord", "url": "https://discord.com/openai"},
+        "billing": {"type": "discord", "url": "https://discord.com/billing"},
+    },
+    "routes": [
+        {"service": ["chatgpt", "sora"], "to": "openai-team"},
+        {"severity": "critical", "to": ["oncall"]},
+        {"service": "claude", "severity": "major", "to": ["oncall"]},
+        {"keyword": ["billing", "payments"], "to": ["billing"]},
+        {"service": "claude", "keyword": "api", "to": ["general"]},
+    ],
+    "default": ["general"]
+}
+
+
+def names(table, notifiers):
+    urls = {notifier.webhook_url: name for name, notifier in table.destinations.items()}
+    return [urls[notifier.webhook_url] for notifier in notifiers]
+
+
+@pytest.fixture
+def table():
+    return RoutingTable.from_dict(ROUTES)
+
+
+class TestRoutingTable:
+    """Tests for compiling and looking up routes"""
+
+    def test_destinations(self, table):
+        """Test each destination gets one notifier of its type"""
+        assert isinstance(table.destinations['oncall'], SlackNotifier)
+        assert isinstance(table.destinations['general'], DiscordNotifier)
+
+    def test_service_and_severity(self, table):
+        """Test service, severity and combined rules all apply"""
+        assert names(table, table.route('chatgpt', 'minor')) == ['openai-team']
+        assert names(table, table.route('sora', 'critical')) == ['oncall', 'openai-team']
+        assert names(table, table.route('claude', 'major')) == ['oncall']
+        assert names(table, table.route('gemini', 'critical')) == ['oncall']
+
+    def test_keywords(self, table):
+        """Test keyword rules match whole words, optionally per service"""
+        assert names(table, table.route('gemini', 'minor', "Payments failing")) == ['billing']
+        assert names(table, table.route('claude', 'minor', "Elevated API errors")) == ['general']
+        # The api rule is limited to claude; "rapid" is not the word "api"
+        assert table.route('gemini', 'minor', "Elevated API errors") == table.default
+        assert names(table, table.route('claude', 'major', "rapid recovery")) == ['oncall']
+
+    def test_overlapping_keywords(self):
+        """Test a keyword inside or overlapping a longer one matches as well"""
+        table = RoutingTable.from_dict({
+            "destinations": {name: {"url": f"https://discord.com/{name}"} for name in "abc"},
+            "routes": [
+                {"keyword": "api", "to": "a"},
+                {"keyword": "api gateway", "to": "b"},
+                {"keyword": "gateway errors", "to": "c"},
+            ]
+        })
+
+        assert names(table, table.route('x', 'minor', "API gateway errors")) == ['a', 'b', 'c']
+        assert names(table, table.route('x', 'minor', "API gateways down")) == ['a']
+        assert names(table, table.route('x', 'minor', "Gateway errors")) == ['c']
+
+    def test_default(self, table):
+        """Test unmatched incidents go to the default destinations"""
+        assert names(table, table.route('gemini', 'minor', "Slow responses")) == ['general']
+        assert RoutingTable.from_dict({
+            "destinations": ROUTES["destinations"], "routes": ROUTES["routes"]
+        }).route('gemini', 'minor') == ()
+
+    @pytest.mark.parametrize("data,message", [
+        ({"routes": []}, "destinations"),
+        ({"destinations": {"x": {"type": "teams", "url": "https://x"}}}, "type"),
+        ({"destinations": {"x": {"type": "slack"}}}, "url"),
+        ({"destinations": {"x": {"url": "https://x"}}, "routes": [{"to": "x"}]}, "must match"),
+        ({"destinations": {"x": {"url": "https://x"}}, "routes": [{"severity": "sev1", "to": "x"}]},
+         "severity"),
+        ({"destinations": {"x": {"url": "https://x"}}, "default": ["y"]}, "unknown"),
+        ({"destinations": {"x": {"url": "https://x"}}, "routes": [{"keyword": [1], "to": "x"}]},
+         "Route 1: 'keyword'"),
+        ({"destinations": {"x": {"url": "https://x"}}, "routes": [{"keyword": "", "to": "x"}]},
+         "Route 1: 'keyword'"),
+        ({"destinations": {"x": {"url": "https://x"}},
+          "routes": [{"service": "claude", "to": "x"}, {"service": {"id": "claude"}, "to": "x"}]},
+         "Route 2: 'service'"),
+        ({"destinations": {"x": {"url": "https://x"}}, "routes": [{"service": [["claude"]], "to": "x"}]},
+         "Route 1: 'service'"),
+        ({"destinations": {"x": {"url": "https://x"}}, "routes": 3}, "routes"),
+    ])
+    def test_invalid(self, data, message):
+        """Test malformed documents raise ValueError naming the problem"""
+        with pytest.raises(ValueError, match=message):
+            RoutingTable.from_dict(data)
+
+    def test_many_rules(self):
+        """Test routing stays a lookup with thousands of service rules"""
+        data = {
+            "destinations": {f"channel{i}": {"url": f"https://discord.com/{i}"} for i in range(50)},
+            "routes": [{"service": f"feed{i}", "to": f"channel{i % 50}"} for i in range(5000)]
+        }
+        table = RoutingTable.from_dict(data)
+
+        assert names(table, table.route('feed4321', 'minor')) == ['channel21']
+
+
+class TestMonitorRouting:
+    """Tests for routed notifications from StatusMonitor"""
+
+    @pytest.fixture
+    def monitor(self, tmp_path):
+        config = Config(
+            notification_type='discord',
+            discord_webhook='https://discord.com/webhook',
+            slack_webhook=None,
+            check_interval=60,
+            state_file=tmp_path / "state.json"
+        )
+        monitor = StatusMonitor(config)
+        monitor.notifier = MagicMock()
+        monitor.routes = RoutingTable.from_dict({
+            "destinations": ROUTES["destinations"],
+            "routes": ROUTES["routes"]
+        })
+        for notifier in monitor.routes.destinations.values():
+            notifier.send = MagicMock(return_value=True)
+        monitor.parser.fetch_feed = MagicMock()
+        yield monitor
+        monitor.close()
+
+    def test_routed(self, monitor):
+        """Test a routed incident goes to each matching destination and not the webhook"""
+        monitor.parser.fetch_feed.return_value = FetchResult(
+            200, make_rss(title="Major outage of the API")
+        )
+
+        monitor.check_feed('sora', FeedConfig(name="Sora", url=FEED_URL, color=0))
+
+        destinations = monitor.routes.destinations
+        destinations['oncall'].send.assert_called_once()
+        destinations['openai-team'].send.assert_called_once()
+        destinations['general'].send.assert_not_called()
+        monitor.notifier.send.assert_not_called()
+        assert monitor.metrics.service('sora').notifications_sent.value == 2
+
+    def test_unrouted_uses_webhook(self, monitor):
+        """Test incidents no rule matches fall back to the configured webhook"""
+        monitor.parser.fetch_feed.return_value = FetchResult(
+            200, make_rss(title="Slow responses")
+        )
+
+        monitor.check_feed('gemini', FeedConfig(name="Gemini", url=FEED_URL, color=0))
+
+        monitor.notifier.send.assert_called_once()
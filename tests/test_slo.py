@@ -0,0 +1,129 @@
+"""
+Test suite for alert detection latency tracking
+"""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from llm_monitor.config import Config, FeedConfig
+from llm_monitor.feed_parser import FetchResult
+from llm_monitor.monitor import StatusMonitor
+from llm_monitor.slo import AlertLatency, load, render, summarize
+from tests.test_monitor import FEED_URL, make_rss
+
+PUBLISHED = 1761400980  # pubDate of make_rss()
+
+
+@pytest.fixture
+def monitor(tmp_path):
+    config = Config(
+        notification_type='discord',
+        discord_webhook='https://discord.com/webhook',
+        slack_webhook=None,
+        check_interval=60,
+        state_file=tmp_path / "state.json",
+        slo_file=tmp_path / "slo.jsonl"
+    )
+    monitor = StatusMonitor(config)
+    monitor.notifier = MagicMock(NAME="Discord")
+    monitor.notifier.send.return_value = True
+    monitor.parser.fetch_feed = MagicMock()
+    yield monitor
+    monitor.close()
+
+
+def alert(service, total, t=1000.0):
+    return AlertLatency(t, service, "inc", "Discord", total - 1.5, 1.0, 0.5)
+
+
+class TestDetectionLatency:
+    """Tests for recording publish-to-ack latency in the monitor"""
+
+    def test_new_alert_recorded(self, monitor, tmp_path):
+        """Test a delivered new incident is observed in every stage and logged"""
+        feed_config = FeedConfig(name="Example", url=FEED_URL, color=0)
+        monitor.parser.fetch_feed.return_value = FetchResult(200, make_rss())
+
+        monitor.check_feed('example', feed_config)
+        monitor._finish_cycle(0.0)
+
+        metrics = monitor.metrics.service('example')
+        for histogram in ('publish_to_fetch', 'fetch_to_classify', 'classify_to_ack', 'detection'):
+            assert getattr(metrics, histogram).count == 1
+        (logged,) = load(tmp_path / "slo.jsonl")
+        assert logged.service == 'example'
+        assert logged.destination == "Discord"
+        assert logged.t - PUBLISHED - 5 <= logged.publish_to_fetch <= logged.t - PUBLISHED
+        assert logged.fetch_to_classify >= 0 and logged.classify_to_ack >= 0
+
+    def test_updates_and_failures_not_recorded(self, monitor):
+        """Test revisions and failed deliveries are not detection samples"""
+        feed_config = FeedConfig(name="Example", url=FEED_URL, color=0)
+        monitor.notifier.send.return_value = False
+        monitor.parser.fetch_feed.return_value = FetchResult(200, make_rss())
+        monitor.check_feed('example', feed_config)
+
+        monitor.notifier.send.return_value = True
+        monitor.parser.fetch_feed.return_value = FetchResult(
+            200, make_rss(description="The issue has been identified. We are investigating.")
+        )
+        monitor.check_feed('example', feed_config)
+
+        assert monitor.notifier.send.call_count == 2
+        assert monitor.metrics.service('example').detection.count == 0
+
+    def test_exposed_as_metrics(self, monitor):
+        """Test the detection histograms are in the Prometheus output"""
+        monitor.parser.fetch_feed.return_value = FetchResult(200, make_rss())
+        monitor.check_feed('example', FeedConfig(name="Example", url=FEED_URL, color=0))
+
+        text = monitor.metrics.registry.render()
+        assert 'llm_monitor_alert_detection_seconds_count{service="example"} 1' in text
+        assert 'llm_monitor_alert_publish_to_fetch_seconds_bucket{service="example",le="21600"}' in text
+
+
+class TestSummary:
+    """Tests for the slo summary"""
+
+    def test_summarize(self):
+        """Test percentiles and target attainment per service and overall"""
+        alerts = [alert('openai', total) for total in (60, 120, 240, 600)] + [alert('claude', 30)]
+
+        claude, openai, overall = summarize(alerts, target=300)
+
+        assert openai['alerts'] == 4
+        assert openai['total_p50'] == 180.0
+        assert openai['total_max'] == 600.0
+        assert openai['within_target'] == 75.0
+        assert claude['within_target'] == 100.0
+        assert overall['service'] == 'all'
+        assert overall['within_target'] == 80.0
+
+    def test_without_publish_date(self):
+        """Test alerts without a publish date only count toward the measurable stages"""
+        alerts = [AlertLatency(1.0, 'openai', 'inc', 'Slack', None, 2.0, 1.0)]
+
+        (row, _) = summarize(alerts)
+
+        assert row['total_p50'] is None
+        assert row['within_target'] is None
+        assert row['classify_to_ack_p99'] == 1.0
+
+    def test_load_filters(self, tmp_path):
+        """Test loading skips malformed lines and alerts outside the period"""
+        path = tmp_path / "slo.jsonl"
+        lines = [json.dumps(alert('openai', 60, t)._asdict()) for t in (100.0, 200.0, 300.0)]
+        path.write_text('\n'.join(lines[:2] + ['{"t": 1', lines[2]]) + '\n')
+
+        assert [a.t for a in load(path)] == [100.0, 200.0, 300.0]
+        assert [a.t for a in load(path, since=150.0, until=300.0)] == [200.0]
+
+    def test_render(self):
+        """Test table, JSON and JSON-lines output"""
+        rows = summarize([alert('openai', 60)])
+
+        assert json.loads(render(rows, 'json')) == rows
+        assert [json.loads(line) for line in render(rows, 'jsonl').splitlines()] == rows
+        table = render(rows, 'table').splitlines()
+        assert table[0].startswith('service') and len(table) == 3
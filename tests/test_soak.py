@@ -0,0 +1,23 @@
+"""
+Memory soak test for long-running monitors
+"""
+
+import logging
+
+import pytest
+from benchmarks.soak import run_soak
+
+
+@pytest.mark.slow
+class TestSoak:
+    """Short version of benchmarks/soak.py"""
+
+    def test_rss_stays_flat(self, caplog):
+        """Test RSS does not grow once the monitor has warmed up"""
+        # Captured log records would otherwise pile up for the whole run
+        caplog.set_level(logging.ERROR, logger='llm_monitor')
+        report = run_soak(feeds=50, cycles=400, period=5, warmup=50)
+
+        summary = report['summary']
+        assert report['notifications'] > 0
+        assert summary['growth_bytes'] < 4 * 2 ** 20
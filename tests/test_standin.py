@@ -0,0 +1,57 @@
+"""
+End-to-end tests against the local stand-in status page server
+"""
+
+import pytest
+from llm_monitor.config import Config
+from llm_monitor.monitor import StatusMonitor
+from benchmarks.standin import StandinServer, StandinOptions
+
+
+@pytest.fixture
+def standin():
+    server = StandinServer(StandinOptions(feeds=5, entries=5, churn=1.0, tick=0))
+    server.start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def monitor(standin, tmp_path):
+    config = Config(
+        notification_type='discord',
+        discord_webhook=standin.webhook_url,
+        slack_webhook=None,
+        check_interval=60,
+        state_file=tmp_path / "state.json"
+    )
+    return StatusMonitor(config, feeds=standin.feed_configs())
+
+
+class TestStandin:
+    """Tests running StatusMonitor end to end"""
+
+    def test_resolved_history_does_not_notify(self, standin, monitor):
+        """Test that a first cycle over resolved history sends nothing"""
+        monitor.run_check_cycle()
+
+        assert standin.stats()['deliveries'] == 0
+        assert len(monitor.state_manager.get_state()) == 5
+
+    def test_new_incidents_are_delivered(self, standin, monitor):
+        """Test that churned incidents reach the webhook sink"""
+        monitor.run_check_cycle()
+        assert standin.churn_once() == 5
+
+        monitor.run_check_cycle()
+
+        stats = standin.stats()
+        assert stats['deliveries'] == 5
+        assert len(stats['latencies']) == 5
+
+    def test_unchanged_feeds_use_etag(self, standin, monitor):
+        """Test that unchanged feeds are answered with 304"""
+        monitor.run_check_cycle()
+        monitor.run_check_cycle()
+
+        assert standin.stats()['not_modified'] == 5
@@ -85,3 +85,18 @@ class TestStateManager:
 
         assert state_file.exists()
         assert state_file.parent.exists()
+
+    def test_validators_persist(self, tmp_path):
+        """Test that conditional GET validators survive a save/load round trip"""
+        state_file = tmp_path / "state.json"
+        manager = StateManager(state_file)
+
+        manager.update_service("service1", "id_1", "First")
+        manager.set_validators("service1", '"v1"', "Sat, 25 Oct 2025 14:03:00 GMT")
+        manager.update_service("service1", "id_2", "Second")
+        manager.save()
+
+        reloaded = StateManager(state_file)
+        reloaded.load()
+        assert reloaded.get_validators("service1") == ('"v1"', "Sat, 25 Oct 2025 14:03:00 GMT")
+        assert reloaded.get_validators("unknown") == (None, None)
@@ -0,0 +1,122 @@
+"""
+Test suite for the read-only status API
+"""
+
+import json
+import socket
+import urllib.request
+
+import pytest
+from unittest.mock import MagicMock
+from llm_monitor.config import Config, FeedConfig
+from llm_monitor.feed_parser import FetchResult
+from llm_monitor.monitor import StatusMonitor
+from llm_monitor.status_api import StatusAPI
+from tests.test_monitor import make_rss
+
+FEED_URL = "https://status.example.com/history.rss"
+
+
+@pytest.fixture
+def monitor(tmp_path):
+    config = Config(
+        notification_type='discord',
+        discord_webhook=None,
+        slack_webhook=None,
+        check_interval=60,
+        state_file=tmp_path / "state.json"
+    )
+    monitor = StatusMonitor(
+        config, feeds={'example': FeedConfig(name="Example", url=FEED_URL, color=0)}
+    )
+    monitor.parser.fetch_feed = MagicMock()
+    return monitor
+
+
+def get_json(handler):
+    status, content_type, body = handler()
+    assert content_type.startswith('application/json')
+    return status, json.loads(body)
+
+
+class TestStatusAPI:
+    """Tests for /status, /incidents and /healthz"""
+
+    def test_active_incident_listed(self, monitor):
+        """Test an active incident shows up in /status and /incidents"""
+        api = StatusAPI(monitor)
+        monitor.parser.fetch_feed.return_value = FetchResult(200, make_rss())
+        monitor.run_check_cycle()
+
+        _, status = get_json(api.status)
+        service = status['services']['example']
+        assert service['active_incident'] is True
+        assert service['last_title'] == "Elevated errors on API"
+        assert service['last_success'] is not None
+        assert status['last_cycle'] is not None
+
+        _, incidents = get_json(api.incidents)
+        assert [i['service'] for i in incidents['incidents']] == ['example']
+        assert incidents['incidents'][0]['link'].endswith('/incidents/abc123')
+
+    def test_resolved_entry_clears_incident(self, monitor):
+        """Test resolving the open incident removes it from /incidents"""
+        api = StatusAPI(monitor)
+        monitor.parser.fetch_feed.return_value = FetchResult(200, make_rss())
+        monitor.run_check_cycle()
+        _, incidents = get_json(api.incidents)
+        assert incidents['incidents'][0]['stage'] == 'investigating'
+
+        monitor.parser.fetch_feed.return_value = FetchResult(
+            200, make_rss(title="Resolved", description="This incident has been resolved.")
+        )
+        monitor.run_check_cycle()
+
+        _, incidents = get_json(api.incidents)
+        assert incidents['incidents'] == []
+        _, status = get_json(api.status)
+        assert status['services']['example']['degraded'] is False
+
+    def test_snapshot_cached_until_state_changes(self, monitor):
+        """Test responses are reused until the state version moves"""
+        api = StatusAPI(monitor)
+        first = api.incidents()[2]
+        assert api.incidents()[2] is first
+
+        monitor.state_manager.set_incident('example', 'x', {'title': 'Outage', 'stage': 'identified'})
+        assert api.incidents()[2] is not first
+
+    def test_healthz(self, monitor):
+        """Test liveness turns unhealthy when cycles go stale or on shutdown"""
+        api = StatusAPI(monitor)
+        assert api.healthz()[0] == 200
+
+        api.started_at -= 3600
+        status, body = get_json(api.healthz)
+        assert status == 503
+        assert body['status'] == 'stale'
+
+        monitor.parser.fetch_feed.return_value = FetchResult(304, b'')
+        monitor.run_check_cycle()
+        assert api.healthz()[0] == 200
+
+        monitor.request_stop()
+        assert get_json(api.healthz)[1]['status'] == 'stopping'
+
+    def test_served_over_http(self, monitor):
+        """Test the monitor registers the status routes next to /metrics"""
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            port = sock.getsockname()[1]
+        monitor.config.http_host = '127.0.0.1'
+        monitor.config.http_port = port
+
+        monitor.start_http_server()
+        try:
+            base = f"http://127.0.0.1:{port}"
+            with urllib.request.urlopen(base + '/status', timeout=5) as response:
+                assert 'example' in json.loads(response.read())['services']
+            with urllib.request.urlopen(base + '/healthz', timeout=5) as response:
+                assert response.status == 200
+        finally:
+            monitor.stop_http_server()
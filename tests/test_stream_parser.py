@@ -0,0 +1,94 @@
+"""
+Test suite for streaming entry extraction
+"""
+
+import dataclasses
+import sys
+
+import pytest
+from llm_monitor.feed_parser import MAX_DESCRIPTION_LENGTH, FeedEntry, FeedParser
+from llm_monitor.stream_parser import extract_entries, iter_entries
+from benchmarks.synthetic import generate_feed
+
+ATOM = b"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>Example Status</title>
+  <entry>
+    <id>tag:status.example.com,2024:incident/2</id>
+    <title>Partial outage</title>
+    <link rel="alternate" href="https://status.example.com/incidents/2"/>
+    <summary>&lt;p&gt;Investigating&lt;/p&gt;</summary>
+    <updated>2024-01-02T10:00:00Z</updated>
+  </entry>
+  <entry>
+    <id>tag:status.example.com,2024:incident/1</id>
+    <title>Resolved</title>
+  </entry>
+</feed>
+"""
+
+
+class TestExtractEntries:
+    """Tests for stream_parser.extract_entries"""
+
+    def test_matches_feedparser(self):
+        """Test streaming extraction yields the same entries as feedparser"""
+        document = generate_feed(50)
+        expected = FeedParser.extract_entries(FeedParser.parse_content(document), 50)
+
+        assert extract_entries(document, 50) == expected
+
+    def test_stops_at_last_seen(self):
+        """Test extraction ends before the last processed entry"""
+        document = generate_feed(50)
+        ids = [entry.entry_id for entry in iter_entries(document)]
+
+        entries = extract_entries(document, 10, stop_id=ids[3])
+
+        assert [entry.entry_id for entry in entries] == ids[:3]
+        assert extract_entries(document, 10, stop_id=ids[0]) == []
+
+    def test_respects_limit(self):
+        """Test no more than `limit` entries are returned"""
+        assert len(extract_entries(generate_feed(50), 2)) == 2
+        assert len(list(iter_entries(generate_feed(50), max_entries=5))) == 5
+
+    def test_atom_feed(self):
+        """Test Atom ids, alternate links and summaries are read"""
+        entry = extract_entries(ATOM, 1)[0]
+
+        assert entry.entry_id == "tag:status.example.com,2024:incident/2"
+        assert entry.link == "https://status.example.com/incidents/2"
+        assert entry.description == "Investigating"
+        assert entry.published == "2024-01-02T10:00:00Z"
+
+    @pytest.mark.parametrize("document", [
+        b"<rss><channel><item><guid>1</guid>",
+        b"<html><body>maintenance</body></html>",
+        b"not a feed",
+    ])
+    def test_falls_back(self, document):
+        """Test malformed or entry-less documents return None for feedparser to handle"""
+        assert extract_entries(document, 1) is None
+
+
+class TestFeedEntry:
+    """Tests for the compact FeedEntry representation"""
+
+    def test_immutable_and_slotted(self):
+        """Test entries have no per-instance __dict__ and cannot be modified"""
+        entry = extract_entries(generate_feed(3), 1)[0]
+
+        assert not hasattr(entry, '__dict__')
+        with pytest.raises(AttributeError):
+            entry.title = "changed"
+        assert entry._replace(title="changed").title == "changed"
+
+    def test_compact_interns_and_truncates(self):
+        """Test IDs are interned and descriptions capped to what notifiers send"""
+        entry_id = "".join(["https://status.example.com/incidents/", "abc"])
+        entry = FeedEntry.compact(entry_id, "Title", "x" * 5000, "https://example.com")
+
+        assert entry.entry_id is sys.intern("https://status.example.com/incidents/abc")
+        assert len(entry.description) == MAX_DESCRIPTION_LENGTH
+        assert not dataclasses.is_dataclass(entry)
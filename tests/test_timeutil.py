@@ -0,0 +1,50 @@
+"""
+Test suite for feed timestamp parsing
+"""
+
+import pytest
+from llm_monitor.feed_parser import FeedEntry
+from llm_monitor.timeutil import parse_timestamp
+
+EPOCH = 1761397380  # 2025-10-25 13:03:00 UTC
+
+
+class TestParseTimestamp:
+    """Tests for parse_timestamp"""
+
+    @pytest.mark.parametrize("value", [
+        "Sat, 25 Oct 2025 13:03:00 +0000",
+        "Sat, 25 Oct 2025 13:03:00 GMT",
+        "25 Oct 2025 15:03:00 +0200",
+        "Sat, 25 Oct 2025 08:03 -0500",
+        "2025-10-25T13:03:00Z",
+        "2025-10-25T14:03:00+01:00",
+        "2025-10-25T13:03:00",
+    ])
+    def test_formats(self, value):
+        """Test RSS and Atom dates are read as UTC epoch seconds"""
+        assert parse_timestamp(value) == EPOCH
+
+    def test_named_zone(self):
+        """Test named zones the fast path skips still parse"""
+        assert parse_timestamp("Sat, 25 Oct 2025 06:03:00 PDT") == EPOCH
+
+    @pytest.mark.parametrize("value", [None, "", "yesterday", "Sat, 25 Foo 2025 13:03:00 +0000"])
+    def test_unreadable(self, value):
+        """Test unreadable dates give None"""
+        assert parse_timestamp(value) is None
+
+    def test_cached(self):
+        """Test a date seen before is not parsed again"""
+        parse_timestamp.cache_clear()
+        for _ in range(3):
+            parse_timestamp("Sat, 25 Oct 2025 13:03:00 +0000")
+
+        assert parse_timestamp.cache_info().hits == 2
+
+    def test_entry_parsed_once(self):
+        """Test entries carry the parsed publish date"""
+        entry = FeedEntry.compact("a", "Title", "", "https://x", "Sat, 25 Oct 2025 13:03:00 +0000")
+
+        assert entry.published_at == EPOCH
+        assert FeedEntry.compact("b", "Title", "", "https://x").published_at is None
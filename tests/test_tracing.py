@@ -0,0 +1,91 @@
+"""
+Test suite for tracing spans and exporters
+"""
+
+import json
+import pytest
+from llm_monitor.tracing import (
+    Tracer, SpanHook, FileSpanExporter, STATUS_ERROR, _NOOP_SPAN
+)
+
+
+class RecordingHook(SpanHook):
+    """Hook that keeps finished spans in memory"""
+
+    def __init__(self):
+        self.started = []
+        self.ended = []
+
+    def on_start(self, span):
+        self.started.append(span.name)
+
+    def on_end(self, span):
+        self.ended.append(span)
+
+
+class TestTracer:
+    """Tests for the Tracer class"""
+
+    def test_disabled_returns_noop(self):
+        """Test that spans are no-ops without hooks"""
+        tracer = Tracer()
+        assert tracer.enabled is False
+        assert tracer.span('fetch', 'claude') is _NOOP_SPAN
+
+        with tracer.span('fetch', 'claude') as span:
+            span.set_attribute('status', 200)
+
+    def test_nested_spans(self):
+        """Test that child spans share the trace and point at their parent"""
+        tracer = Tracer()
+        hook = RecordingHook()
+        tracer.add_hook(hook)
+
+        with tracer.span('check_feed', 'claude') as root:
+            with tracer.span('fetch', 'claude') as child:
+                pass
+
+        assert hook.started == ['check_feed', 'fetch']
+        assert [s.name for s in hook.ended] == ['fetch', 'check_feed']
+        assert child.trace_id == root.trace_id
+        assert child.parent_id == root.span_id
+        assert root.parent_id is None
+        assert child.attributes == {'service_id': 'claude'}
+        assert child.end_ns >= child.start_ns
+
+    def test_exception_marks_error(self):
+        """Test that an exception inside a span sets error status"""
+        tracer = Tracer()
+        hook = RecordingHook()
+        tracer.add_hook(hook)
+
+        with pytest.raises(RuntimeError):
+            with tracer.span('parse', 'claude'):
+                raise RuntimeError("boom")
+
+        assert hook.ended[0].status == STATUS_ERROR
+        assert 'boom' in hook.ended[0].status_message
+
+
+class TestFileSpanExporter:
+    """Tests for the OTLP/JSON file exporter"""
+
+    def test_writes_one_line_per_trace(self, tmp_path):
+        """Test that a finished trace is written as one OTLP/JSON line"""
+        trace_file = tmp_path / "traces" / "spans.jsonl"
+        tracer = Tracer()
+        tracer.add_hook(FileSpanExporter(trace_file))
+
+        with tracer.span('check_feed', 'claude'):
+            with tracer.span('fetch', 'claude', status=304):
+                pass
+        tracer.shutdown()
+
+        lines = trace_file.read_text().splitlines()
+        assert len(lines) == 1
+
+        spans = json.loads(lines[0])['resourceSpans'][0]['scopeSpans'][0]['spans']
+        assert [s['name'] for s in spans] == ['fetch', 'check_feed']
+        assert spans[0]['parentSpanId'] == spans[1]['spanId']
+        assert {'key': 'service_id', 'value': {'stringValue': 'claude'}} in spans[0]['attributes']
+        assert {'key': 'status', 'value': {'intValue': '304'}} in spans[0]['attributes']